@@ -10,6 +10,9 @@ Subpackages
 -----------
 sgn
     Basic creation and manipulation of signals.
+filters
+    Moving-window filters that can be applied to whole signals or to
+    streams of blocks.
 modulation
     Different methods for modulating and demodulating signals,
     particularly useful when using signals to transmit and receive
@@ -33,7 +36,7 @@ from chirper.test import manual_tests
 from chirper.test import unit_tests
 
 
-__all__ = ["sgn", "modulation", "transforms"]
+__all__ = ["sgn", "filters", "modulation", "transforms"]
 __version__ = version("chirper-py")
 
 BASE_DIRNAME = os.path.dirname(__file__)
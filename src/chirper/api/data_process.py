@@ -5,16 +5,39 @@ from chirper.sgn import Signal1
 if TYPE_CHECKING:
     from chirper.api import GuiInterface
     from chirper.api.chirp import Chirp
+    from chirper.filters.base import BlockFilter
 
 
 class DataProcess:
     def __init__(self, api: GuiInterface) -> None:
         self.api = api
+        self.prefilter = None
 
     def process(self, data, request: Chirp, **kwargs):
         return request.request_type.get_processed(self, data, **kwargs)
 
+    def set_prefilter(self, block_filter: BlockFilter = None):
+        """Sets the filter applied to every fetched block before it is
+        processed.
+
+        The filter keeps its state between blocks, so consecutive
+        blocks are filtered without discontinuities.
+
+        Parameters
+        ----------
+        block_filter : BlockFilter, optional
+            Filter to apply (e.g a `chirper.filters.SOSFilter`), by
+            default None, which removes the current one.
+        """
+        if block_filter is not None:
+            block_filter.reset()
+        self.prefilter = block_filter
+
     def process_spectrogram(self, data, **kwargs):
         samp_freq = self.api.samplerate
         values = data.mean(axis=1)
+        # The filter is linear, so filtering the mean of the channels is
+        # the same as filtering each one, and cheaper
+        if self.prefilter is not None:
+            values = self.prefilter.process(values)
         return Signal1.from_freq(values, samp_freq)
@@ -15,6 +15,15 @@ HERTZ = True
 CONVOLUTION_METHOD = "fft"
 CROSS_CORRELATION_METHOD = "fft"
 KERNEL_OOB = "zero"
+# Precision of the values of signals and transforms: None keeps the type
+# of the input, "single" uses float32/complex64 and "double" uses
+# float64/complex128. It is read at runtime, so it can be changed with
+# `chirper.config.DTYPE_POLICY = "single"`. Axes are always float64.
+DTYPE_POLICY = None
+LAZY_CHUNK_SIZE = 65536
+WINDOW_CACHE_SIZE = 128
+FIR_FFT_THRESHOLD = 64
+RESAMPLE_MAX_DENOMINATOR = 1000
 
 ########################################################################################################################
 # |||||||||||||||||||||||||||||||||||||||||||||||# TRANSFORMS #||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
@@ -23,11 +32,23 @@ KERNEL_OOB = "zero"
 F1_METHOD = "fft"
 F2_METHOD = "fft"
 H1_METHOD = "scipy"
-Z_METHOD = "dzt"
+HILBERT_TAPS = 255
+Z_METHOD = "czt"
+CZT_CACHE_SIZE = 32
+DWT_WAVELET = "db2"
+DWT_FRAME_LENGTH = 1024
+CWT_WAVELET = "morlet"
+CWT_FREQUENCIES = 64
+CWT_BATCH_SIZE = 16
+GOERTZEL_FRAME_LENGTH = 205
+SDFT_WINDOW_LENGTH = 256
 C1_METHOD = "ii"
 C2_METHOD = "ii"
 S1_METHOD = "ii"
 S2_METHOD = "ii"
+PSD_WINDOW = "hann"
+PSD_SEGMENT_LENGTH = 256
+PSD_BATCH_SIZE = 256
 
 ########################################################################################################################
 # |||||||||||||||||||||||||||||||||||||||||||||||# MODULATION #||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
@@ -37,3 +58,19 @@ AM_MODULATION = "dsbsc"
 PM_MODULATION = "trad"
 FM_MODULATION = "trad"
 SSB_UPPER = True
+CARRIER_CACHE_SIZE = 32
+AM_DEMODULATION = "dsbsc"
+PM_DEMODULATION = "trad"
+FM_DEMODULATION = "trad"
+DEMODULATION_TAPS = 255
+
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||||||# IO #||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+IO_BLOCK_SIZE = 65536
+WAV_DTYPE = "float32"
+CSV_PRECISION = 17
+ARCHIVE_CHUNK_SIZE = 65536
+ARCHIVE_COMPRESSION_LEVEL = 6
+ARCHIVE_MAX_UNUSED_RATIO = 1
@@ -0,0 +1,27 @@
+"""
+=======
+Filters
+=======
+
+This subpackage gives access to different filters used for signal
+processing purposes. The ones currently available are:
+- Moving average (rectangular smoothing)
+- Exponential smoothing
+- Moving median
+- Moving minimum and maximum
+- FIR
+- IIR (as second-order sections)
+- Polyphase resampling and decimation
+
+Each of them also has a streaming version, which filters a signal
+block by block. FIR and IIR filters can also be applied forwards and
+backwards (zero-phase).
+"""
+
+from chirper.filters.moving import (
+    rect_smooth, exponential_smooth, median_filter, min_filter, max_filter,
+    RunningMean, RunningExponential, RunningMedian, RunningMin, RunningMax,
+)
+from chirper.filters.fir import FIRFilter
+from chirper.filters.iir import SOSFilter
+from chirper.filters.resample import resample_poly, resample_rate, decimate, StreamResampler
@@ -0,0 +1,109 @@
+"""Module for the base class of the stateful block filters."""
+from __future__ import annotations
+import abc
+import numpy as np
+
+from chirper.utils import dispatching
+
+
+class BlockFilter(abc.ABC):
+    """Base class for linear filters that process a signal block by
+    block, keeping their internal state between blocks so the output
+    is the same as filtering the whole signal at once.
+
+    Blocks can be one dimensional arrays, two dimensional arrays with
+    one channel per column (like the ones read from a microphone), or
+    signals. Every channel is filtered at once, each with its own
+    state.
+    """
+
+    def __call__(self, block):
+        return self.process(block)
+
+    def process(self, block):
+        """Filters the next block of the signal.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the signal, with shape `(samples,)` or
+            `(samples, channels)`. The number of channels must be the
+            same for every block until `reset` is called.
+
+        Returns
+        -------
+        np.ndarray or Signal1
+            Filtered samples, with the same shape as the block.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        if len(values) == 0:
+            # Empty reads leave the state as it is
+            state = self.state
+            if state is None:
+                state = self._initial_state(values.shape[1:], np.result_type(values, float))
+            new_values = np.empty(values.shape, dtype=state.dtype)
+            return block._like(new_values) if is_signal else new_values
+        if self.state is None:
+            self.state = self._initial_state(values.shape[1:], np.result_type(values, float))
+        new_values, self.state = self._filter(values, self.state)
+        return block._like(new_values) if is_signal else new_values
+
+    def reset(self):
+        """Forgets the previous blocks."""
+        self.state = None
+
+    def apply(self, block):
+        """Filters a whole signal, without using or changing the state
+        of the stream.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Samples to filter, with shape `(samples,)` or
+            `(samples, channels)`.
+
+        Returns
+        -------
+        np.ndarray or Signal1
+            Filtered samples.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        state = self._initial_state(values.shape[1:], np.result_type(values, float))
+        new_values, _ = self._filter(values, state)
+        return block._like(new_values) if is_signal else new_values
+
+    def filtfilt(self, block):
+        """Filters a whole signal forwards and backwards, so the result
+        has no phase distortion (and the magnitude response squared).
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Samples to filter, with shape `(samples,)` or
+            `(samples, channels)`.
+
+        Returns
+        -------
+        np.ndarray or Signal1
+            Filtered samples.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        new_values = self._filtfilt(values)
+        return block._like(new_values) if is_signal else new_values
+
+    @abc.abstractmethod
+    def _initial_state(self, channels: tuple, dtype) -> np.ndarray:
+        pass
+
+    @abc.abstractmethod
+    def _filter(self, values: np.ndarray, state: np.ndarray):
+        # Filters the values along the first axis, returning them along
+        # with the final state
+        pass
+
+    @abc.abstractmethod
+    def _filtfilt(self, values: np.ndarray) -> np.ndarray:
+        pass
@@ -0,0 +1,72 @@
+"""Module for Finite Impulse Response (FIR) filters."""
+from __future__ import annotations
+import numpy as np
+from scipy import signal
+
+from chirper.config import FIR_FFT_THRESHOLD
+from chirper.filters.base import BlockFilter
+
+
+class FIRFilter(BlockFilter):
+    """FIR filter that keeps its state between blocks.
+
+    Short filters are applied directly. Filters with more than
+    `FIR_FFT_THRESHOLD` taps are applied with overlap-add FFT
+    convolution, where the state is the tail of the previous block
+    that still has to be added to the output.
+    """
+
+    def __init__(self, taps: np.ndarray):
+        """Creates a FIR filter.
+
+        Parameters
+        ----------
+        taps : np.ndarray
+            Coefficients of the filter (its impulse response).
+        """
+        self.taps = np.asarray(taps)
+        if self.taps.ndim != 1 or len(self.taps) == 0:
+            raise ValueError("The taps of the filter must be a non empty one dimensional array.")
+        self.state = None
+
+    @classmethod
+    def from_design(cls, numtaps: int, cutoff, samp_freq: float, pass_zero=True,
+                    window="hamming") -> FIRFilter:
+        """Designs a FIR filter with the window method.
+
+        Parameters
+        ----------
+        numtaps : int
+            Number of taps of the filter.
+        cutoff : float or array_like
+            Cutoff frequencies in hertz.
+        samp_freq : float
+            Sampling frequency of the signals to filter.
+        pass_zero : {True, False, "lowpass", "highpass", "bandpass", "bandstop"}, optional
+            Whether the zero frequency is in the passband, or the type
+            of the filter, by default True.
+        window : str, optional
+            Window used for the design, by default "hamming".
+
+        Returns
+        -------
+        FIRFilter
+            Designed filter.
+        """
+        return cls(signal.firwin(numtaps, cutoff, window=window, pass_zero=pass_zero, fs=samp_freq))
+
+    def _initial_state(self, channels, dtype):
+        return np.zeros((len(self.taps) - 1, *channels), dtype=np.result_type(dtype, self.taps))
+
+    def _filter(self, values, state):
+        if len(self.taps) <= FIR_FFT_THRESHOLD:
+            return signal.lfilter(self.taps, [1], values, axis=0, zi=state)
+
+        # Overlap-add, where the state is the tail of the last block
+        taps = self.taps.reshape(-1, *(1,) * (values.ndim - 1))
+        full = signal.oaconvolve(values, taps, axes=0)
+        full[:len(state)] += state
+        return full[:len(values)], full[len(values):]
+
+    def _filtfilt(self, values):
+        return signal.filtfilt(self.taps, [1], values, axis=0)
@@ -0,0 +1,85 @@
+"""Module for Infinite Impulse Response (IIR) filters.
+
+The filters are stored as cascades of biquads (second-order sections),
+which, unlike a single transfer function, stay numerically stable for
+high orders.
+"""
+from __future__ import annotations
+import numpy as np
+from scipy import signal
+
+from chirper.filters.base import BlockFilter
+
+
+class SOSFilter(BlockFilter):
+    """IIR filter made of second-order sections, which keeps its state
+    between blocks."""
+
+    def __init__(self, sos: np.ndarray):
+        """Creates an IIR filter.
+
+        Parameters
+        ----------
+        sos : np.ndarray
+            Coefficients of the sections, with shape `(sections, 6)`,
+            where each row is `[b0, b1, b2, a0, a1, a2]`.
+        """
+        self.sos = np.atleast_2d(sos)
+        if self.sos.ndim != 2 or self.sos.shape[1] != 6:
+            raise ValueError("The sections of the filter must have shape (sections, 6).")
+        self.state = None
+
+    @classmethod
+    def from_design(cls, order: int, cutoff, samp_freq: float, btype="lowpass",
+                    ftype="butter", **kwargs) -> SOSFilter:
+        """Designs an IIR filter.
+
+        Parameters
+        ----------
+        order : int
+            Order of the filter.
+        cutoff : float or array_like
+            Cutoff frequencies in hertz (two of them for band filters).
+        samp_freq : float
+            Sampling frequency of the signals to filter.
+        btype : {"lowpass", "highpass", "bandpass", "bandstop"}, optional
+            Type of the filter, by default "lowpass".
+        ftype : {"butter", "cheby1", "cheby2", "ellip", "bessel"}, optional
+            Family of the filter, by default "butter".
+        **kwargs
+            Other parameters of the family, like the ripple `rp` or the
+            attenuation `rs` in decibels.
+
+        Returns
+        -------
+        SOSFilter
+            Designed filter.
+        """
+        return cls(signal.iirfilter(order, cutoff, btype=btype, ftype=ftype,
+                                    output="sos", fs=samp_freq, **kwargs))
+
+    @classmethod
+    def from_tf(cls, b: np.ndarray, a: np.ndarray) -> SOSFilter:
+        """Creates the filter from the coefficients of its transfer
+        function.
+
+        Parameters
+        ----------
+        b, a : np.ndarray
+            Coefficients of the numerator and the denominator.
+
+        Returns
+        -------
+        SOSFilter
+            Equivalent filter.
+        """
+        return cls(signal.tf2sos(b, a))
+
+    def _initial_state(self, channels, dtype):
+        return np.zeros((len(self.sos), 2, *channels), dtype=np.result_type(dtype, self.sos))
+
+    def _filter(self, values, state):
+        return signal.sosfilt(self.sos, values, axis=0, zi=state)
+
+    def _filtfilt(self, values):
+        return signal.sosfiltfilt(self.sos, values, axis=0)
@@ -0,0 +1,329 @@
+"""Module for moving-window filters.
+
+Every filter of this module runs in O(N) (or O(N log w) for the median)
+regardless of the size of the window. The functions work on whole
+signals with windows centered on each sample, which shrink
+symmetrically near the edges (e.g the first sample is left as it is,
+the second one is averaged with its two neighbours, and so on).
+
+The classes are their streaming counterparts, which process a signal
+block by block while keeping the state needed between blocks. As they
+can't look ahead, their windows end at each sample (so their output is
+delayed by half a window with respect to the functions).
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import abc
+import numpy as np
+from scipy import ndimage, signal
+
+from chirper.utils import dispatching, dtypes
+if TYPE_CHECKING:
+    from chirper.sgn import Signal1
+
+########################################################################################################################
+# ||||||||||||||||||||||||||||||||||||||||||||||||| Signals |||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def rect_smooth(signal1: Signal1, factor: int) -> Signal1:
+    """Applies a rectangular (moving average) smoothing to the signal.
+
+    The window sums are obtained from the cumulative sum of the values,
+    so each sample costs the same no matter the size of the window.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Signal to smooth.
+    factor : int (odd)
+        Size of the window.
+
+    Returns
+    -------
+    Signal1
+        Smooth signal.
+    """
+    shift = _half_width(factor)
+    values = signal1.values
+    indices = np.arange(len(values))
+    half_widths = _edge_half_widths(len(values), shift)
+
+    cumsum = np.zeros(len(values) + 1, dtype=np.result_type(values.dtype, np.float64))
+    np.cumsum(values, out=cumsum[1:])
+    sums = cumsum[indices + half_widths + 1] - cumsum[indices - half_widths]
+    new_values = (sums / (2 * half_widths + 1)).astype(_float_dtype(values), copy=False)
+    return signal1._like(new_values)
+
+
+def exponential_smooth(signal1: Signal1, alpha: float) -> Signal1:
+    """Applies an exponential smoothing to the signal, such that
+
+    .. math::
+        y[n] = \\alpha x[n] + (1 - \\alpha) y[n - 1]
+
+    starting from :math:`y[-1] = x[0]`.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Signal to smooth.
+    alpha : float
+        Smoothing factor, between 0 and 1. Smaller values smooth more.
+
+    Returns
+    -------
+    Signal1
+        Smooth signal.
+    """
+    values = signal1.values
+    if len(values) == 0:
+        return signal1._like(values.astype(_float_dtype(values)))
+    new_values, _ = _exponential(values, alpha, _exponential_state(values[0], alpha))
+    return signal1._like(new_values.astype(_float_dtype(values), copy=False))
+
+
+def median_filter(signal1: Signal1, factor: int) -> Signal1:
+    """Applies a moving median filter to the signal.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Signal to filter.
+    factor : int (odd)
+        Size of the window.
+
+    Returns
+    -------
+    Signal1
+        Filtered signal.
+    """
+    _half_width(factor)
+    values = signal1.values
+    new_values = ndimage.median_filter(values, size=factor, mode="nearest")
+    _fix_edges(new_values, values, factor, np.median)
+    return signal1._like(new_values)
+
+
+def min_filter(signal1: Signal1, factor: int) -> Signal1:
+    """Applies a moving minimum filter to the signal.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Signal to filter.
+    factor : int (odd)
+        Size of the window.
+
+    Returns
+    -------
+    Signal1
+        Filtered signal.
+    """
+    _half_width(factor)
+    new_values = ndimage.minimum_filter1d(signal1.values, factor, mode="nearest")
+    _fix_edges(new_values, signal1.values, factor, np.min)
+    return signal1._like(new_values)
+
+
+def max_filter(signal1: Signal1, factor: int) -> Signal1:
+    """Applies a moving maximum filter to the signal.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Signal to filter.
+    factor : int (odd)
+        Size of the window.
+
+    Returns
+    -------
+    Signal1
+        Filtered signal.
+    """
+    _half_width(factor)
+    new_values = ndimage.maximum_filter1d(signal1.values, factor, mode="nearest")
+    _fix_edges(new_values, signal1.values, factor, np.max)
+    return signal1._like(new_values)
+
+
+def _fix_edges(new_values, values, factor, reduction):
+    # The windows near the edges shrink, so they are calculated apart.
+    # There are at most `factor - 1` of them, whatever the length
+    half_widths = _edge_half_widths(len(values), (factor - 1) // 2)
+    for n in np.flatnonzero(half_widths < (factor - 1) // 2):
+        new_values[n] = reduction(values[n - half_widths[n]:n + half_widths[n] + 1])
+
+
+def _half_width(factor: int) -> int:
+    if factor % 2 != 1 or factor <= 1:
+        raise ValueError("The smoothing factor must be an odd number.")
+    return (factor - 1) // 2
+
+
+def _edge_half_widths(length: int, shift: int) -> np.ndarray:
+    # Half width of the window of each sample, shrunk near the edges
+    indices = np.arange(length)
+    return np.minimum(np.minimum(indices, length - 1 - indices), shift)
+
+
+def _float_dtype(values: np.ndarray) -> np.dtype:
+    if values.dtype.kind == "c":
+        return dtypes.complex_dtype(values.dtype)
+    return dtypes.real_dtype(values.dtype)
+
+
+def _exponential(values, alpha, state):
+    return signal.lfilter([alpha], [1, alpha - 1], values, zi=state)
+
+
+def _exponential_state(first_value, alpha):
+    # Initial state of the filter such that y[-1] = first_value
+    return np.array([(1 - alpha) * first_value])
+
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||| Streaming ||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+class RunningFilter(abc.ABC):
+    """Base class for the streaming moving-window filters.
+
+    Each block is joined with the last `factor - 1` samples of the
+    previous one, so the windows span the boundaries between blocks.
+    Before the first block, the history is filled with its first
+    sample.
+
+    Blocks can be arrays or signals. Signals are returned with their
+    axis and the filtered values.
+    """
+
+    def __init__(self, factor: int):
+        """Creates a streaming filter.
+
+        Parameters
+        ----------
+        factor : int (odd)
+            Size of the window.
+        """
+        self.factor = factor
+        self.shift = _half_width(factor)
+        self.history = None
+
+    def __call__(self, block):
+        return self.process(block)
+
+    def process(self, block):
+        """Filters the next block of the signal.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the signal.
+
+        Returns
+        -------
+        np.ndarray or Signal1
+            Filtered samples, as many as the ones given.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        if len(values) == 0:
+            return block
+        if self.history is None:
+            self.history = np.full(self.factor - 1, values[0], dtype=values.dtype)
+
+        extended = np.concatenate((self.history, values))
+        new_values = self._apply(extended)
+        self.history = extended[len(extended) - self.factor + 1:]
+        return block._like(new_values) if is_signal else new_values
+
+    def reset(self):
+        """Forgets the previous blocks."""
+        self.history = None
+
+    @abc.abstractmethod
+    def _apply(self, extended: np.ndarray) -> np.ndarray:
+        # Gets the result of every window that ends within the block
+        pass
+
+
+class RunningMean(RunningFilter):
+    """Streaming version of `rect_smooth`."""
+
+    def _apply(self, extended):
+        cumsum = np.zeros(len(extended) + 1, dtype=np.result_type(extended.dtype, np.float64))
+        np.cumsum(extended, out=cumsum[1:])
+        sums = cumsum[self.factor:] - cumsum[:-self.factor]
+        return (sums / self.factor).astype(_float_dtype(extended), copy=False)
+
+
+class RunningMedian(RunningFilter):
+    """Streaming version of `median_filter`."""
+
+    def _apply(self, extended):
+        filtered = ndimage.median_filter(extended, size=self.factor, mode="nearest")
+        return filtered[self.shift:len(extended) - self.shift]
+
+
+class RunningMin(RunningFilter):
+    """Streaming version of `min_filter`."""
+
+    def _apply(self, extended):
+        filtered = ndimage.minimum_filter1d(extended, self.factor, mode="nearest")
+        return filtered[self.shift:len(extended) - self.shift]
+
+
+class RunningMax(RunningFilter):
+    """Streaming version of `max_filter`."""
+
+    def _apply(self, extended):
+        filtered = ndimage.maximum_filter1d(extended, self.factor, mode="nearest")
+        return filtered[self.shift:len(extended) - self.shift]
+
+
+class RunningExponential:
+    """Streaming version of `exponential_smooth`, which keeps the state
+    of the filter between blocks."""
+
+    def __init__(self, alpha: float):
+        """Creates a streaming exponential smoother.
+
+        Parameters
+        ----------
+        alpha : float
+            Smoothing factor, between 0 and 1. Smaller values smooth
+            more.
+        """
+        self.alpha = alpha
+        self.state = None
+
+    def __call__(self, block):
+        return self.process(block)
+
+    def process(self, block):
+        """Smooths the next block of the signal.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the signal.
+
+        Returns
+        -------
+        np.ndarray or Signal1
+            Smooth samples, as many as the ones given.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        if len(values) == 0:
+            return block
+        if self.state is None:
+            self.state = _exponential_state(values[0], self.alpha)
+        new_values, self.state = _exponential(values, self.alpha, self.state)
+        new_values = new_values.astype(_float_dtype(values), copy=False)
+        return block._like(new_values) if is_signal else new_values
+
+    def reset(self):
+        """Forgets the previous blocks."""
+        self.state = None
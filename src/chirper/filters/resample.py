@@ -0,0 +1,244 @@
+"""Module for changing the sampling rate of signals.
+
+Rational ratios `up / down` are resampled with polyphase filters, which
+only calculate the output samples that are kept (instead of
+upsampling, filtering and then discarding most of the samples). The
+results keep a uniform axis that starts where the original one does.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from fractions import Fraction
+import numpy as np
+from scipy import signal
+
+from chirper.config import RESAMPLE_MAX_DENOMINATOR
+from chirper.utils import dispatching, math_lib
+if TYPE_CHECKING:
+    from chirper.sgn import Signal1
+
+########################################################################################################################
+# ||||||||||||||||||||||||||||||||||||||||||||||||| Signals |||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def resample_poly(signal1: Signal1, up: int, down: int, window=("kaiser", 5.0)) -> Signal1:
+    """Resamples a signal by the rational factor `up / down`.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Uniformly sampled signal.
+    up : int
+        Upsampling factor.
+    down : int
+        Downsampling factor.
+    window : str or tuple, optional
+        Window used to design the anti-aliasing filter, by default
+        ("kaiser", 5.0).
+
+    Returns
+    -------
+    Signal1
+        Resampled signal.
+
+    Raises
+    ------
+    ValueError
+        If the signal is not uniformly sampled.
+    """
+    step = _step(signal1)
+    values = signal.resample_poly(signal1.values, up, down, window=window)
+    return _with_step(signal1, values, step * down / up)
+
+
+def resample_rate(signal1: Signal1, samp_freq: float, window=("kaiser", 5.0)) -> Signal1:
+    """Resamples a signal to the given sampling frequency.
+
+    The ratio between the frequencies is approximated by a fraction
+    whose denominator is at most `RESAMPLE_MAX_DENOMINATOR` (e.g
+    44.1 kHz to 48 kHz is exactly 160 / 147).
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Uniformly sampled signal.
+    samp_freq : float
+        New sampling frequency.
+    window : str or tuple, optional
+        Window used to design the anti-aliasing filter, by default
+        ("kaiser", 5.0).
+
+    Returns
+    -------
+    Signal1
+        Resampled signal.
+    """
+    up, down = rational_ratio(samp_freq * _step(signal1))
+    return resample_poly(signal1, up, down, window)
+
+
+def decimate(signal1: Signal1, factor: int, ftype="iir", zero_phase=True) -> Signal1:
+    """Downsamples a signal by an integer factor, after applying an
+    anti-aliasing filter.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Uniformly sampled signal.
+    factor : int
+        Downsampling factor.
+    ftype : {"iir", "fir"}, optional
+        Type of the anti-aliasing filter, by default "iir", which is an
+        order 8 Chebyshev type I filter.
+    zero_phase : bool, optional
+        Whether to apply the filter forwards and backwards, so the
+        result isn't delayed, by default True.
+
+    Returns
+    -------
+    Signal1
+        Decimated signal.
+    """
+    step = _step(signal1)
+    values = signal.decimate(signal1.values, factor, ftype=ftype, zero_phase=zero_phase)
+    return _with_step(signal1, values, step * factor)
+
+
+def rational_ratio(ratio: float, max_denominator=RESAMPLE_MAX_DENOMINATOR):
+    """Approximates a resampling ratio by a fraction `up / down`.
+
+    Parameters
+    ----------
+    ratio : float
+        Ratio between the new and the old sampling frequency.
+    max_denominator : int, optional
+        Largest `down` allowed, by default RESAMPLE_MAX_DENOMINATOR.
+
+    Returns
+    -------
+    int, int
+        Upsampling and downsampling factors.
+    """
+    fraction = Fraction(ratio).limit_denominator(max_denominator)
+    if fraction <= 0:
+        raise ValueError("The resampling ratio must be positive.")
+    return fraction.numerator, fraction.denominator
+
+
+def _step(signal1: Signal1) -> float:
+    step = math_lib.uniform_step(signal1.axis)
+    if step is None:
+        raise ValueError("Only uniformly sampled signals can be resampled.")
+    return step
+
+
+def _with_step(signal1: Signal1, values: np.ndarray, step: float) -> Signal1:
+    axis = signal1.axis[0] + np.arange(len(values)) * step
+    return type(signal1)(axis, values, copy=False)
+
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||| Streaming ||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+class StreamResampler:
+    """Polyphase resampler by `up / down` for a signal given block by
+    block.
+
+    The last input samples are kept between blocks, so the output is
+    the same as resampling the whole signal at once with a causal
+    filter. Unlike `resample_poly`, the output is therefore delayed by
+    half the length of the filter, that is `delay` input samples.
+
+    Every output sample that only depends on the samples given so far
+    is returned, so blocks of the same length may give outputs whose
+    lengths differ by one.
+    """
+
+    def __init__(self, up: int, down: int, taps: np.ndarray = None):
+        """Creates a streaming resampler.
+
+        Parameters
+        ----------
+        up : int
+            Upsampling factor.
+        down : int
+            Downsampling factor.
+        taps : np.ndarray, optional
+            Anti-aliasing filter, applied at `up` times the input rate.
+            By default the one used by `resample_poly`.
+        """
+        divisor = np.gcd(up, down)
+        self.up, self.down = up // divisor, down // divisor
+        if taps is None and self.up == self.down:
+            taps = np.ones(1)
+        elif taps is None:
+            max_rate = max(self.up, self.down)
+            taps = signal.firwin(20 * max_rate + 1, 1 / max_rate, window=("kaiser", 5.0)) * self.up
+        taps = np.asarray(taps)
+        self.delay = (len(taps) - 1) / (2 * self.up)
+
+        # Row `p` has the taps applied to the inputs of the outputs at
+        # phase `p` of the upsampled grid, reversed to match the order
+        # of the inputs
+        self.length = -(-len(taps) // self.up)
+        padded = np.zeros(self.length * self.up, dtype=taps.dtype)
+        padded[:len(taps)] = taps
+        self.phases = padded.reshape(self.length, self.up).T[:, ::-1].copy()
+        self.reset()
+
+    @classmethod
+    def from_rates(cls, samp_freq: float, new_samp_freq: float) -> StreamResampler:
+        """Creates a streaming resampler between two sampling
+        frequencies (see `rational_ratio`)."""
+        return cls(*rational_ratio(new_samp_freq / samp_freq))
+
+    def reset(self):
+        """Forgets the previous blocks."""
+        self.history = None
+        self.inputs = 0
+        self.outputs = 0
+        self.start = None
+
+    def __call__(self, block):
+        return self.process(block)
+
+    def process(self, block):
+        """Resamples the next block of the signal.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the signal.
+
+        Returns
+        -------
+        np.ndarray or Signal1
+            New output samples. Signals get an axis that continues the
+            one of the previous outputs.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        if self.history is None:
+            self.history = np.zeros(self.length - 1, dtype=values.dtype)
+        extended = np.concatenate((self.history, values))
+
+        # Outputs whose last input (at `m * down / up`) is available
+        total = self.inputs + len(values)
+        outputs = np.arange(self.outputs, -(-total * self.up // self.down))
+        last_inputs = outputs * self.down // self.up
+        phases = outputs * self.down % self.up
+
+        frames = np.lib.stride_tricks.sliding_window_view(extended, self.length)
+        new_values = np.einsum("ij,ij->i", frames[last_inputs - self.inputs], self.phases[phases])
+
+        self.history = extended[len(extended) - self.length + 1:]
+        self.inputs = total
+        self.outputs += len(outputs)
+        if not is_signal:
+            return new_values
+
+        if self.start is None:
+            self.start, self.step = block.axis[0], _step(block)
+        axis = self.start + outputs * (self.step * self.down / self.up)
+        return type(block)(axis, new_values, copy=False)
@@ -8,8 +8,18 @@ Currently implemented are:
 - AM
 - FM
 - PM
+
+FM can also be modulated block by block with `FMModulator`, which
+keeps the phase of the carrier between blocks.
+
+Every modulation has its demodulation, both for whole signals and for
+signals given block by block (`AMDemodulator`, `PMDemodulator` and
+`FMDemodulator`).
+
+The carriers and the element-wise operations they share are in
+`chirper.modulation.kernels`.
 """
 
-from chirper.modulation.am import am_modulation
-from chirper.modulation.fm import fm_modulation
-from chirper.modulation.pm import pm_modulation
+from chirper.modulation.am import AMDemodulator, am_demodulation, am_modulation
+from chirper.modulation.fm import FMDemodulator, FMModulator, fm_demodulation, fm_modulation
+from chirper.modulation.pm import PMDemodulator, pm_demodulation, pm_modulation
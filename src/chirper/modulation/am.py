@@ -1,7 +1,10 @@
+import numpy as np
+
 from chirper.sgn import Signal1
-from chirper.sgn.defaults import COS, SIN
-from chirper.config import AM_MODULATION, HERTZ, SSB_UPPER
-from chirper.transforms import hilbert
+from chirper.config import AM_DEMODULATION, AM_MODULATION, HERTZ, SSB_UPPER
+from chirper.modulation import kernels
+from chirper.modulation.demodulator import BlockDemodulator
+from chirper.utils import dtypes
 
 
 def am_modulation(signal1: Signal1, *args, method=AM_MODULATION, hertz=HERTZ, **kwargs) -> Signal1:
@@ -26,6 +29,13 @@ def am_modulation(signal1: Signal1, *args, method=AM_MODULATION, hertz=HERTZ, **
         Method used for the modulation, by default AM_MODULATION.
     hertz : bool, optional
         Whether the frequency is given in Hertz, by default HERTZ.
+    out : Signal1, optional
+        Signal with the same shape where the result is stored, by
+        default None, which creates a new one. It can be `signal1`
+        itself.
+    chunksize : int, optional
+        Number of samples modulated at a time, by default None, which
+        modulates all of them at once.
 
     Returns
     -------
@@ -35,33 +45,43 @@ def am_modulation(signal1: Signal1, *args, method=AM_MODULATION, hertz=HERTZ, **
     return AM_MODULATION_METHODS[method](signal1, *args, hertz, **kwargs)
 
 
-def _dsbfc_modulation(signal1: Signal1, carrier_freq, carrier_amp, hertz=HERTZ) -> Signal1:
-    copy = signal1.clone()
-    axis = copy.axis
-    carrier = COS(axis, carrier_freq, 1, hertz)
-    return (carrier_amp + copy) * carrier
+def _dsbfc_modulation(signal1: Signal1, carrier_freq, carrier_amp, hertz=HERTZ,
+                      out=None, chunksize=None) -> Signal1:
+    carrier = kernels.cos_carrier(signal1.axis, carrier_freq, hertz)
+    output = _output(signal1, out)
+    kernels.dsbfc(signal1.values, carrier, carrier_amp, output.values, chunksize)
+    return output
+
+
+def _dsbsc_modulation(signal1: Signal1, carrier_freq, carrier_amp, hertz=HERTZ,
+                      out=None, chunksize=None) -> Signal1:
+    carrier = kernels.cos_carrier(signal1.axis, carrier_freq, hertz)
+    output = _output(signal1, out)
+    kernels.dsbsc(signal1.values, carrier, carrier_amp, output.values, chunksize)
+    return output
 
 
-def _dsbsc_modulation(signal1: Signal1, carrier_freq, carrier_amp, hertz=HERTZ) -> Signal1:
-    copy = signal1.clone()
-    axis = copy.axis
-    carrier = COS(axis, carrier_freq, carrier_amp, hertz)
-    return carrier * copy
+def _ssb_modulation(signal1: Signal1, carrier_freq, hertz=HERTZ, upper=SSB_UPPER,
+                    out=None, chunksize=None) -> Signal1:
+    x_h = kernels.analytic(signal1.values).imag
+    carrier = kernels.phasor(signal1.axis, carrier_freq, hertz)
+    output = _output(signal1, out)
+    kernels.ssb(signal1.values, x_h, carrier, upper, output.values, chunksize)
+    return output
 
 
-def _ssb_modulation(signal1: Signal1, carrier_freq, hertz=HERTZ, upper=SSB_UPPER) -> Signal1:
-    x = signal1.clone()
-    axis = x.axis
-    x_h = hilbert.h1(x)
-    return x * COS(axis, carrier_freq, 1, hertz) + ((-1) ** int(upper)) * x_h * SIN(axis, carrier_freq, 1, hertz)
+def _usb_modulation(signal1: Signal1, carrier_freq, hertz=HERTZ, **kwargs) -> Signal1:
+    return _ssb_modulation(signal1, carrier_freq, hertz, True, **kwargs)
 
 
-def _usb_modulation(signal1: Signal1, carrier_freq, hertz=HERTZ) -> Signal1:
-    return _ssb_modulation(signal1, carrier_freq, hertz, True)
+def _lsb_modulation(signal1: Signal1, carrier_freq, hertz=HERTZ, **kwargs) -> Signal1:
+    return _ssb_modulation(signal1, carrier_freq, hertz, False, **kwargs)
 
 
-def _lsb_modulation(signal1: Signal1, carrier_freq, hertz=HERTZ) -> Signal1:
-    return _ssb_modulation(signal1, carrier_freq, hertz, False)
+def _output(signal1: Signal1, out=None) -> Signal1:
+    values = signal1.values
+    dtype = dtypes.complex_dtype(values.dtype) if np.iscomplexobj(values) else dtypes.real_dtype(values.dtype)
+    return signal1._out(out, dtype)
 
 
 AM_MODULATION_METHODS = {
@@ -71,3 +91,96 @@ AM_MODULATION_METHODS = {
     "usb": _usb_modulation,
     "lsb": _lsb_modulation,
 }
+
+
+def am_demodulation(signal1: Signal1, *args, method=AM_DEMODULATION, hertz=HERTZ, **kwargs) -> Signal1:
+    """Recovers the message of an AM modulated signal.
+
+    Every method of `am_modulation` has its inverse:
+     - DSBFC : Envelope detection, which doesn't need the phase of the
+        carrier.
+     - DSBSC : Coherent detection.
+     - SSB, USB, LSB : Coherent detection.
+
+    They all use the analytic signal of the received one, so the carrier
+    frequency must be higher than the bandwidth of the message.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        One dimensional signal to demodulate.
+    carrier_freq : float
+        Frequency of the carrier wave.
+    carrier_amp : float
+        Amplitude of the carrier wave. Only for DSBFC and DSBSC.
+    method : {"dsbfc", "dsbsc", "ssb", "usb", "lsb"}, optional
+        Method used for the modulation, by default AM_DEMODULATION.
+    hertz : bool, optional
+        Whether the frequency is given in Hertz, by default HERTZ.
+
+    Returns
+    -------
+    Signal1
+        Demodulated one dimensional signal.
+    """
+    return AM_DEMODULATION_METHODS[method](signal1, *args, hertz, **kwargs)
+
+
+def _envelope_demodulation(signal1: Signal1, carrier_freq, carrier_amp, hertz=HERTZ) -> Signal1:
+    envelope = np.abs(kernels.analytic(signal1.values))
+    return signal1._like(np.subtract(envelope, carrier_amp, out=envelope))
+
+
+def _coherent_demodulation(signal1: Signal1, carrier_freq, carrier_amp=1, hertz=HERTZ) -> Signal1:
+    # Single sidebands are demodulated like double ones, as the
+    # analytic signal only keeps the positive frequencies of both
+    carrier = kernels.phasor(signal1.axis, carrier_freq, hertz)
+    envelope = kernels.baseband(kernels.analytic(signal1.values), carrier)
+    return signal1._like(envelope.real / carrier_amp)
+
+
+def _ssb_demodulation(signal1: Signal1, carrier_freq, hertz=HERTZ, upper=SSB_UPPER) -> Signal1:
+    return _coherent_demodulation(signal1, carrier_freq, 1, hertz)
+
+
+AM_DEMODULATION_METHODS = {
+    "dsbfc": _envelope_demodulation,
+    "dsbsc": _coherent_demodulation,
+    "ssb": _ssb_demodulation,
+    "usb": _ssb_demodulation,
+    "lsb": _ssb_demodulation,
+}
+
+
+class AMDemodulator(BlockDemodulator):
+    """Stateful AM demodulator, for signals given block by block (see
+    `BlockDemodulator`)."""
+
+    def __init__(self, samp_freq: float, carrier_freq: float, carrier_amp=1,
+                 method=AM_DEMODULATION, **kwargs):
+        """Creates an AM demodulator.
+
+        Parameters
+        ----------
+        samp_freq : float
+            Sampling frequency of the received signal.
+        carrier_freq : float
+            Frequency of the carrier.
+        carrier_amp : float, optional
+            Amplitude of the carrier, by default 1. Only for DSBFC and
+            DSBSC.
+        method : {"dsbfc", "dsbsc", "ssb", "usb", "lsb"}, optional
+            Method used for the modulation, by default AM_DEMODULATION.
+        **kwargs
+            Parameters of `BlockDemodulator`.
+        """
+        if method not in AM_DEMODULATION_METHODS:
+            raise ValueError(f"Unknown AM method {method}.")
+        super().__init__(samp_freq, carrier_freq, **kwargs)
+        self.method = method
+        self.carrier_amp = carrier_amp if method in ("dsbfc", "dsbsc") else 1
+
+    def _demodulate(self, envelope):
+        if self.method == "dsbfc":
+            return np.abs(envelope) - self.carrier_amp
+        return envelope.real / self.carrier_amp
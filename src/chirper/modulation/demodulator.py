@@ -0,0 +1,98 @@
+"""Module for the base class of the stateful demodulators.
+
+A demodulator processes a received signal block by block, as it is
+read (e.g from a microphone). The analytic signal of each block is
+calculated with a streaming FIR Hilbert transformer (see
+`chirper.transforms.hilbert.StreamHilbert`), which keeps its state
+between blocks, so no samples are processed twice, and the carrier
+keeps its phase from one block to the next. The price is a delay of
+`delay` samples between the input and the demodulated message.
+"""
+from __future__ import annotations
+import abc
+import numpy as np
+
+from chirper.config import DEMODULATION_TAPS, HERTZ
+from chirper.modulation import kernels
+from chirper.transforms import hilbert
+from chirper.utils import dispatching
+
+
+class BlockDemodulator(abc.ABC):
+    """Base class for the stateful demodulators."""
+
+    def __init__(self, samp_freq: float, carrier_freq: float, hertz=HERTZ,
+                 numtaps=DEMODULATION_TAPS):
+        """Creates a demodulator.
+
+        Parameters
+        ----------
+        samp_freq : float
+            Sampling frequency of the received signal.
+        carrier_freq : float
+            Frequency of the carrier.
+        hertz : bool, optional
+            Whether the frequency is given in hertz, by default HERTZ.
+        numtaps : int (odd), optional
+            Number of taps of the filter that calculates the analytic
+            signal, by default DEMODULATION_TAPS. Longer filters are
+            more accurate at low frequencies, but have more delay.
+        """
+        self.samp_freq = samp_freq
+        self.carrier_freq = carrier_freq
+        self.hertz = hertz
+        self.analytic_filter = hilbert.StreamHilbert(numtaps)
+        self.delay = self.analytic_filter.delay
+        self.reset()
+
+    def __call__(self, block):
+        return self.process(block)
+
+    def reset(self):
+        """Forgets the previous blocks."""
+        self.analytic_filter.reset()
+        # Phase of the carrier at the next sample, which starts
+        # negative as the analytic signal is delayed
+        self.carrier_phase = -self.delay * self._phase_step()
+        self.started = False
+
+    def process(self, block):
+        """Demodulates the next block of the signal.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the received signal. The carrier is
+            assumed to have zero phase at the start of the axis of the
+            first signal, or at the first sample of the first array.
+
+        Returns
+        -------
+        np.ndarray or Signal1
+            Demodulated message, delayed by `delay` samples. Signals
+            keep the axis of the block.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        if is_signal and not self.started and len(values):
+            # The carrier is in phase with the axis of the signal
+            self.carrier_phase += self._phase_step() * self.samp_freq * block.axis[0]
+        self.started = True
+
+        analytic_values = self.analytic_filter.process(values)
+        phases = self.carrier_phase + self._phase_step() * np.arange(len(values))
+        # The phase is kept small, so it doesn't lose precision on long
+        # streams
+        self.carrier_phase = (self.carrier_phase + self._phase_step() * len(values)) % (2 * np.pi)
+        envelope = kernels.baseband(analytic_values, np.exp(1j * phases), out=analytic_values)
+        new_values = self._demodulate(envelope)
+        return block._like(new_values) if is_signal else new_values
+
+    def _phase_step(self) -> float:
+        ang_freq = 2 * np.pi * self.carrier_freq if self.hertz else self.carrier_freq
+        return ang_freq / self.samp_freq
+
+    @abc.abstractmethod
+    def _demodulate(self, envelope: np.ndarray) -> np.ndarray:
+        # Gets the message from the complex envelope of the block
+        pass
@@ -1,21 +1,213 @@
 import numpy as np
 
 from chirper.sgn import Signal1
-from chirper.config import HERTZ, FM_MODULATION
+from chirper.config import HERTZ, FM_DEMODULATION, FM_MODULATION
+from chirper.modulation import kernels
+from chirper.modulation.demodulator import BlockDemodulator
+from chirper.utils import dispatching
 
 
 def fm_modulation(signal1: Signal1, *args, method=FM_MODULATION, hertz=HERTZ, **kwargs) -> Signal1:
+    """Applies FM modulation to the given one dimensional signal.
+
+    The currently available methods for modulation are:
+     - Traditional : The phase of the carrier is
+        :math:`\\omega t + const \\int x(t) dt`, where the integral is a
+        running sum over the axis.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        One dimensional signal to modulate.
+    carrier_freq : float
+        Frequency of the carrier wave.
+    carrier_amp : float
+        Amplitude of the carrier wave.
+    const : float
+        Frequency deviation per unit of the message, in radians per
+        second.
+    method : {"trad"}, optional
+        Method used for the modulation, by default FM_MODULATION.
+    hertz : bool, optional
+        Whether the frequency is given in Hertz, by default HERTZ.
+
+    Returns
+    -------
+    Signal1
+        Modulated one dimensional signal.
+    """
     return FM_MODULATION_METHODS[method](signal1, *args, hertz, **kwargs)
 
 
 def _trad_modulation(signal1: Signal1, carrier_freq, carrier_amp, const, hertz=HERTZ) -> Signal1:
-    copy = signal1.clone()
-    axis = copy.axis
+    axis = signal1.axis
     freq = 2 * np.pi * carrier_freq if hertz else carrier_freq
-    values = carrier_amp * np.cos((freq + const * copy.values) * axis)
-    return Signal1(axis, values)
+    # Each sample adds its value over the step that leads to it, and the
+    # first one uses the step that follows it
+    steps = np.diff(axis, prepend=2 * axis[0] - axis[1]) if len(axis) > 1 else np.ones(len(axis))
+    phase = np.cumsum(np.multiply(signal1.values, steps, out=steps), out=steps)
+    phase *= const
+    phase += freq * axis
+    return signal1._like(np.multiply(np.cos(phase, out=phase), carrier_amp, out=phase))
 
 
 FM_MODULATION_METHODS = {
     "trad": _trad_modulation,
 }
+
+
+class FMModulator:
+    """Stateful FM modulator, for signals given block by block.
+
+    The phase of the carrier and the integral of the message are kept
+    between blocks, so modulating a long signal block by block gives the
+    same result as modulating it at once (see `fm_modulation`) with a
+    memory proportional to the length of a block.
+    """
+
+    def __init__(self, samp_freq: float, carrier_freq: float, carrier_amp: float, const: float,
+                 hertz=HERTZ):
+        """Creates an FM modulator.
+
+        Parameters
+        ----------
+        samp_freq : float
+            Sampling frequency of the message.
+        carrier_freq : float
+            Frequency of the carrier.
+        carrier_amp : float
+            Amplitude of the carrier.
+        const : float
+            Frequency deviation per unit of the message, in radians per
+            second.
+        hertz : bool, optional
+            Whether the frequency is given in hertz, by default HERTZ.
+        """
+        self.samp_freq = samp_freq
+        self.carrier_freq = carrier_freq
+        self.carrier_amp = carrier_amp
+        self.const = const
+        self.hertz = hertz
+        self.reset()
+
+    def __call__(self, block):
+        return self.process(block)
+
+    def reset(self):
+        """Forgets the previous blocks."""
+        # Phase of the carrier at the last sample, kept in [0, 2 pi)
+        self.phase = None
+
+    def process(self, block):
+        """Modulates the next block of the message.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the message. The carrier starts at the axis
+            of the first signal, or at zero for arrays.
+
+        Returns
+        -------
+        np.ndarray or Signal1
+            Modulated block.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        ang_freq = 2 * np.pi * self.carrier_freq if self.hertz else self.carrier_freq
+        if self.phase is None:
+            start = block.axis[0] if is_signal and len(values) else 0
+            self.phase = (ang_freq * (start - 1 / self.samp_freq)) % (2 * np.pi)
+
+        # Increments of the phase at each sample, accumulated in one pass
+        phase = np.multiply(values, self.const / self.samp_freq, dtype=float)
+        phase += ang_freq / self.samp_freq
+        phase[:1] += self.phase
+        np.cumsum(phase, out=phase)
+        if len(phase):
+            self.phase = phase[-1] % (2 * np.pi)
+        new_values = np.multiply(np.cos(phase, out=phase), self.carrier_amp, out=phase)
+        return block._like(new_values) if is_signal else new_values
+
+
+def fm_demodulation(signal1: Signal1, *args, method=FM_DEMODULATION, hertz=HERTZ, **kwargs) -> Signal1:
+    """Recovers the message of an FM modulated signal from its
+    instantaneous frequency.
+
+    The message is the derivative of the phase of the complex envelope
+    divided by `const`, so the carrier phase is assumed to be the
+    integral of :math:`\\omega + const \\cdot x(t)`.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        One dimensional signal to demodulate.
+    carrier_freq : float
+        Frequency of the carrier wave.
+    const : float
+        Frequency deviation per unit of the message, in radians per
+        second.
+    method : {"trad"}, optional
+        Method used for the modulation, by default FM_DEMODULATION.
+    hertz : bool, optional
+        Whether the frequency is given in Hertz, by default HERTZ.
+
+    Returns
+    -------
+    Signal1
+        Demodulated one dimensional signal.
+    """
+    return FM_DEMODULATION_METHODS[method](signal1, *args, hertz, **kwargs)
+
+
+def _trad_demodulation(signal1: Signal1, carrier_freq, const, hertz=HERTZ) -> Signal1:
+    carrier = kernels.phasor(signal1.axis, carrier_freq, hertz)
+    envelope = kernels.baseband(kernels.analytic(signal1.values), carrier)
+    # Backward differences, which invert the running sum of the phase
+    # exactly, repeating the first one at the start
+    ang_freq = np.empty(len(envelope))
+    ang_freq[1:] = np.angle(envelope[1:] * np.conjugate(envelope[:-1])) / np.diff(signal1.axis)
+    ang_freq[:1] = ang_freq[1:2] if len(envelope) > 1 else 0
+    return signal1._like(np.divide(ang_freq, const, out=ang_freq))
+
+
+FM_DEMODULATION_METHODS = {
+    "trad": _trad_demodulation,
+}
+
+
+class FMDemodulator(BlockDemodulator):
+    """Stateful FM demodulator, for signals given block by block (see
+    `BlockDemodulator`)."""
+
+    def __init__(self, samp_freq: float, carrier_freq: float, const: float, **kwargs):
+        """Creates an FM demodulator.
+
+        Parameters
+        ----------
+        samp_freq : float
+            Sampling frequency of the received signal.
+        carrier_freq : float
+            Frequency of the carrier.
+        const : float
+            Frequency deviation per unit of the message, in radians per
+            second.
+        **kwargs
+            Parameters of `BlockDemodulator`.
+        """
+        self.const = const
+        super().__init__(samp_freq, carrier_freq, **kwargs)
+
+    def reset(self):
+        super().reset()
+        self.last_envelope = None
+
+    def _demodulate(self, envelope):
+        # The phase difference between consecutive samples doesn't need
+        # unwrapping, and the first sample of the stream gives zero
+        previous = envelope[:1] if self.last_envelope is None else self.last_envelope
+        if len(envelope):
+            self.last_envelope = envelope[-1:].copy()
+        shifted = np.concatenate((previous, envelope[:-1]))
+        ang_freq = np.angle(envelope * np.conjugate(shifted))
+        return ang_freq * (self.samp_freq / self.const)
@@ -0,0 +1,226 @@
+"""Module for the kernels shared by the modulation methods.
+
+Carriers are calculated directly on the axis of the signal, instead of
+creating a signal and interpolating it, and are cached so modulating
+several signals with the same axis and carrier calculates it once. The
+kernels then combine the values with the carriers element-wise in a
+single pass, optionally in chunks (to keep the temporaries in cache)
+and into a given output array.
+"""
+from collections import OrderedDict
+import weakref
+import numpy as np
+
+from chirper.config import CARRIER_CACHE_SIZE, HERTZ
+from chirper.transforms import hilbert
+from chirper.utils import dtypes
+
+# Phasors of the last carriers used, from the least to the most recent
+_CARRIERS = OrderedDict()
+
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||| Carriers |||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def phasor(axis: np.ndarray, freq: float, hertz=HERTZ, phase=0) -> np.ndarray:
+    """Gets the complex carrier :math:`e^{j(\\omega t + \\phi)}` over an
+    axis, whose real and imaginary parts are the cosine and sine
+    carriers.
+
+    The result is cached by the identity of the axis, the frequency and
+    the phase. The cache holds a weak reference to the axis, so an entry
+    is only reused while the same array is alive and its endpoints are
+    unchanged, and it is removed when the axis is garbage collected.
+
+    Parameters
+    ----------
+    axis : np.ndarray
+        Axis of the signal.
+    freq : float
+        Frequency of the carrier.
+    hertz : bool, optional
+        Whether the frequency (and the phase) are given in hertz (and
+        cycles), or in radians, by default HERTZ.
+    phase : float, optional
+        Phase of the carrier, by default 0.
+
+    Returns
+    -------
+    np.ndarray
+        Read-only complex carrier.
+    """
+    axis = np.asarray(axis)
+    key = (id(axis), freq, phase, hertz)
+    fingerprint = (len(axis), axis[0], axis[-1]) if len(axis) else (0,)
+    entry = _CARRIERS.get(key)
+    if entry is not None:
+        reference, cached_fingerprint, values = entry
+        if reference() is axis and cached_fingerprint == fingerprint:
+            _CARRIERS.move_to_end(key)
+            return values
+
+    ang_freq = 2 * np.pi * freq if hertz else freq
+    ang_phase = 2 * np.pi * phase if hertz else phase
+    values = np.exp(1j * (ang_freq * axis + ang_phase))
+    values.flags.writeable = False
+    _CARRIERS[key] = (weakref.ref(axis), fingerprint, values)
+    weakref.finalize(axis, _CARRIERS.pop, key, None)
+    if len(_CARRIERS) > CARRIER_CACHE_SIZE:
+        _CARRIERS.popitem(last=False)
+    return values
+
+
+def cos_carrier(axis: np.ndarray, freq: float, hertz=HERTZ, phase=0) -> np.ndarray:
+    """Gets the cosine carrier over an axis. See `phasor` for the
+    parameters."""
+    return phasor(axis, freq, hertz, phase).real
+
+
+def sin_carrier(axis: np.ndarray, freq: float, hertz=HERTZ, phase=0) -> np.ndarray:
+    """Gets the sine carrier over an axis. See `phasor` for the
+    parameters."""
+    return phasor(axis, freq, hertz, phase).imag
+
+
+def clear_cache():
+    """Removes every cached carrier."""
+    _CARRIERS.clear()
+
+########################################################################################################################
+# ||||||||||||||||||||||||||||||||||||||||||||||||| Kernels |||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def dsbfc(values: np.ndarray, carrier: np.ndarray, carrier_amp: float, out=None,
+          chunksize=None) -> np.ndarray:
+    """Calculates `(carrier_amp + values) * carrier`.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Message.
+    carrier : np.ndarray
+        Carrier, with the same length as the message.
+    carrier_amp : float
+        Amplitude of the carrier.
+    out : np.ndarray, optional
+        Array where the result is stored, by default None, which
+        creates a new one. It can be `values` itself.
+    chunksize : int, optional
+        Number of samples calculated at a time, by default None, which
+        calculates all of them at once.
+
+    Returns
+    -------
+    np.ndarray
+        Modulated values.
+    """
+    def kernel(chunk, x, c):
+        np.add(x, carrier_amp, out=chunk)
+        np.multiply(chunk, c, out=chunk)
+
+    return _apply(kernel, out, chunksize, values, carrier)
+
+
+def dsbsc(values: np.ndarray, carrier: np.ndarray, carrier_amp: float, out=None,
+          chunksize=None) -> np.ndarray:
+    """Calculates `carrier_amp * values * carrier`. See `dsbfc` for the
+    parameters."""
+    def kernel(chunk, x, c):
+        np.multiply(x, c, out=chunk)
+        if carrier_amp != 1:
+            np.multiply(chunk, carrier_amp, out=chunk)
+
+    return _apply(kernel, out, chunksize, values, carrier)
+
+
+def ssb(values: np.ndarray, hilbert_values: np.ndarray, carrier: np.ndarray, upper=True,
+        out=None, chunksize=None) -> np.ndarray:
+    """Calculates `values * cos -+ hilbert_values * sin`, where `cos`
+    and `sin` are the parts of the complex carrier, keeping the upper
+    sideband with the minus sign and the lower one with the plus sign.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Message.
+    hilbert_values : np.ndarray
+        Hilbert transform of the message.
+    carrier : np.ndarray
+        Complex carrier (see `phasor`).
+    upper : bool, optional
+        Whether to keep the upper sideband, by default True.
+    out : np.ndarray, optional
+        Array where the result is stored, by default None, which
+        creates a new one.
+    chunksize : int, optional
+        Number of samples calculated at a time, by default None.
+
+    Returns
+    -------
+    np.ndarray
+        Modulated values.
+    """
+    subtract = np.subtract if upper else np.add
+
+    def kernel(chunk, x, x_h, c):
+        np.multiply(x, c.real, out=chunk)
+        subtract(chunk, x_h * c.imag, out=chunk)
+
+    return _apply(kernel, out, chunksize, values, hilbert_values, carrier)
+
+
+def analytic(values: np.ndarray) -> np.ndarray:
+    """Calculates the analytic signal :math:`x + j\\mathcal{H}\\{x\\}` of
+    real values (see `chirper.transforms.hilbert.analytic`).
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Real values.
+
+    Returns
+    -------
+    np.ndarray
+        Analytic signal.
+    """
+    return hilbert.analytic(values)
+
+
+def baseband(analytic_values: np.ndarray, carrier: np.ndarray, out=None) -> np.ndarray:
+    """Moves an analytic signal to baseband, multiplying it by the
+    conjugate of the complex carrier.
+
+    Parameters
+    ----------
+    analytic_values : np.ndarray
+        Analytic signal.
+    carrier : np.ndarray
+        Complex carrier (see `phasor`).
+    out : np.ndarray, optional
+        Array where the result is stored, by default None. It can be
+        `analytic_values` itself.
+
+    Returns
+    -------
+    np.ndarray
+        Complex envelope of the signal.
+    """
+    return np.multiply(analytic_values, np.conjugate(carrier), out=out)
+
+
+def _apply(kernel, out, chunksize, values, *arrays):
+    # Runs the kernel over the whole arrays or chunk by chunk, writing
+    # each result into the output
+    if out is None:
+        is_complex = np.iscomplexobj(values)
+        dtype = dtypes.complex_dtype(values.dtype) if is_complex else dtypes.real_dtype(values.dtype)
+        out = np.empty(len(values), dtype=dtype)
+    if chunksize is None or chunksize >= len(values):
+        kernel(out, values, *arrays)
+        return out
+    for start in range(0, len(values), chunksize):
+        chunk = slice(start, start + chunksize)
+        kernel(out[chunk], values[chunk], *(arr[chunk] for arr in arrays))
+    return out
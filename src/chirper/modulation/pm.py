@@ -1,7 +1,9 @@
 import numpy as np
 
 from chirper.sgn import Signal1
-from chirper.config import PM_MODULATION, HERTZ
+from chirper.config import PM_DEMODULATION, PM_MODULATION, HERTZ
+from chirper.modulation import kernels
+from chirper.modulation.demodulator import BlockDemodulator
 
 
 def pm_modulation(signal1: Signal1, *args, method=PM_MODULATION, hertz=HERTZ, **kwargs) -> Signal1:
@@ -42,3 +44,72 @@ def _trad_modulation(signal1: Signal1, carrier_freq, carrier_amp, hertz):
 PM_MODULATION_METHODS = {
     "trad": _trad_modulation,
 }
+
+
+def pm_demodulation(signal1: Signal1, *args, method=PM_DEMODULATION, hertz=HERTZ, **kwargs) -> Signal1:
+    """Recovers the message of a PM modulated signal from its
+    instantaneous phase.
+
+    The currently available methods for demodulation are:
+     - Traditional
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        One dimensional signal to demodulate.
+    carrier_freq : float
+        Frequency of the carrier wave.
+    method : {"trad"}, optional
+        Method used for the modulation, by default PM_DEMODULATION.
+    hertz : bool, optional
+        Whether the frequency is given in Hertz, by default HERTZ.
+
+    Returns
+    -------
+    Signal1
+        Demodulated one dimensional signal, up to multiples of
+        :math:`2\\pi` if the message starts outside :math:`(-\\pi, \\pi]`.
+    """
+    return PM_DEMODULATION_METHODS[method](signal1, *args, hertz, **kwargs)
+
+
+def _trad_demodulation(signal1: Signal1, carrier_freq, hertz=HERTZ) -> Signal1:
+    carrier = kernels.phasor(signal1.axis, carrier_freq, hertz)
+    envelope = kernels.baseband(kernels.analytic(signal1.values), carrier)
+    return signal1._like(_message(np.unwrap(np.angle(envelope))))
+
+
+def _message(phase: np.ndarray) -> np.ndarray:
+    # The analytic signal of the sine carrier lags the phasor by pi / 2
+    return np.add(phase, np.pi / 2, out=phase)
+
+
+PM_DEMODULATION_METHODS = {
+    "trad": _trad_demodulation,
+}
+
+
+class PMDemodulator(BlockDemodulator):
+    """Stateful PM demodulator, for signals given block by block (see
+    `BlockDemodulator`). The phase is unwrapped across blocks."""
+
+    def reset(self):
+        super().reset()
+        self.last_phase = None
+        self.samples = 0
+
+    def _demodulate(self, envelope):
+        phase = np.angle(envelope)
+        # The first samples are the transient of the analytic filter,
+        # which would offset the unwrapped phase by multiples of 2 pi
+        settled = max(self.delay - self.samples, 0)
+        self.samples += len(phase)
+        if settled < len(phase):
+            steady = phase[settled:]
+            if self.last_phase is not None:
+                steady = np.unwrap(np.concatenate(([self.last_phase], steady)))[1:]
+            else:
+                steady = np.unwrap(steady)
+            phase[settled:] = steady
+            self.last_phase = steady[-1]
+        return _message(phase)
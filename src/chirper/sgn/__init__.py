@@ -6,6 +6,7 @@ Signal manipulation
 This subpackage gives the basic tools needed to create, import and
 export signals of different dimensions.
 """
+from chirper.sgn.lazy import LazySignal
 from chirper.sgn.signal import Signal
 from chirper.sgn.signal1 import Signal1
 from chirper.sgn.signal2 import Signal2
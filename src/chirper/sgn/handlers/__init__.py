@@ -6,4 +6,8 @@ Currently, there is support for the following formats:
 - csv
 - json
 - wav
+- jpg, jpeg, png
+- npy, npz
+- bin (raw buffers with a .json sidecar header)
+- chirp (chunked archives with random access by axis range)
 """
@@ -0,0 +1,472 @@
+"""Module for handling imports and exports with .chirp archives.
+
+A .chirp archive stores a signal in fixed size chunks along its first
+axis. Each chunk keeps its axis and values as two separately compressed
+columns, and an index at the end of the file records where every chunk
+is and which range of the axis it covers. That way a time window can be
+read by decoding only the chunks that overlap it, and new data can be
+appended without rewriting the archive.
+
+Appends never overwrite what is stored: the new chunks and index are
+written after the end of the file, leaving the replaced index (and
+partial last chunk) unused. When the unused bytes exceed
+`ARCHIVE_MAX_UNUSED_RATIO` times the used ones, the archive is compacted
+into a new file that replaces the old one, so the size of the file stays
+proportional to the data.
+
+File layout
+-----------
+- Header: magic bytes and format version.
+- For Signal2, the compressed `ax1`, shared by every chunk.
+- Chunks: compressed axis column followed by the compressed values.
+- Footer: JSON metadata followed by the chunk index.
+- Trailer: offset of the footer, length of the metadata and the magic
+  bytes again.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import json
+import os
+import struct
+import tempfile
+import zlib
+import numpy as np
+
+from chirper.config import ARCHIVE_CHUNK_SIZE, ARCHIVE_COMPRESSION_LEVEL, ARCHIVE_MAX_UNUSED_RATIO
+from chirper.utils.file_handling import validate_extension
+if TYPE_CHECKING:
+    from chirper.sgn import Signal1, Signal2
+
+MAGIC = b"CHIRPARC"
+VERSION = 1
+HEADER = struct.Struct("<8sH6x")
+TRAILER = struct.Struct("<QQ8s")
+INDEX_DTYPE = np.dtype([
+    ("offset", "<u8"),
+    ("axis_size", "<u8"),
+    ("values_size", "<u8"),
+    ("length", "<u8"),
+    ("start", "<f8"),
+    ("end", "<f8"),
+])
+
+
+def validate_filename(filename: str) -> None:
+    """Validates the name of the file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file to check.
+    """
+    validate_extension(filename, "chirp")
+
+
+def export_signal1(filename: str, signal1: Signal1, append=False,
+                   chunk_size=ARCHIVE_CHUNK_SIZE,
+                   level=ARCHIVE_COMPRESSION_LEVEL) -> None:
+    """Exports the given one dimensional signal to a .chirp archive.
+
+    Parameters
+    ----------
+    filename : str
+        File to write to.
+    signal1 : Signal1
+        Signal to export.
+    append : bool, optional
+        Whether to append the signal to an existing archive instead of
+        overwriting it, by default False. The appended axis must start
+        after the end of the archive.
+    chunk_size : int, optional
+        Number of samples in each chunk, by default ARCHIVE_CHUNK_SIZE.
+        Ignored when appending, as the archive keeps its own.
+    level : int, optional
+        Compression level between 0 and 9, by default
+        ARCHIVE_COMPRESSION_LEVEL.
+    """
+    validate_filename(filename)
+    if append:
+        with SignalArchive(filename) as archive:
+            archive.append(signal1.axis, signal1.values)
+    else:
+        with SignalArchive.create(filename, "Signal1", signal1.values.dtype,
+                                  chunk_size=chunk_size, level=level) as archive:
+            archive.append(signal1.axis, signal1.values)
+
+
+def import_signal1(filename: str, start=None, stop=None) -> Signal1:
+    """Imports a one dimensional signal from a .chirp archive.
+
+    Parameters
+    ----------
+    filename : str
+        File to read from.
+    start : float, optional
+        First axis value to read (inclusive), by default the start of
+        the archive.
+    stop : float, optional
+        Last axis value to read (inclusive), by default the end of the
+        archive.
+
+    Returns
+    -------
+    np.ndarray, np.ndarray
+        Axis and values read.
+    """
+    validate_filename(filename)
+    with SignalArchive(filename, "rb") as archive:
+        return archive.read(start, stop)
+
+
+def export_signal2(filename: str, signal2: Signal2, append=False,
+                   chunk_size=ARCHIVE_CHUNK_SIZE,
+                   level=ARCHIVE_COMPRESSION_LEVEL) -> None:
+    """Exports the given two dimensional signal to a .chirp archive.
+
+    The signal is chunked along `ax0`, and `ax1` is stored only once.
+
+    Parameters
+    ----------
+    filename : str
+        File to write to.
+    signal2 : Signal2
+        Signal to export.
+    append : bool, optional
+        Whether to append the signal to an existing archive instead of
+        overwriting it, by default False. The appended `ax0` must start
+        after the end of the archive, and `ax1` must match it.
+    chunk_size : int, optional
+        Number of rows in each chunk, by default ARCHIVE_CHUNK_SIZE.
+        Ignored when appending, as the archive keeps its own.
+    level : int, optional
+        Compression level between 0 and 9, by default
+        ARCHIVE_COMPRESSION_LEVEL.
+    """
+    validate_filename(filename)
+    if append:
+        with SignalArchive(filename) as archive:
+            if not np.array_equal(archive.ax1, signal2.ax1):
+                raise ValueError("The second axis does not match the one of the archive.")
+            archive.append(signal2.ax0, signal2.values)
+    else:
+        with SignalArchive.create(filename, "Signal2", signal2.values.dtype, ax1=signal2.ax1,
+                                  chunk_size=chunk_size, level=level) as archive:
+            archive.append(signal2.ax0, signal2.values)
+
+
+def import_signal2(filename: str, start=None, stop=None) -> Signal2:
+    """Imports a two dimensional signal from a .chirp archive.
+
+    Parameters
+    ----------
+    filename : str
+        File to read from.
+    start : float, optional
+        First `ax0` value to read (inclusive), by default the start of
+        the archive.
+    stop : float, optional
+        Last `ax0` value to read (inclusive), by default the end of the
+        archive.
+
+    Returns
+    -------
+    np.ndarray, np.ndarray, np.ndarray
+        Axes and values read.
+    """
+    validate_filename(filename)
+    with SignalArchive(filename, "rb") as archive:
+        ax0, values = archive.read(start, stop)
+        return ax0, archive.ax1, values
+
+
+class SignalArchive:
+    """Chunked archive of a signal, indexed by its first axis.
+
+    Use `SignalArchive.create` to start a new archive, or open an
+    existing one with the constructor. It can be used as a context
+    manager, which closes the file on exit.
+    """
+
+    def __init__(self, filename: str, mode="r+b") -> None:
+        """Opens an existing archive.
+
+        Parameters
+        ----------
+        filename : str
+            File of the archive.
+        mode : {"r+b", "rb"}, optional
+            Mode used to open the file, by default "r+b". Use "rb" to
+            only read it.
+        """
+        self.filename = filename
+        self._mode = mode
+        self._file = open(filename, mode)
+        magic, version = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is not a .chirp archive.")
+        if version > VERSION:
+            raise ValueError(f"Unsupported .chirp archive version {version}.")
+
+        self._file.seek(-TRAILER.size, 2)
+        self._footer_offset, meta_size, magic = TRAILER.unpack(self._file.read(TRAILER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{filename} is corrupted or was not closed properly.")
+        self._file.seek(self._footer_offset)
+        self.meta = json.loads(self._file.read(meta_size).decode("utf-8"))
+        n_chunks = self.meta["chunks"]
+        self.index = np.frombuffer(self._file.read(n_chunks * INDEX_DTYPE.itemsize),
+                                   dtype=INDEX_DTYPE).copy()
+
+        self.axis_dtype = np.dtype(self.meta["axis_dtype"])
+        self.values_dtype = np.dtype(self.meta["values_dtype"])
+        self.row_shape = tuple(self.meta["row_shape"])
+        self.ax1 = None
+        if "ax1" in self.meta:
+            offset, size, length = self.meta["ax1"]
+            self._file.seek(offset)
+            self.ax1 = self._decode(self._file.read(size), self.axis_dtype, (length,))
+
+    @classmethod
+    def create(cls, filename: str, signal_type: str, dtype, ax1=None,
+               chunk_size=ARCHIVE_CHUNK_SIZE,
+               level=ARCHIVE_COMPRESSION_LEVEL) -> SignalArchive:
+        """Creates an empty archive, overwriting the file.
+
+        Parameters
+        ----------
+        filename : str
+            File of the archive.
+        signal_type : {"Signal1", "Signal2"}
+            Type of the signal stored.
+        dtype : data-type
+            Type of the values of the signal.
+        ax1 : array_like, optional
+            Second axis, only for Signal2.
+        chunk_size : int, optional
+            Number of samples (or rows) in each chunk, by default
+            ARCHIVE_CHUNK_SIZE.
+        level : int, optional
+            Compression level between 0 and 9, by default
+            ARCHIVE_COMPRESSION_LEVEL.
+
+        Returns
+        -------
+        SignalArchive
+            The new archive, open for appending.
+        """
+        meta = {
+            "signal": signal_type,
+            "axis_dtype": "<f8",
+            "values_dtype": np.dtype(dtype).newbyteorder("<").str,
+            "row_shape": [],
+            "chunk_size": int(chunk_size),
+            "level": int(level),
+            "chunks": 0,
+        }
+        with open(filename, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION))
+            if ax1 is not None:
+                data = zlib.compress(np.ascontiguousarray(ax1, dtype="<f8").tobytes(), level)
+                meta["ax1"] = [file.tell(), len(data), len(ax1)]
+                meta["row_shape"] = [len(ax1)]
+                file.write(data)
+            cls._write_footer(file, meta, np.empty(0, dtype=INDEX_DTYPE))
+        return cls(filename)
+
+    def __enter__(self) -> SignalArchive:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return int(self.index["length"].sum())
+
+    def span(self):
+        """Gets the first and last axis values stored."""
+        if len(self.index) == 0:
+            return None
+        return self.index["start"][0], self.index["end"][-1]
+
+    def append(self, axis, values) -> None:
+        """Appends samples to the end of the archive.
+
+        If the last chunk is not full, it is rewritten together with
+        the new samples, so every chunk but the last one has exactly
+        `chunk_size` samples.
+
+        Nothing stored is overwritten: the new chunks and index are
+        written after the end of the file, so the archive is left as it
+        was if the append fails. The archive is then compacted if the
+        unused bytes exceed `ARCHIVE_MAX_UNUSED_RATIO` times the used
+        ones (see `compact`).
+
+        Parameters
+        ----------
+        axis : array_like
+            Axis of the samples, which must be sorted and start after
+            the end of the archive.
+        values : array_like
+            Values of the samples.
+        """
+        axis = np.asarray(axis, dtype=self.axis_dtype)
+        values = np.asarray(values)
+        if len(axis) == 0:
+            return
+        if values.shape[1:] != self.row_shape:
+            raise ValueError(
+                f"Values of shape {values.shape[1:]} can't be appended to rows of shape {self.row_shape}.")
+        if not np.can_cast(values.dtype, self.values_dtype, "same_kind"):
+            raise TypeError(f"Values of type {values.dtype} can't be stored as {self.values_dtype}.")
+        if len(self.index) and axis[0] <= self.index["end"][-1]:
+            raise ValueError("The appended axis must start after the end of the archive.")
+
+        index = self.index
+        chunk_size = self.meta["chunk_size"]
+        if len(index) and index["length"][-1] < chunk_size:
+            # The partial last chunk is merged with the new samples
+            last_axis, last_values = self._read_chunk(index[-1])
+            axis = np.concatenate((last_axis, axis))
+            values = np.concatenate((last_values, values.astype(self.values_dtype, copy=False)))
+            index = index[:-1]
+
+        end = self._file.seek(0, os.SEEK_END)
+        try:
+            entries = []
+            for start in range(0, len(axis), chunk_size):
+                chunk_axis = axis[start:start + chunk_size]
+                chunk_values = values[start:start + chunk_size]
+                axis_data = self._encode(chunk_axis, self.axis_dtype)
+                values_data = self._encode(chunk_values, self.values_dtype)
+                entries.append((self._file.tell(), len(axis_data), len(values_data),
+                                len(chunk_axis), chunk_axis[0], chunk_axis[-1]))
+                self._file.write(axis_data)
+                self._file.write(values_data)
+
+            index = np.concatenate((index, np.array(entries, dtype=INDEX_DTYPE)))
+            meta = dict(self.meta, chunks=len(index))
+            footer_offset = self._write_footer(self._file, meta, index)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except BaseException:
+            # Drops whatever was written, so the old trailer is the last
+            # thing in the file again
+            self._file.truncate(end)
+            raise
+        self.meta, self.index, self._footer_offset = meta, index, footer_offset
+
+        used = self._used_bytes()
+        if self._file.tell() - used > ARCHIVE_MAX_UNUSED_RATIO * used:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrites the archive without the bytes left unused by the
+        appends.
+
+        The archive is written to a temporary file in the same
+        directory, which replaces the original one only once it is
+        complete, so the archive is never left half written.
+        """
+        meta = dict(self.meta)
+        index = self.index.copy()
+        handle, temp_name = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(self.filename)))
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(HEADER.pack(MAGIC, VERSION))
+                if "ax1" in meta:
+                    offset, size, length = meta["ax1"]
+                    self._file.seek(offset)
+                    meta["ax1"] = [file.tell(), size, length]
+                    file.write(self._file.read(size))
+                for entry in index:
+                    self._file.seek(int(entry["offset"]))
+                    entry["offset"] = file.tell()
+                    file.write(self._file.read(int(entry["axis_size"] + entry["values_size"])))
+                footer_offset = self._write_footer(file, meta, index)
+                file.flush()
+                os.fsync(file.fileno())
+            self._file.close()
+            os.replace(temp_name, self.filename)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
+        finally:
+            if self._file.closed:
+                self._file = open(self.filename, self._mode)
+        self.meta, self.index, self._footer_offset = meta, index, footer_offset
+
+    def read(self, start=None, stop=None):
+        """Reads the samples within an axis range.
+
+        Only the chunks that overlap the range are decoded.
+
+        Parameters
+        ----------
+        start : float, optional
+            First axis value to read (inclusive), by default the start
+            of the archive.
+        stop : float, optional
+            Last axis value to read (inclusive), by default the end of
+            the archive.
+
+        Returns
+        -------
+        np.ndarray, np.ndarray
+            Axis and values read.
+        """
+        mask = np.ones(len(self.index), dtype=bool)
+        if start is not None:
+            mask &= self.index["end"] >= start
+        if stop is not None:
+            mask &= self.index["start"] <= stop
+
+        chunks = [self._read_chunk(entry) for entry in self.index[mask]]
+        if not chunks:
+            return (np.empty(0, dtype=self.axis_dtype),
+                    np.empty((0, *self.row_shape), dtype=self.values_dtype))
+        axis = np.concatenate([chunk[0] for chunk in chunks])
+        values = np.concatenate([chunk[1] for chunk in chunks])
+
+        # Only the first and last chunks can hold samples out of range
+        first = 0 if start is None else np.searchsorted(axis, start, "left")
+        last = len(axis) if stop is None else np.searchsorted(axis, stop, "right")
+        return axis[first:last], values[first:last]
+
+    def close(self) -> None:
+        """Closes the file."""
+        self._file.close()
+
+    def _used_bytes(self) -> int:
+        # Size the archive would have without unused bytes
+        used = HEADER.size + int((self.index["axis_size"] + self.index["values_size"]).sum())
+        if "ax1" in self.meta:
+            used += self.meta["ax1"][1]
+        used += len(json.dumps(self.meta).encode("utf-8")) + self.index.nbytes + TRAILER.size
+        return used
+
+    @staticmethod
+    def _write_footer(file, meta: dict, index: np.ndarray) -> int:
+        # Writes the metadata, the index and the trailer at the current
+        # position, returning where the footer starts
+        footer_offset = file.tell()
+        meta_data = json.dumps(meta).encode("utf-8")
+        file.write(meta_data)
+        file.write(index.tobytes())
+        file.write(TRAILER.pack(footer_offset, len(meta_data), MAGIC))
+        return footer_offset
+
+    def _read_chunk(self, entry):
+        self._file.seek(int(entry["offset"]))
+        axis_data = self._file.read(int(entry["axis_size"]))
+        values_data = self._file.read(int(entry["values_size"]))
+        length = int(entry["length"])
+        return (self._decode(axis_data, self.axis_dtype, (length,)),
+                self._decode(values_data, self.values_dtype, (length, *self.row_shape)))
+
+    def _encode(self, arr: np.ndarray, dtype) -> bytes:
+        return zlib.compress(np.ascontiguousarray(arr, dtype=dtype).tobytes(), self.meta["level"])
+
+    @staticmethod
+    def _decode(data: bytes, dtype, shape) -> np.ndarray:
+        return np.frombuffer(zlib.decompress(data), dtype=dtype).reshape(shape)
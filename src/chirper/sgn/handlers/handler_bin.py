@@ -0,0 +1,133 @@
+"""Module for handling imports and exports with raw .bin files.
+
+The arrays of the signal are written one after the other as raw little
+endian buffers. A sidecar header, stored next to the file with an
+extra ".json" extension (e.g "capture.bin.json"), records the dtype,
+shape and offset of each of them, so the file can be read by any tool
+and memory mapped without parsing.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import json
+import numpy as np
+
+from chirper.utils.file_handling import validate_extension
+if TYPE_CHECKING:
+    from chirper.sgn import Signal1, Signal2
+
+# Offsets of the arrays are aligned to this many bytes
+ALIGNMENT = 64
+
+
+def validate_filename(filename: str) -> None:
+    """Validates the name of the file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file to check.
+    """
+    validate_extension(filename, "bin")
+
+
+def header_filename(filename: str) -> str:
+    """Gets the name of the sidecar header of a .bin file."""
+    return f"{filename}.json"
+
+
+def export_signal1(filename: str, signal1: Signal1) -> None:
+    """Exports the given one dimensional signal to a .bin file and its
+    sidecar header."""
+    validate_filename(filename)
+    _export(filename, "Signal1", {"axis": signal1.axis, "values": signal1.values})
+
+
+def import_signal1(filename: str, mmap_mode=None) -> Signal1:
+    """Imports a one dimensional signal from a .bin file.
+
+    Parameters
+    ----------
+    filename : str
+        File to read from. Its sidecar header must be next to it.
+    mmap_mode : {None, "r", "r+", "c"}, optional
+        If given, the file is memory mapped with this mode and the
+        arrays returned are views of it, by default None.
+
+    Returns
+    -------
+    np.ndarray, np.ndarray
+        Axis and values read.
+    """
+    validate_filename(filename)
+    arrays = _import(filename, mmap_mode)
+    return arrays["axis"], arrays["values"]
+
+
+def export_signal2(filename: str, signal2: Signal2) -> None:
+    """Exports the given two dimensional signal to a .bin file and its
+    sidecar header."""
+    validate_filename(filename)
+    _export(filename, "Signal2", {"ax0": signal2.ax0, "ax1": signal2.ax1,
+                                  "values": signal2.values})
+
+
+def import_signal2(filename: str, mmap_mode=None) -> Signal2:
+    """Imports a two dimensional signal from a .bin file.
+
+    Parameters
+    ----------
+    filename : str
+        File to read from. Its sidecar header must be next to it.
+    mmap_mode : {None, "r", "r+", "c"}, optional
+        If given, the file is memory mapped with this mode and the
+        arrays returned are views of it, by default None.
+
+    Returns
+    -------
+    np.ndarray, np.ndarray, np.ndarray
+        Axes and values read.
+    """
+    validate_filename(filename)
+    arrays = _import(filename, mmap_mode)
+    return arrays["ax0"], arrays["ax1"], arrays["values"]
+
+
+def _export(filename: str, signal_type: str, arrays: dict) -> None:
+    header = {"signal": signal_type, "arrays": []}
+    with open(filename, "wb") as file:
+        for name, arr in arrays.items():
+            arr = np.asarray(arr)
+            if arr.dtype.hasobject:
+                raise TypeError("Signals with object values can't be exported to binary files.")
+            arr = np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder("<"))
+            offset = file.tell()
+            padding = -offset % ALIGNMENT
+            file.write(b"\x00" * padding)
+            header["arrays"].append({
+                "name": name,
+                "dtype": arr.dtype.str,
+                "shape": list(arr.shape),
+                "offset": offset + padding,
+            })
+            arr.tofile(file)
+
+    with open(header_filename(filename), "w") as file:
+        json.dump(header, file, indent=4)
+
+
+def _import(filename: str, mmap_mode=None) -> dict:
+    with open(header_filename(filename), "r") as file:
+        header = json.load(file)
+
+    arrays = {}
+    for entry in header["arrays"]:
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        if mmap_mode is not None and np.prod(shape) > 0:
+            arrays[entry["name"]] = np.memmap(filename, dtype=dtype, mode=mmap_mode,
+                                              offset=entry["offset"], shape=shape)
+        else:
+            count = int(np.prod(shape))
+            arrays[entry["name"]] = np.fromfile(
+                filename, dtype=dtype, count=count, offset=entry["offset"]).reshape(shape)
+    return arrays
@@ -1,8 +1,11 @@
 """Module for handling imports and exports with .csv files."""
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import csv
+from itertools import islice
+import numpy as np
 
+from chirper.config import CSV_PRECISION, IO_BLOCK_SIZE
+from chirper.utils import dtypes
 from chirper.utils.file_handling import validate_extension
 if TYPE_CHECKING:
     from chirper.sgn import Signal1
@@ -19,15 +22,145 @@ def validate_filename(filename: str) -> None:
     validate_extension(filename, "csv")
 
 
-def export_signal1(filename: str, signal1: Signal1) -> None:
-    """Exports the given one dimensional signal to the .csv file."""
+def export_signal1(filename: str, signal1: Signal1, precision=CSV_PRECISION,
+                   delimiter=",", header=True) -> None:
+    """Exports the given one dimensional signal to the .csv file.
+
+    The file has one row per sample, with the axis in the first column
+    and the values in the second one. Complex values are written as two
+    columns, the real and imaginary parts.
+
+    Parameters
+    ----------
+    filename : str
+        File to write to.
+    signal1 : Signal1
+        Signal to export.
+    precision : int, optional
+        Number of significant digits written for each number, by
+        default CSV_PRECISION.
+    delimiter : str, optional
+        String separating the columns, by default ",".
+    header : bool, optional
+        Whether to write a commented header with the column names, by
+        default True.
+    """
+    validate_filename(filename)
+    axis, values = signal1.unpack()
+    is_complex = np.iscomplexobj(values)
+    columns = ("axis", "real", "imag") if is_complex else ("axis", "values")
+    fmt = f"%.{precision}g"
+
+    with open(filename, "w") as file:
+        if header:
+            file.write(f"# {delimiter.join(columns)}\n")
+        # The rows are formatted in blocks to bound the size of the
+        # temporary table
+        for start in range(0, len(axis), IO_BLOCK_SIZE):
+            stop = start + IO_BLOCK_SIZE
+            block = values[start:stop]
+            if is_complex:
+                table = np.column_stack((axis[start:stop], block.real, block.imag))
+            else:
+                table = np.column_stack((axis[start:stop], block))
+            np.savetxt(file, table, fmt=fmt, delimiter=delimiter)
+
+
+def import_signal1(filename: str, delimiter=",", skiprows=None, dtype=float) -> Signal1:
+    """Imports a one dimensional signal from a .csv file.
+
+    The file is expected to have the axis in the first column and the
+    values in the second one. If it has a third column, it is taken as
+    the imaginary part of the values. Lines starting with "#" are
+    ignored.
+
+    Parameters
+    ----------
+    filename : str
+        File to read from.
+    delimiter : str, optional
+        String separating the columns, by default ",".
+    skiprows : int, optional
+        Number of rows to skip at the start of the file. By default, a
+        first row that does not hold numbers is skipped as a header.
+    dtype : data-type, optional
+        Type used to parse the numbers, by default float. The axis
+        keeps it, while the values follow `config.DTYPE_POLICY`.
+
+    Returns
+    -------
+    np.ndarray, np.ndarray
+        Axis and values read.
+    """
     validate_filename(filename)
-    with open(filename, "w+") as file:
-        writer = csv.writer(file)
-        writer.writerows(*signal1.unpack())
+    if skiprows is None:
+        skiprows = _header_rows(filename, delimiter)
+    table = np.loadtxt(filename, delimiter=delimiter, skiprows=skiprows,
+                       dtype=dtype, ndmin=2)
+    return _split_columns(table)
+
 
+def iter_signal1(filename: str, chunksize=IO_BLOCK_SIZE, delimiter=",",
+                 skiprows=None, dtype=float):
+    """Reads a one dimensional signal from a .csv file in chunks.
+
+    Only `chunksize` rows are held in memory at a time, so arbitrarily
+    large files can be processed. The file format is the same as the
+    one read by `import_signal1`.
+
+    Parameters
+    ----------
+    filename : str
+        File to read from.
+    chunksize : int, optional
+        Maximum number of rows in each chunk, by default IO_BLOCK_SIZE.
+    delimiter : str, optional
+        String separating the columns, by default ",".
+    skiprows : int, optional
+        Number of rows to skip at the start of the file. By default, a
+        first row that does not hold numbers is skipped as a header.
+    dtype : data-type, optional
+        Type used to parse the numbers, by default float. The axis
+        keeps it, while the values follow `config.DTYPE_POLICY`.
 
-def import_signal1(filename: str) -> Signal1:
-    """Imports a one dimensional signal from a .csv file."""
+    Yields
+    ------
+    np.ndarray, np.ndarray
+        Axis and values of each chunk.
+    """
     validate_filename(filename)
-    pass
+    if skiprows is None:
+        skiprows = _header_rows(filename, delimiter)
+    with open(filename, "r") as file:
+        for _ in range(skiprows):
+            file.readline()
+        while True:
+            lines = list(islice(file, chunksize))
+            if not lines:
+                return
+            table = np.loadtxt(lines, delimiter=delimiter, dtype=dtype, ndmin=2)
+            if len(table):
+                yield _split_columns(table)
+
+
+def _header_rows(filename: str, delimiter: str) -> int:
+    # A first line that can't be parsed as a number is a header
+    with open(filename, "r") as file:
+        first_line = file.readline().strip()
+    if not first_line or first_line.startswith("#"):
+        return 0
+    try:
+        float(first_line.split(delimiter)[0])
+    except ValueError:
+        return 1
+    return 0
+
+
+def _split_columns(table: np.ndarray):
+    axis = table[:, 0]
+    if table.shape[1] > 2:
+        values = np.empty(len(table), dtype=dtypes.complex_dtype(table.dtype))
+        values.real = table[:, 1]
+        values.imag = table[:, 2]
+        return axis, values
+    return axis, table[:, 1].astype(dtypes.real_dtype(table.dtype), copy=False)
@@ -1,13 +1,23 @@
 """Module for handling imports and exports with images."""
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+import os
 import cv2
 import numpy as np
 
+from chirper.exceptions import DimensionError
+from chirper.utils import dtypes
 from chirper.utils.file_handling import validate_extension
 if TYPE_CHECKING:
     from chirper.sgn import Signal2
 
+VALID_EXTENSIONS = (
+    "jpg",
+    "jpeg",
+    "png",
+)
+
 
 def validate_filename(filename: str) -> None:
     """Validates the name of the file.
@@ -17,22 +27,60 @@ def validate_filename(filename: str) -> None:
     filename : str
         Name of the file to check.
     """
-    valid_extensions = (
-        "jpg",
-        "jpeg",
-        "png",
-    )
-    validate_extension(filename, valid_extensions)
+    validate_extension(filename, VALID_EXTENSIONS)
+
+
+def export_signal2(filename: str, signal2: Signal2, norm=False, dtype="uint8") -> None:
+    """Exports the given two dimensional signal as a grayscale image.
+
+    Complex values are exported as their absolute value.
 
+    Parameters
+    ----------
+    filename : str
+        File to write to.
+    signal2 : Signal2
+        Signal to export.
+    norm : {False, True, "minmax"}, optional
+        How to map the values to the pixel range, by default False.
+        False writes the values as they are, True assumes they are
+        between 0 and 1 (like the ones read with `norm=True`), and
+        "minmax" stretches them to the full range.
+    dtype : {"uint8", "uint16"}, optional
+        Pixel type of the image, by default "uint8". JPEG images only
+        support "uint8".
 
-def export_signal2(filename: str, signal2: Signal2) -> None:
-    """Exports the given two dimensional signal."""
+    Raises
+    ------
+    ValueError
+        If the pixel type is not supported by the format.
+    IOError
+        If the image could not be written.
+    """
     validate_filename(filename)
-    pass
+    if dtype not in ("uint8", "uint16"):
+        raise ValueError(f"Unsupported pixel type {dtype} (expected uint8 or uint16).")
+    if dtype == "uint16" and not filename.endswith(".png"):
+        raise ValueError("Only .png images support 16 bit pixels.")
+
+    max_value = np.iinfo(dtype).max
+    values = signal2.values
+    if np.iscomplexobj(values):
+        values = np.abs(values)
+    if norm == "minmax":
+        low, high = values.min(), values.max()
+        scale = max_value / (high - low) if high > low else 0
+        values = (values - low) * scale
+    elif norm:
+        values = values * max_value
+
+    pixels = np.clip(np.rint(values), 0, max_value).astype(dtype)
+    if not cv2.imwrite(filename, pixels):
+        raise IOError(f"Could not write the image {filename}.")
 
 
 def import_signal2(filename: str, channel="mean", norm=False, sf_ax0=1,
-                   sf_ax1=1, sp_ax0=0, sp_ax1=0) -> Signal2:
+                   sf_ax1=1, sp_ax0=0, sp_ax1=0, dtype=None) -> Signal2:
     """Imports a two dimensional signal from a file.
 
     Parameters
@@ -41,11 +89,19 @@ def import_signal2(filename: str, channel="mean", norm=False, sf_ax0=1,
         File to read from.
     channel : {"mean", "r", "g", "b", 0, 1, 2}, optional
         How to handle images with multiple channels, by default "mean",
-        which means it takes the mean of every channel.
+        which means it takes the mean of every channel. It is ignored
+        for single channel images.
+    norm : bool, optional
+        Whether to normalize the values between 0 and 1 (or to the
+        whole range of an integer `dtype`), by default False.
     sf_ax0, sf_ax1 : float, optional
         Sampling frequency for each axis, by default 1.
     sp_ax0, sp_ax1 : float, optional
         Starting point for each axis, by default 0.
+    dtype : data-type, optional
+        Type of the values. By default single channels keep the pixel
+        type of the image, and normalized or averaged values follow
+        `config.DTYPE_POLICY` (float64 by default).
 
     Returns
     -------
@@ -53,29 +109,128 @@ def import_signal2(filename: str, channel="mean", norm=False, sf_ax0=1,
         Read image.
     """
     validate_filename(filename)
+    values = _read_values(filename, channel, norm, dtype)
+    ax0, ax1 = _axes(values.shape, sf_ax0, sf_ax1, sp_ax0, sp_ax1)
+    return ax0, ax1, values
+
+
+def import_signal2_batch(dirname: str, channel="mean", norm=False, sf_ax0=1,
+                         sf_ax1=1, sp_ax0=0, sp_ax1=0, dtype="float32",
+                         workers=None):
+    """Imports every image of a directory into a single stacked array.
+
+    The images are read in parallel by a thread pool (OpenCV releases
+    the GIL while decoding), and each one is written directly into its
+    slot of the stack. All the images must have the same size.
+
+    Parameters
+    ----------
+    dirname : str
+        Directory to read from. The images are sorted by name.
+    channel : {"mean", "r", "g", "b", 0, 1, 2}, optional
+        How to handle images with multiple channels, by default "mean".
+    norm : bool, optional
+        Whether to normalize the values between 0 and 1 (or to the
+        whole range of an integer `dtype`), by default False.
+    sf_ax0, sf_ax1 : float, optional
+        Sampling frequency for each axis, by default 1.
+    sp_ax0, sp_ax1 : float, optional
+        Starting point for each axis, by default 0.
+    dtype : {"float32", "uint8"} or data-type, optional
+        Type of the stacked values, by default "float32".
+    workers : int, optional
+        Number of threads used, by default the one chosen by
+        `ThreadPoolExecutor`.
+
+    Returns
+    -------
+    np.ndarray, np.ndarray, np.ndarray, list[str]
+        Axes shared by the images, the values stacked along the first
+        dimension and the names of the files read.
+
+    Raises
+    ------
+    DimensionError
+        If the images don't have the same size.
+    """
+    filenames = sorted(
+        os.path.join(dirname, name) for name in os.listdir(dirname)
+        if name.split(".")[-1].lower() in VALID_EXTENSIONS
+    )
+    if not filenames:
+        raise FileNotFoundError(f"There are no images in {dirname}.")
+
+    first = _read_values(filenames[0], channel, norm, dtype)
+    stack = np.empty((len(filenames), *first.shape), dtype=first.dtype)
+    stack[0] = first
+
+    def read_into(index):
+        values = _read_values(filenames[index], channel, norm, dtype)
+        if values.shape != first.shape:
+            raise DimensionError(f"The image {filenames[index]} has a different size.",
+                                 values.shape, first.shape)
+        stack[index] = values
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consuming the results raises any error of the workers
+        list(executor.map(read_into, range(1, len(filenames))))
+
+    ax0, ax1 = _axes(first.shape, sf_ax0, sf_ax1, sp_ax0, sp_ax1)
+    return ax0, ax1, stack, filenames
+
+
+def _read_values(filename: str, channel="mean", norm=False, dtype=None) -> np.ndarray:
     channels = {
         "mean": _import_s2_mean,
-        "r": lambda vals, norm: _import_s2_channel(vals, 2, norm),
-        "g": lambda vals, norm: _import_s2_channel(vals, 1, norm),
-        "b": lambda vals, norm: _import_s2_channel(vals, 0, norm),
-        0: lambda vals, norm: _import_s2_channel(vals, 0, norm),
-        1: lambda vals, norm: _import_s2_channel(vals, 1, norm),
-        2: lambda vals, norm: _import_s2_channel(vals, 2, norm),
+        "r": lambda vals, norm, dtype: _import_s2_channel(vals, 2, norm, dtype),
+        "g": lambda vals, norm, dtype: _import_s2_channel(vals, 1, norm, dtype),
+        "b": lambda vals, norm, dtype: _import_s2_channel(vals, 0, norm, dtype),
+        0: lambda vals, norm, dtype: _import_s2_channel(vals, 0, norm, dtype),
+        1: lambda vals, norm, dtype: _import_s2_channel(vals, 1, norm, dtype),
+        2: lambda vals, norm, dtype: _import_s2_channel(vals, 2, norm, dtype),
     }
-    signal = cv2.imread(filename)
-    values = channels[channel](signal, norm)
+    image = cv2.imread(filename, cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise IOError(f"Could not read the image {filename}.")
+    if image.ndim == 2:
+        return _convert(image, norm, dtype)
+    return channels[channel](image, norm, dtype)
 
+
+def _axes(shape, sf_ax0, sf_ax1, sp_ax0, sp_ax1):
     ax0_samp_period = 1 / sf_ax0
     ax1_samp_period = 1 / sf_ax1
-    val_shape = np.shape(values)
-    ax0 = np.arange(val_shape[0]) * ax0_samp_period - sp_ax0
-    ax1 = np.arange(val_shape[1]) * ax1_samp_period - sp_ax1
-    return ax0, ax1, values
+    ax0 = np.arange(shape[0]) * ax0_samp_period - sp_ax0
+    ax1 = np.arange(shape[1]) * ax1_samp_period - sp_ax1
+    return ax0, ax1
+
+
+def _convert(values: np.ndarray, norm=False, dtype=None, max_value=None) -> np.ndarray:
+    if norm:
+        # Normalized values are floating point between 0 and 1, or span
+        # the whole range of an integer type
+        if max_value is None:
+            max_value = np.iinfo(values.dtype).max if values.dtype.kind in "ui" else 1
+        if dtype is not None and np.dtype(dtype).kind in "ui":
+            scaled = np.divide(values, max_value / np.iinfo(dtype).max, dtype=dtypes.real_dtype())
+            return np.rint(scaled, out=scaled).astype(dtype)
+        is_float = dtype is not None and np.dtype(dtype).kind == "f"
+        return np.divide(values, max_value, dtype=dtype if is_float else dtypes.real_dtype())
+    if dtype is None:
+        return values
+    if np.dtype(dtype).kind in "ui" and values.dtype.kind == "f":
+        values = np.rint(values)
+    return values.astype(dtype, copy=False)
 
 
-def _import_s2_channel(values: np.ndarray, channel: int, norm=False):
-    return values[:, :, channel] / 255 if norm else values[:, :, channel]
+def _import_s2_channel(values: np.ndarray, channel: int, norm=False, dtype=None):
+    return _convert(values[:, :, channel], norm, dtype)
 
 
-def _import_s2_mean(values: np.ndarray, norm=False):
-    return np.mean(values, axis=2) / 255 if norm else np.mean(values, axis=2)
+def _import_s2_mean(values: np.ndarray, norm=False, dtype=None):
+    # The alpha channel, if any, is not part of the mean
+    is_float = dtype is not None and np.dtype(dtype).kind == "f"
+    accumulator = dtype if is_float else dtypes.real_dtype()
+    mean = np.mean(values[:, :, :3], axis=2, dtype=accumulator)
+    max_value = np.iinfo(values.dtype).max if values.dtype.kind in "ui" else 1
+    return _convert(mean, norm, dtype, max_value)
@@ -0,0 +1,149 @@
+"""Module for handling imports and exports with NumPy's .npy and .npz
+files.
+
+Both formats are binary and lossless, so they keep complex values and
+any dtype of the signal.
+
+- A .npy file holds a single structured record whose fields are the
+  axes and values of the signal. Each field is stored contiguously, so
+  the file can be opened with `mmap_mode` to access the data without
+  reading it into memory.
+- A .npz file holds one array per axis plus the values, and can
+  optionally be compressed. It can't be memory mapped.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import numpy as np
+
+from chirper.utils.file_handling import validate_extension
+if TYPE_CHECKING:
+    from chirper.sgn import Signal1, Signal2
+
+
+def validate_filename(filename: str) -> None:
+    """Validates the name of the file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file to check.
+    """
+    valid_extensions = (
+        "npy",
+        "npz",
+    )
+    validate_extension(filename, valid_extensions)
+
+
+def export_signal1(filename: str, signal1: Signal1, compressed=False) -> None:
+    """Exports the given one dimensional signal to a .npy or .npz file.
+
+    Parameters
+    ----------
+    filename : str
+        File to write to.
+    signal1 : Signal1
+        Signal to export.
+    compressed : bool, optional
+        Whether to compress the arrays, by default False. Only used for
+        .npz files.
+    """
+    validate_filename(filename)
+    _export(filename, {"axis": signal1.axis, "values": signal1.values}, compressed)
+
+
+def import_signal1(filename: str, mmap_mode=None) -> Signal1:
+    """Imports a one dimensional signal from a .npy or .npz file.
+
+    Parameters
+    ----------
+    filename : str
+        File to read from.
+    mmap_mode : {None, "r", "r+", "c"}, optional
+        If given, a .npy file is memory mapped with this mode and the
+        arrays returned are views of the file, by default None.
+
+    Returns
+    -------
+    np.ndarray, np.ndarray
+        Axis and values read.
+    """
+    validate_filename(filename)
+    arrays = _import(filename, mmap_mode)
+    return arrays["axis"], arrays["values"]
+
+
+def export_signal2(filename: str, signal2: Signal2, compressed=False) -> None:
+    """Exports the given two dimensional signal to a .npy or .npz file.
+
+    Parameters
+    ----------
+    filename : str
+        File to write to.
+    signal2 : Signal2
+        Signal to export.
+    compressed : bool, optional
+        Whether to compress the arrays, by default False. Only used for
+        .npz files.
+    """
+    validate_filename(filename)
+    _export(filename, {"ax0": signal2.ax0, "ax1": signal2.ax1,
+                       "values": signal2.values}, compressed)
+
+
+def import_signal2(filename: str, mmap_mode=None) -> Signal2:
+    """Imports a two dimensional signal from a .npy or .npz file.
+
+    Parameters
+    ----------
+    filename : str
+        File to read from.
+    mmap_mode : {None, "r", "r+", "c"}, optional
+        If given, a .npy file is memory mapped with this mode and the
+        arrays returned are views of the file, by default None.
+
+    Returns
+    -------
+    np.ndarray, np.ndarray, np.ndarray
+        Axes and values read.
+    """
+    validate_filename(filename)
+    arrays = _import(filename, mmap_mode)
+    return arrays["ax0"], arrays["ax1"], arrays["values"]
+
+
+def _export(filename: str, arrays: dict, compressed=False) -> None:
+    arrays = {name: _little_endian(arr) for name, arr in arrays.items()}
+    if filename.endswith(".npz"):
+        saver = np.savez_compressed if compressed else np.savez
+        saver(filename, **arrays)
+        return
+
+    # The record is described by the header, and each field is written
+    # directly from its array so no record is built in memory
+    dtype = np.dtype([(name, arr.dtype, arr.shape) for name, arr in arrays.items()])
+    header = {
+        "descr": np.lib.format.dtype_to_descr(dtype),
+        "fortran_order": False,
+        "shape": (),
+    }
+    with open(filename, "wb") as file:
+        np.lib.format.write_array_header_1_0(file, header)
+        for arr in arrays.values():
+            np.ascontiguousarray(arr).tofile(file)
+
+
+def _import(filename: str, mmap_mode=None) -> dict:
+    if filename.endswith(".npz"):
+        with np.load(filename) as data:
+            return {name: data[name] for name in data.files}
+
+    record = np.load(filename, mmap_mode=mmap_mode)
+    return {name: record[name] for name in record.dtype.names}
+
+
+def _little_endian(arr) -> np.ndarray:
+    arr = np.asarray(arr)
+    if arr.dtype.hasobject:
+        raise TypeError("Signals with object values can't be exported to binary files.")
+    return arr.astype(arr.dtype.newbyteorder("<"), copy=False)
@@ -1,9 +1,12 @@
 """Module for handling imports and exports with .wav files."""
 from __future__ import annotations
 from typing import TYPE_CHECKING
+import struct
 import numpy as np
 from scipy.io import wavfile
 
+from chirper.config import IO_BLOCK_SIZE, WAV_DTYPE
+from chirper.utils import dtypes
 from chirper.utils.file_handling import validate_extension
 if TYPE_CHECKING:
     from chirper.sgn import Signal1
@@ -20,12 +23,35 @@ def validate_filename(filename: str) -> None:
     validate_extension(filename, "wav")
 
 
-def export_signal1(filename: str, signal1: Signal1, samp_rate=None) -> None:
-    """Exports the given one dimensional signal to the .wav file."""
+def export_signal1(filename: str, signal1: Signal1, samp_rate=None,
+                   dtype=WAV_DTYPE, full_scale=1.0) -> None:
+    """Exports the given one dimensional signal to the .wav file.
+
+    The signal is written in blocks through a `WavWriter`, so the
+    conversion to the output format never needs a full size copy of
+    the signal.
+
+    Parameters
+    ----------
+    filename : str
+        File to write to.
+    signal1 : Signal1
+        Signal to export.
+    samp_rate : int, optional
+        Sampling rate of the file, by default the sampling frequency of
+        the signal.
+    dtype : {"int16", "int24", "float32"}, optional
+        Sample format of the file, by default WAV_DTYPE.
+    full_scale : float, optional
+        Value that is mapped to the maximum amplitude of the file, by
+        default 1.0.
+    """
     validate_filename(filename)
     if samp_rate is None:
         samp_rate = int(signal1.sampling_freq())
-    wavfile.write(filename, samp_rate, signal1.values.astype(np.float32))
+    with WavWriter(filename, samp_rate, dtype=dtype, full_scale=full_scale) as writer:
+        for start in range(0, len(signal1.values), IO_BLOCK_SIZE):
+            writer.write(signal1.values[start:start + IO_BLOCK_SIZE])
 
 
 def import_signal1(filename: str, amplification=1/200, channels="mean", *args, **kwargs) -> Signal1:
@@ -38,15 +64,186 @@ def import_signal1(filename: str, amplification=1/200, channels="mean", *args, *
     sf, values = wavfile.read(filename)
     axis = np.arange(values.shape[0]) / sf
     values = channel_handler[channels](values, *args, **kwargs)
-    return axis, amplification * values
+    # Integer samples are scaled straight into the type of the policy
+    return axis, np.multiply(values, amplification, dtype=dtypes.real_dtype(values.dtype))
 
 
 def _mean(values: np.ndarray):
     if len(values.shape) != 1:
-        return values.mean(axis=1)
+        return values.mean(axis=1, dtype=dtypes.real_dtype(values.dtype))
     else:
         return values
 
 
 def _get(values: np.ndarray, channel=0):
     return values[:, :, channel]
+
+
+class WavWriter:
+    """Writes a .wav file incrementally, one block at a time.
+
+    The header is written with placeholder sizes when the first block
+    arrives and fixed up when the writer is closed, so the full signal
+    never has to be held in memory. It can be used as a context
+    manager, which closes the file on exit.
+
+    Example
+    -------
+    >>> with WavWriter("output.wav", 44100, dtype="int16") as writer:
+    >>>     for block in blocks:
+    >>>         writer.write(block)
+    """
+    FORMATS = {
+        # dtype: (format tag, bytes per sample)
+        "int16": (1, 2),
+        "int24": (1, 3),
+        "float32": (3, 4),
+    }
+    MAX_DATA_SIZE = 0xFFFFFFFF
+
+    def __init__(self, filename: str, samp_rate=None, channels=None,
+                 dtype=WAV_DTYPE, full_scale=1.0) -> None:
+        """Opens a .wav file for writing.
+
+        Parameters
+        ----------
+        filename : str
+            File to write to.
+        samp_rate : int, optional
+            Sampling rate of the file. If not given, it is taken from
+            the first block written, which must then be a Signal1.
+        channels : int, optional
+            Number of channels of the file. If not given, it is taken
+            from the shape of the first block written.
+        dtype : {"int16", "int24", "float32"}, optional
+            Sample format of the file, by default WAV_DTYPE.
+        full_scale : float, optional
+            Value that is mapped to the maximum amplitude of the file,
+            by default 1.0. Values outside of it are clipped for
+            integer formats.
+
+        Raises
+        ------
+        ValueError
+            If `dtype` is not a supported format.
+        """
+        validate_filename(filename)
+        if dtype not in WavWriter.FORMATS:
+            raise ValueError(
+                f"Unsupported .wav format {dtype} (expected one of {tuple(WavWriter.FORMATS)}).")
+        self.filename = filename
+        self.samp_rate = samp_rate
+        self.channels = channels
+        self.dtype = dtype
+        self.full_scale = full_scale
+        self.frames = 0
+        self.closed = False
+        self._file = open(filename, "wb")
+        self._header_written = False
+
+    def __enter__(self) -> WavWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def write(self, block) -> None:
+        """Appends a block of samples to the file.
+
+        Parameters
+        ----------
+        block : Signal1 or array_like
+            Samples to write. Arrays with two dimensions are interpreted
+            as (frames, channels).
+        """
+        if self.closed:
+            raise ValueError("Cannot write to a closed WavWriter.")
+        if hasattr(block, "values"):
+            if self.samp_rate is None:
+                self.samp_rate = int(block.sampling_freq())
+            block = block.values
+        block = np.asarray(block)
+        if block.ndim == 1:
+            block = block[:, None]
+        if self.channels is None:
+            self.channels = block.shape[1]
+        if block.shape[1] != self.channels:
+            raise ValueError(
+                f"Block has {block.shape[1]} channels, but the file has {self.channels}.")
+        if not self._header_written:
+            if self.samp_rate is None:
+                raise ValueError(
+                    "The sampling rate must be given when writing raw arrays.")
+            self._write_header()
+
+        data = self._encode(block)
+        if self._data_size() + len(data) > WavWriter.MAX_DATA_SIZE:
+            raise ValueError("The .wav format cannot hold more than 4 GiB of data.")
+        self._file.write(data)
+        self.frames += block.shape[0]
+
+    def close(self) -> None:
+        """Fixes up the header sizes and closes the file."""
+        if self.closed:
+            return
+        if not self._header_written:
+            if self.samp_rate is None:
+                self.samp_rate = 1
+            if self.channels is None:
+                self.channels = 1
+            self._write_header()
+
+        data_size = self._data_size()
+        # RIFF chunks must have an even size, so odd data gets padded
+        if data_size % 2:
+            self._file.write(b"\x00")
+        file_size = self._file.tell()
+        self._file.seek(4)
+        self._file.write(struct.pack("<I", file_size - 8))
+        if self._fact_offset is not None:
+            self._file.seek(self._fact_offset)
+            self._file.write(struct.pack("<I", self.frames))
+        self._file.seek(self._data_offset - 4)
+        self._file.write(struct.pack("<I", data_size))
+        self._file.close()
+        self.closed = True
+
+    def _data_size(self) -> int:
+        return self.frames * self.channels * WavWriter.FORMATS[self.dtype][1]
+
+    def _write_header(self) -> None:
+        format_tag, sample_bytes = WavWriter.FORMATS[self.dtype]
+        block_align = self.channels * sample_bytes
+        fmt_data = struct.pack("<HHIIHH", format_tag, self.channels, int(self.samp_rate),
+                               int(self.samp_rate) * block_align, block_align, 8 * sample_bytes)
+        if format_tag != 1:
+            # Non-PCM formats carry a cbSize field and a fact chunk
+            fmt_data += struct.pack("<H", 0)
+
+        header = b"RIFF" + struct.pack("<I", 0) + b"WAVE"
+        header += b"fmt " + struct.pack("<I", len(fmt_data)) + fmt_data
+        self._fact_offset = None
+        if format_tag != 1:
+            header += b"fact" + struct.pack("<I", 4)
+            self._fact_offset = len(header)
+            header += struct.pack("<I", 0)
+        header += b"data" + struct.pack("<I", 0)
+        self._data_offset = len(header)
+        self._file.write(header)
+        self._header_written = True
+
+    def _encode(self, block: np.ndarray) -> bytes:
+        if self.dtype == "float32":
+            block = np.real(block)
+            scaled = block / self.full_scale if self.full_scale != 1 else block
+            return np.ascontiguousarray(scaled, dtype="<f4").tobytes()
+
+        bits = 8 * WavWriter.FORMATS[self.dtype][1]
+        max_int = 2 ** (bits - 1) - 1
+        scaled = np.clip(np.real(block) * (max_int / self.full_scale), -max_int - 1, max_int)
+        ints = np.rint(scaled).astype("<i4")
+        if self.dtype == "int16":
+            return ints.astype("<i2").tobytes()
+        # 24 bit samples are the three lowest bytes of each little
+        # endian 32 bit integer
+        return ints.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
@@ -0,0 +1,250 @@
+"""Module for the lazy evaluation of expressions of signals.
+
+Operating signals eagerly creates a full signal for every intermediate
+result (e.g `(1 + x) * carrier` allocates `1 + x` before multiplying).
+A lazy expression only records the operations, and computes all of
+them at once when `compute` is called:
+
+>>> modulated = ((1 + x.lazy()) * carrier).compute()
+
+The axes of the signals are checked once, and the expression is
+evaluated with numexpr if it is installed, or otherwise with NumPy in
+chunks small enough to keep the temporaries in cache.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from numbers import Number
+import numpy as np
+
+from chirper.config import LAZY_CHUNK_SIZE
+from chirper.exceptions import DimensionError
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+if TYPE_CHECKING:
+    from chirper.sgn import Signal
+
+OPERATIONS = {
+    # name: (NumPy function, numexpr template)
+    "add": (np.add, "({} + {})"),
+    "sub": (np.subtract, "({} - {})"),
+    "mul": (np.multiply, "({} * {})"),
+    "div": (np.true_divide, "({} / {})"),
+    "pow": (np.power, "({} ** {})"),
+    "neg": (np.negative, "(-{})"),
+    "abs": (np.abs, "abs({})"),
+}
+
+# Types numexpr operates natively, any other one is evaluated with NumPy
+NUMEXPR_DTYPES = tuple(np.dtype(dtype) for dtype in (
+    np.bool_, np.int32, np.int64, np.float32, np.float64, np.complex128))
+
+
+class LazySignal:
+    """Expression of signals that is evaluated on demand.
+
+    It is created with `Signal.lazy()`, and supports the arithmetic
+    operators with other signals, lazy signals and numbers. Every
+    signal in the expression must have the same axes.
+    """
+
+    def __init__(self, signal: Signal = None, operation=None, operands=()):
+        """Creates a lazy expression.
+
+        Parameters
+        ----------
+        signal : Signal, optional
+            Signal represented by this expression if it is a leaf, by
+            default None.
+        operation : str, optional
+            Name of the operation (one of `OPERATIONS`) applied to the
+            operands, by default None.
+        operands : tuple, optional
+            Lazy signals or numbers the operation is applied to, by
+            default ().
+        """
+        self.signal = signal
+        self.operation = operation
+        self.operands = operands
+
+    def __add__(self, other):
+        return self._operate("add", self, other)
+
+    def __radd__(self, other):
+        return self._operate("add", other, self)
+
+    def __sub__(self, other):
+        return self._operate("sub", self, other)
+
+    def __rsub__(self, other):
+        return self._operate("sub", other, self)
+
+    def __mul__(self, other):
+        return self._operate("mul", self, other)
+
+    def __rmul__(self, other):
+        return self._operate("mul", other, self)
+
+    def __truediv__(self, other):
+        return self._operate("div", self, other)
+
+    def __rtruediv__(self, other):
+        return self._operate("div", other, self)
+
+    def __pow__(self, other):
+        return self._operate("pow", self, other)
+
+    def __neg__(self):
+        return LazySignal(operation="neg", operands=(self,))
+
+    def __abs__(self):
+        return LazySignal(operation="abs", operands=(self,))
+
+    def __str__(self):
+        names = {id(leaf): f"x{i}" for i, leaf in enumerate(self._leaves())}
+        return self._expression(names, {})
+
+    @staticmethod
+    def _operate(operation, left, right):
+        operands = (LazySignal._wrap(left), LazySignal._wrap(right))
+        if any(operand is NotImplemented for operand in operands):
+            return NotImplemented
+        return LazySignal(operation=operation, operands=operands)
+
+    @staticmethod
+    def _wrap(operand):
+        # Numbers are kept as constants, and signals become leaves
+        if isinstance(operand, LazySignal):
+            return operand
+        if isinstance(operand, (Number, np.generic)):
+            return operand
+        if hasattr(operand, "unpack"):
+            return LazySignal(operand)
+        return NotImplemented
+
+    def compute(self, chunksize=LAZY_CHUNK_SIZE, out=None) -> Signal:
+        """Evaluates the expression.
+
+        Parameters
+        ----------
+        chunksize : int, optional
+            Number of samples (or rows, for two dimensional signals)
+            evaluated at a time when numexpr is not available, by
+            default LAZY_CHUNK_SIZE.
+        out : Signal, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one.
+
+        Returns
+        -------
+        Signal
+            Result of the expression, with the axes of its signals.
+
+        Raises
+        ------
+        DimensionError
+            If the signals of the expression don't have the same axes.
+        """
+        leaves = self._leaves()
+        first = leaves[0]
+        self._check_axes(leaves)
+        names = {id(leaf): f"x{i}" for i, leaf in enumerate(leaves)}
+        arrays = {names[id(leaf)]: leaf.values for leaf in leaves}
+
+        if self._uses_numexpr(arrays):
+            constants = {}
+            expression = self._expression(names, constants)
+            local_dict = {**arrays, **constants}
+            if out is None:
+                return first._like(numexpr.evaluate(expression, local_dict=local_dict))
+            output = first._out(out, out.values.dtype)
+            numexpr.evaluate(expression, local_dict=local_dict, out=output.values,
+                             casting="same_kind")
+            return output
+
+        length = len(first.values)
+        chunk = self._evaluate_chunk(names, arrays, slice(0, chunksize))
+        if out is None and length <= chunksize:
+            return first._like(np.array(chunk, copy=not self._is_temporary(chunk, arrays)))
+        output = first._out(out, chunk.dtype)
+        output.values[:chunksize] = chunk
+        for start in range(chunksize, length, chunksize):
+            chunk_slice = slice(start, start + chunksize)
+            output.values[chunk_slice] = self._evaluate_chunk(names, arrays, chunk_slice)
+        return output
+
+    def _leaves(self) -> list:
+        # Gets the signals of the expression, without repeating them
+        leaves = {}
+        pending = [self]
+        while pending:
+            node = pending.pop()
+            if not isinstance(node, LazySignal):
+                continue
+            if node.signal is not None:
+                leaves.setdefault(id(node.signal), node.signal)
+            pending.extend(reversed(node.operands))
+        return list(leaves.values())
+
+    @staticmethod
+    def _check_axes(leaves):
+        first_axes = leaves[0].unpack()[:-1]
+        for leaf in leaves[1:]:
+            for axis, other in zip(first_axes, leaf.unpack()[:-1]):
+                if axis is not other and not np.array_equal(axis, other):
+                    raise DimensionError("The axes of the signals in the expression do not match.",
+                                         np.shape(other), np.shape(axis))
+
+    def _uses_numexpr(self, arrays) -> bool:
+        if numexpr is None:
+            return False
+        if any(arr.dtype not in NUMEXPR_DTYPES for arr in arrays.values()):
+            return False
+        # The absolute value of complex numbers is complex in numexpr
+        is_complex = any(arr.dtype.kind == "c" for arr in arrays.values())
+        return not (is_complex and "abs" in self._operations())
+
+    def _operations(self) -> set:
+        if self.operation is None:
+            return set()
+        operations = {self.operation}
+        for operand in self.operands:
+            if isinstance(operand, LazySignal):
+                operations |= operand._operations()
+        return operations
+
+    def _expression(self, names, constants) -> str:
+        if self.signal is not None:
+            return names[id(self.signal)]
+        terms = []
+        for operand in self.operands:
+            if isinstance(operand, LazySignal):
+                terms.append(operand._expression(names, constants))
+            else:
+                name = f"c{len(constants)}"
+                constants[name] = operand
+                terms.append(name)
+        return OPERATIONS[self.operation][1].format(*terms)
+
+    def _evaluate_chunk(self, names, arrays, chunk_slice) -> np.ndarray:
+        if self.signal is not None:
+            return arrays[names[id(self.signal)]][chunk_slice]
+        function = OPERATIONS[self.operation][0]
+        terms = [
+            operand._evaluate_chunk(names, arrays, chunk_slice)
+            if isinstance(operand, LazySignal) else operand
+            for operand in self.operands
+        ]
+        # Intermediate results are reused as the output when possible
+        for term in terms:
+            if isinstance(term, np.ndarray) and self._is_temporary(term, arrays):
+                try:
+                    return function(*terms, out=term)
+                except (TypeError, ValueError):
+                    break
+        return function(*terms)
+
+    @staticmethod
+    def _is_temporary(arr, arrays) -> bool:
+        return not any(np.may_share_memory(arr, values) for values in arrays.values())
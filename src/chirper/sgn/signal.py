@@ -3,6 +3,10 @@ import numpy as np
 import abc
 from copy import deepcopy
 
+from chirper.exceptions import DimensionError
+from chirper.sgn.lazy import LazySignal
+from chirper.utils import dispatching, dtypes
+
 
 class Signal(abc.ABC):
     """Abstract class representing a signal object of arbitrary dimensions."""
@@ -110,40 +114,157 @@ class Signal(abc.ABC):
         """Makes a copy of this signal."""
         return deepcopy(self)
 
-    def psd(self) -> Signal:
+    def psd(self, out=None) -> Signal:
         """Generates the PSD (Power Spectral Density) of the signal.
 
+        Parameters
+        ----------
+        out : Signal, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one. It can be this same
+            signal.
+
         Returns
         -------
         Signal
             Signal representing the PSD.
         """
-        copy = self.clone()
-        copy.values = (copy.values.conjugate() * copy.values).real
-        return copy
+        out = self._out(out, np.real(self.values).dtype)
+        np.abs(self.values, out=out.values)
+        return out._operate_inplace(out.values, np.multiply)
 
     def abs(self) -> Signal:
         """Takes the absolute value of the values."""
         return self.__abs__()
 
-    def real_part(self) -> Signal:
-        """Takes the real part of the values."""
-        copy = self.clone()
-        copy.values = np.real(copy.values)
-        return copy
+    def real_part(self, out=None) -> Signal:
+        """Takes the real part of the values.
 
-    def imag_part(self) -> Signal:
-        """Takes the imaginary part of the values."""
-        copy = self.clone()
-        copy.values = np.imag(copy.values)
-        return copy
+        Parameters
+        ----------
+        out : Signal, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one.
+        """
+        out = self._out(out, np.real(self.values).dtype)
+        np.copyto(out.values, np.real(self.values), casting="same_kind")
+        return out
 
-    def conjugate(self) -> Signal:
-        """Takes the conjugate of the values."""
-        copy = self.clone()
-        copy.values = copy.values.conjugate()
-        return copy
+    def imag_part(self, out=None) -> Signal:
+        """Takes the imaginary part of the values.
+
+        Parameters
+        ----------
+        out : Signal, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one.
+        """
+        out = self._out(out, np.real(self.values).dtype)
+        np.copyto(out.values, np.imag(self.values), casting="same_kind")
+        return out
+
+    def conjugate(self, out=None) -> Signal:
+        """Takes the conjugate of the values.
+
+        Parameters
+        ----------
+        out : Signal, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one. It can be this same
+            signal.
+        """
+        out = self._out(out, self.values.dtype)
+        np.conjugate(self.values, out=out.values)
+        return out
+
+    def lazy(self) -> LazySignal:
+        """Starts a lazy expression with this signal.
+
+        Operations on the returned object are recorded instead of
+        evaluated, and are computed at once, without intermediate
+        signals, when calling its `compute` method.
+
+        Example
+        -------
+        >>> modulated = ((1 + x.lazy()) * carrier).compute()
+
+        Returns
+        -------
+        LazySignal
+            Expression holding only this signal.
+        """
+        return LazySignal(self)
 
     def shape(self) -> tuple:
         """Gets the shape of this signal."""
         return np.shape(self.values)
+
+    @abc.abstractmethod
+    def _like(self, values: np.ndarray) -> Signal:
+        """Creates a signal with a copy of the axes of this one and the
+        given values."""
+        pass
+
+    @abc.abstractmethod
+    def _same_axes(self, signal: Signal) -> bool:
+        """Checks whether the given signal has the same axes."""
+        pass
+
+    @abc.abstractmethod
+    def _interp_operation(self, signal: Signal, operation, *args) -> Signal:
+        """Operates with a signal with different axes, interpolating
+        both on the union of their axes."""
+        pass
+
+    def _operate(self, other, operation, *args, reflected=False) -> Signal:
+        # Operates the values with a number, an array or another signal,
+        # returning NotImplemented for other types so Python can try the
+        # reflected operation (e.g of a `LazySignal`)
+        kind = dispatching.operand_kind(other)
+        if kind is dispatching.SIGNAL:
+            if not self._same_axes(other):
+                return self._interp_operation(other, operation, *args)
+            other = other.values
+        elif kind is None:
+            return NotImplemented
+        values = operation(other, self.values) if reflected else operation(self.values, other)
+        return self._like(values)
+
+    def _do_inplace_operation(self, other, operation) -> Signal:
+        # Signals with the same axes are operated in the current buffer,
+        # otherwise the result is interpolated on the union of the axes
+        kind = dispatching.operand_kind(other)
+        if kind is dispatching.SIGNAL:
+            if not self._same_axes(other):
+                result = self._interp_operation(other, operation)
+                vars(self).update(vars(result))
+                return self
+            other = other.values
+        elif kind is None:
+            return NotImplemented
+        return self._operate_inplace(other, operation)
+
+    def _out(self, out: Signal, dtype) -> Signal:
+        # Gets the signal where a result with the shape of this one is
+        # stored, reusing the buffers of `out` if it is given
+        if out is None:
+            return self._like(np.empty(self.shape(), dtype=dtype))
+        if out.shape() != self.shape():
+            raise DimensionError("The shape of the output does not match.", out.shape(), self.shape())
+        if out is not self:
+            for axis, out_axis in zip(self.unpack()[:-1], out.unpack()[:-1]):
+                np.copyto(out_axis, axis)
+        return out
+
+    def _operate_inplace(self, other, operation) -> Signal:
+        # Writes the result into the current values when their type can
+        # hold it, otherwise they are replaced by a new array
+        if self.values.flags.writeable:
+            try:
+                operation(self.values, other, out=self.values)
+                return self
+            except TypeError:
+                # The result can't be cast to the current type
+                pass
+        self.values = dtypes.cast(operation(self.values, other))
+        return self
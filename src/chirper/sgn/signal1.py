@@ -2,15 +2,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 import numpy as np
 import bisect
-import operator
 from tqdm import tqdm
-from numbers import Number, Real
-from multipledispatch import dispatch
+from numbers import Real
 
 from chirper.exceptions import DimensionError
+from chirper.filters import moving, resample
 from chirper.config import CONVOLUTION_METHOD, INTERP1_METHOD, CROSS_CORRELATION_METHOD
-from chirper.utils import math_lib
-from chirper.sgn.handlers import handler_csv, handler_json, handler_wav
+from chirper.utils import dtypes, math_lib
+from chirper.sgn.handlers import handler_archive, handler_bin, handler_csv, handler_json, handler_numpy, handler_wav
 from chirper.sgn.signal import Signal
 
 
@@ -20,9 +19,13 @@ class Signal1(Signal):
         "csv": handler_csv,
         "json": handler_json,
         "wav": handler_wav,
+        "npy": handler_numpy,
+        "npz": handler_numpy,
+        "bin": handler_bin,
+        "chirp": handler_archive,
     }
 
-    def __init__(self, axis: np.ndarray, values: np.ndarray):
+    def __init__(self, axis: np.ndarray, values: np.ndarray, copy=True):
         """Creates a signal from an independent axis and a values list.
 
         Parameters
@@ -33,6 +36,11 @@ class Signal1(Signal):
         values : array_like
             List of elements representing the dependent variable for
             each axis element.
+        copy : bool, optional
+            Whether to copy `axis` and `values`, by default True. If
+            False, arrays are used as they are (e.g to keep memory
+            mapped files without reading them). In both cases the
+            values are cast to the type of `config.DTYPE_POLICY`.
 
         Raises
         ------
@@ -43,69 +51,58 @@ class Signal1(Signal):
         if len(axis) != len(values):
             raise DimensionError(
                 "The dimensions of the values do not match.", len(values), len(axis))
-        self.axis = np.array(axis)
-        self.values = np.array(values)
+        self.axis = np.array(axis) if copy else np.asarray(axis)
+        self.values = dtypes.cast(np.array(values) if copy else np.asarray(values))
 
     def __getitem__(self, key):
         return self.values[key]
 
-    @dispatch(slice)
-    def __call__(self, key):
-        # Slices the indices based on the given key, then intersects
-        # them to get all the indices
-        indices1 = np.where(
-            key.start <= self.axis if key.start else self.axis)
-        indices2 = np.where(
-            self.axis <= key.stop if key.stop else self.axis)
-        indices = np.intersect1d(indices1, indices2)
-        return [self.values[i] for i in indices]
-
     def __call__(self, key, inter_method=INTERP1_METHOD):
+        if isinstance(key, slice):
+            # Gets the values whose axis lies within the slice
+            mask = np.ones(len(self), dtype=bool)
+            if key.start is not None:
+                mask &= key.start <= self.axis
+            if key.stop is not None:
+                mask &= self.axis <= key.stop
+            return self.values[mask]
         return self.interpolate(key, inter_method)[2]
 
-    def __radd__(self, num):
-        return self.__add__(num)
+    def __add__(self, other):
+        return self._operate(other, np.add)
 
-    @dispatch(Number)
-    def __add__(self, value):
-        return Signal1(self.axis, self.values + value)
+    def __radd__(self, other):
+        return self._operate(other, np.add, reflected=True)
 
-    @dispatch(object)
-    def __add__(self, signal):
-        return Signal1(*self._do_bin_operation(signal, operator.add))
+    def __sub__(self, other):
+        return self._operate(other, np.subtract)
 
-    def __rsub__(self, num):
-        return num + self * -1
+    def __rsub__(self, other):
+        return self._operate(other, np.subtract, reflected=True)
 
-    @dispatch(Number)
-    def __sub__(self, value):
-        return Signal1(self.axis, self.values - value)
+    def __mul__(self, other):
+        return self._operate(other, np.multiply)
 
-    @dispatch(object)
-    def __sub__(self, signal):
-        return Signal1(*self._do_bin_operation(signal, operator.sub))
+    def __rmul__(self, other):
+        return self._operate(other, np.multiply, reflected=True)
 
-    def __rmul__(self, num):
-        return self.__mul__(num)
+    def __truediv__(self, other):
+        return self._operate(other, np.true_divide)
 
-    @dispatch(Number)
-    def __mul__(self, value):
-        return Signal1(self.axis, self.values * value)
+    def __rtruediv__(self, other):
+        return self._operate(other, np.true_divide, reflected=True)
 
-    @dispatch(object)
-    def __mul__(self, signal):
-        return Signal1(*self._do_bin_operation(signal, operator.mul))
+    def __iadd__(self, other):
+        return self._do_inplace_operation(other, np.add)
 
-    def __rtruediv__(self, num):
-        return Signal1(self.axis, num / self.values)
+    def __isub__(self, other):
+        return self._do_inplace_operation(other, np.subtract)
 
-    @dispatch(Number)
-    def __truediv__(self, value):
-        return Signal1(self.axis, self.values / value)
+    def __imul__(self, other):
+        return self._do_inplace_operation(other, np.multiply)
 
-    @dispatch(object)
-    def __truediv__(self, signal):
-        return Signal1(*self._do_bin_operation(signal, operator.truediv))
+    def __itruediv__(self, other):
+        return self._do_inplace_operation(other, np.true_divide)
 
     def __eq__(self, signal):
         return (
@@ -117,7 +114,7 @@ class Signal1(Signal):
         return f"{self.axis}\n{self.values}"
 
     def __abs__(self):
-        return Signal1(self.axis, list(map(operator.abs, self.values)))
+        return Signal1(self.axis, np.abs(self.values))
 
     def __len__(self):
         return len(self.axis)
@@ -138,8 +135,19 @@ class Signal1(Signal):
             new_values = np.append(new_values, operation(y1, y2))
         return axis_list, new_values
 
+    def _same_axes(self, signal) -> bool:
+        return isinstance(signal, Signal1) and (
+            self.axis is signal.axis or np.array_equal(self.axis, signal.axis))
+
+    def _interp_operation(self, signal, operation, inter_method=INTERP1_METHOD) -> Signal1:
+        return Signal1(*self._do_bin_operation(signal, operation, inter_method), copy=False)
+
+    def _like(self, values: np.ndarray) -> Signal1:
+        return Signal1(self.axis.copy(), values, copy=False)
+
     @classmethod
-    def from_function(cls, axis: np.ndarray, func, *args, **kwargs):
+    def from_function(cls, axis: np.ndarray, func, *args, vectorize=False,
+                      chunksize=None, **kwargs):
         """Creates a signal from an axis list and a function.
 
         The function is applied to each element in the axis, so if the
@@ -152,9 +160,19 @@ class Signal1(Signal):
             List of elements representing the independent variable
             (usually time).
         func : function
-            Function to apply to each element.
+            Function to apply to each element. It is called once with
+            the whole axis, unless `vectorize` is True.
+        vectorize : bool, optional
+            Whether to call the function once per element, for
+            functions that only accept scalars, by default False.
+        chunksize : int, optional
+            If given, the function is evaluated in blocks of this many
+            elements, by default None.
         """
-        return cls(axis, func(np.array(axis), *args, **kwargs))
+        axis = np.asarray(axis)
+        values = math_lib.map_function(func, axis, args=args, kwargs=kwargs,
+                                       vectorize=vectorize, chunksize=chunksize)
+        return cls(axis, values, copy=False)
 
     @classmethod
     def from_file(cls, filename: str, *args, **kwargs):
@@ -180,7 +198,7 @@ class Signal1(Signal):
             raise ValueError()
         return cls(*Signal1.handlers[extension].import_signal1(
             filename, *args, **kwargs
-        ))
+        ), copy=False)
 
     @classmethod
     def from_freq(cls, values: np.ndarray, sf=1, sp=0):
@@ -201,45 +219,21 @@ class Signal1(Signal):
         axis = samp_period * np.arange(len(vals)) - sp
         return cls(axis, vals)
 
-    @dispatch(Number, str)
-    def add(self, value, method=INTERP1_METHOD, *args, **kwargs):
-        """Adds this signal with another value."""
-        return Signal1(self.axis, self.values + value)
-
-    @dispatch(object, str)
-    def add(self, signal, method=INTERP1_METHOD):
+    def add(self, other, method=INTERP1_METHOD):
         """Adds this signal with another value."""
-        return Signal1(*self._do_bin_operation(signal, operator.add, method))
+        return self._operate(other, np.add, method)
 
-    @dispatch(Number, str)
-    def sub(self, value, method=INTERP1_METHOD):
+    def sub(self, other, method=INTERP1_METHOD):
         """Subtracts this signal with another value."""
-        return Signal1(self.axis, self.values - value)
+        return self._operate(other, np.subtract, method)
 
-    @dispatch(object, str)
-    def sub(self, signal, method=INTERP1_METHOD, *args, **kwargs):
-        """Subtracts this signal with another value."""
-        return Signal1(*self._do_bin_operation(signal, operator.sub, method, *args, **kwargs))
-
-    @dispatch(Number, str)
-    def mul(self, value, method=INTERP1_METHOD, *args, **kwargs):
-        """Multiplies this signal with another value."""
-        return Signal1(self.axis, self.values * value)
-
-    @dispatch(object, str)
-    def mul(self, signal, method=INTERP1_METHOD, *args, **kwargs):
+    def mul(self, other, method=INTERP1_METHOD):
         """Multiplies this signal with another value."""
-        return Signal1(*self._do_bin_operation(signal, operator.mul, method, *args, **kwargs))
-
-    @dispatch(Number, str)
-    def div(self, value, method=INTERP1_METHOD, *args, **kwargs):
-        """Divides this signal with another value."""
-        return Signal1(self.axis, self.values / value)
+        return self._operate(other, np.multiply, method)
 
-    @dispatch(object, str)
-    def div(self, signal, method=INTERP1_METHOD, *args, **kwargs):
+    def div(self, other, method=INTERP1_METHOD):
         """Divides this signal with another value."""
-        return Signal1(*self._do_bin_operation(signal, operator.truediv, method, *args, **kwargs))
+        return self._operate(other, np.true_divide, method)
 
     def sampling_freq(self) -> float:
         """Calculates the sampling frequency in hertz, assuming it is constant."""
@@ -357,7 +351,8 @@ class Signal1(Signal):
     def rect_smooth(self, factor: int) -> Signal1:
         """Directly applies a rectangular smoothing to the signal.
 
-        With this method the edges of the signal look a bit rough.
+        With this method the edges of the signal look a bit rough. See
+        `chirper.filters.moving` for other moving-window filters.
 
         Parameters
         ----------
@@ -369,70 +364,60 @@ class Signal1(Signal):
         Signal1
             Smooth signal.
         """
-        copy = self.clone()
-        if factor % 2 != 1 or factor <= 1:
-            raise ValueError("The smoothing factor must be an odd number.")
-        shift = int((factor - 1) / 2)
-        self_len = len(copy)
-        new_values = copy.values[0:1]               # Copies the first element
-
-        # Smooths the first elements with the only possible elements
-        for n in range(1, shift):
-            arr = copy.values[0:2 * n + 1]
-            new_values = np.append(new_values, arr.sum() / (2 * n + 1))
-
-        # Smooths the other elements using the given factor
-        for n in range(shift, self_len - shift):
-            arr = copy.values[n - shift:n + shift + 1]
-            new_values = np.append(new_values, arr.sum() / factor)
-
-        # Smooths the last elements adapting the smoothing factor
-        for n in range(self_len - shift, self_len):
-            new_shift = self_len - n - 1
-            arr = copy.values[n - new_shift:self_len]
-            new_values = np.append(new_values, arr.sum() / (2 * new_shift + 1))
-
-        assert self_len == len(
-            new_values), "There was an error during the smoothing."
-        copy.values = new_values
-        return copy
+        return moving.rect_smooth(self, factor)
 
-    def apply_function(self, func, *args, **kwargs) -> Signal1:
+    def apply_function(self, func, *args, vectorize=False, chunksize=None,
+                       **kwargs) -> Signal1:
         """Applies a function to the values of the signal.
 
         Parameters
         ----------
         func : function
-            Function to apply to the signal.
+            Function to apply to the signal. It is called once with all
+            the values, unless `vectorize` is True.
+        vectorize : bool, optional
+            Whether to call the function once per value, for functions
+            that only accept scalars, by default False.
+        chunksize : int, optional
+            If given, the function is evaluated in blocks of this many
+            values, by default None.
 
         Returns
         -------
         Signal1
             Modified signal.
         """
-        copy = self.clone()
-        copy.values = np.array([func(x, *args, **kwargs) for x in copy.values])
-        return copy
+        values = math_lib.map_function(func, self.values, args=args, kwargs=kwargs,
+                                       vectorize=vectorize, chunksize=chunksize)
+        return Signal1(self.axis, values, copy=False)
 
-    def apply_function_tuple(self, func, *args, **kwargs) -> Signal1:
+    def apply_function_tuple(self, func, *args, vectorize=False, chunksize=None,
+                             **kwargs) -> Signal1:
         """Applies a function to both the axis and values of the signal.
 
         Parameters
         ----------
         func : function
-            Function to apply to the signal.
+            Function to apply to the signal, as `func(axis, values)`. It
+            is called once with the whole arrays, unless `vectorize` is
+            True.
+        vectorize : bool, optional
+            Whether to call the function once per sample, for functions
+            that only accept scalars, by default False.
+        chunksize : int, optional
+            If given, the function is evaluated in blocks of this many
+            samples, by default None.
 
         Returns
         -------
         Signal1
             Modified signal.
         """
-        copy = self.clone()
-        copy.values = np.array([func(t, x, *args, **kwargs)
-                                for t, x in zip(copy.axis, copy.values)])
-        return copy
+        values = math_lib.map_function(func, self.axis, self.values, args=args, kwargs=kwargs,
+                                       vectorize=vectorize, chunksize=chunksize)
+        return Signal1(self.axis, values, copy=False)
 
-    def convolute(self, signal1: Signal1, method=CONVOLUTION_METHOD) -> Signal1:
+    def convolute(self, signal1: Signal1, method=CONVOLUTION_METHOD, out=None) -> Signal1:
         """Convolute this signal with another.
 
         Parameters
@@ -442,16 +427,19 @@ class Signal1(Signal):
         method : {"fft", "direct"}, optional
             Method utilized to calculate the convolution, by
             default CONVOLUTION_METHOD.
+        out : Signal1, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one.
 
         Returns
         -------
         Signal1
             Convoluted signal.
         """
-        return math_lib.convolution(self, signal1, method)
+        return math_lib.convolution(self, signal1, method, out)
 
     def cross_correlate(self, signal1: Signal1,
-                        method=CROSS_CORRELATION_METHOD) -> Signal1:
+                        method=CROSS_CORRELATION_METHOD, out=None) -> Signal1:
         """Cross-correlates this signal with another.
 
         Parameters
@@ -461,15 +449,18 @@ class Signal1(Signal):
         method : {"direct"}, optional
             Method utilized to calculate the cross-correlation, by
             default CROSS_CORRELATION_METHOD.
+        out : Signal1, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one.
 
         Returns
         -------
         Signal1
             Cross-correlated signal.
         """
-        return math_lib.cross_correlation(self, signal1, method)
+        return math_lib.cross_correlation(self, signal1, method, out)
 
-    def auto_correlate(self, method=CROSS_CORRELATION_METHOD) -> Signal1:
+    def auto_correlate(self, method=CROSS_CORRELATION_METHOD, out=None) -> Signal1:
         """Auto-correlates this signal.
 
         Parameters
@@ -477,19 +468,75 @@ class Signal1(Signal):
         method : {"direct"}, optional
             Method utilized to calculate the auto-correlation, by
             default CROSS_CORRELATION_METHOD.
+        out : Signal1, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one.
 
         Returns
         -------
         Signal1
             Auto-correlated signal.
         """
-        return math_lib.cross_correlation(self, self, method)
+        return math_lib.cross_correlation(self, self, method, out)
+
+    def resample_poly(self, up: int, down: int, *args, **kwargs) -> Signal1:
+        """Resamples this signal by the rational factor `up / down`. See
+        `chirper.filters.resample.resample_poly` for the parameters."""
+        return resample.resample_poly(self, up, down, *args, **kwargs)
+
+    def resample_rate(self, samp_freq: float, *args, **kwargs) -> Signal1:
+        """Resamples this signal to the given sampling frequency. See
+        `chirper.filters.resample.resample_rate` for the parameters."""
+        return resample.resample_rate(self, samp_freq, *args, **kwargs)
+
+    def decimate(self, factor: int, *args, **kwargs) -> Signal1:
+        """Downsamples this signal by an integer factor. See
+        `chirper.filters.resample.decimate` for the parameters."""
+        return resample.decimate(self, factor, *args, **kwargs)
+
+    def periodogram(self, *args, **kwargs) -> Signal1:
+        """Estimates the PSD of this signal with a single frame. See
+        `chirper.transforms.psd.periodogram` for the parameters."""
+        from chirper.transforms import psd
+        return psd.periodogram(self, *args, **kwargs)
+
+    def welch(self, *args, **kwargs) -> Signal1:
+        """Estimates the PSD of this signal averaging overlapping
+        windowed frames. See `chirper.transforms.psd.welch` for the
+        parameters."""
+        from chirper.transforms import psd
+        return psd.welch(self, *args, **kwargs)
+
+    def bartlett(self, *args, **kwargs) -> Signal1:
+        """Estimates the PSD of this signal averaging contiguous frames.
+        See `chirper.transforms.psd.bartlett` for the parameters."""
+        from chirper.transforms import psd
+        return psd.bartlett(self, *args, **kwargs)
+
+    def shift(self, value, out=None) -> Signal1:
+        """Shifts the axis by `value`.
 
-    def shift(self, value) -> Signal1:
-        """Shifts the axis by `value`."""
-        copy = self.clone()
-        copy.axis += value
-        return copy
+        Parameters
+        ----------
+        value : float
+            Amount to shift the axis.
+        out : Signal1, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one. It can be this same
+            signal, which shifts it in place.
+
+        Returns
+        -------
+        Signal1
+            Shifted signal.
+        """
+        if out is None:
+            return Signal1(self.axis + value, self.values)
+        out = self._out(out, self.values.dtype)
+        np.add(out.axis, value, out=out.axis)
+        if out is not self:
+            np.copyto(out.values, self.values)
+        return out
 
     def export_to_file(self, filename: str, *args, **kwargs):
         """Exports the one dimensional signal to the given file.
@@ -510,28 +557,63 @@ class Signal1(Signal):
         Signal1.handlers[extension].export_signal1(
             filename, self, *args, **kwargs)
 
-    def apply_window(self, window: Signal1, center: Real,
-                     interp_method=INTERP1_METHOD, *args,
+    def apply_window(self, window, center: Real,
+                     interp_method=INTERP1_METHOD, *args, out=None,
                      **kwargs) -> Signal1:
         """Applies a window function to the signal.
 
         For this implementation it is assumed that the window function
         is zero outside of its given axis.
 
+        If the signal is uniformly sampled, the range of samples covered
+        by the window is found with index arithmetic, and only that
+        slice is multiplied by the window sampled on the grid. Otherwise
+        the window signal is interpolated onto the signal.
+
         Parameters
         ----------
-        window : Signal1
-            Window signal.
+        window : Signal1 or np.ndarray
+            Window signal centered at zero, or window values sampled on
+            the grid of the signal (see `chirper.utils.window`), whose
+            middle sample is placed at `center`. Arrays can only be
+            applied to uniformly sampled signals.
         center : Real
             Center point where the window is applied.
         interp_method : string, optional
             Method used for the interpolation, by default INTERP1_METHOD
+        out : Signal1, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one. Only used for
+            uniformly sampled signals, and it can be the signal itself.
 
         Returns
         -------
         Signal1
             Signal after applying the window.
+
+        Raises
+        ------
+        ValueError
+            If an array window is given for a signal that isn't
+            uniformly sampled.
         """
+        step = math_lib.uniform_step(self.axis)
+        if step is not None:
+            w_values = self._window_values(window, step)
+            start = self._window_start(center, step, len(w_values))
+            stop = start + len(w_values)
+            # The window is clipped to the range of the signal
+            w_values = w_values[max(-start, 0):len(w_values) - max(stop - len(self), 0)]
+            start, stop = max(start, 0), min(stop, len(self))
+
+            output = self._out(out, np.result_type(self.values, w_values))
+            np.multiply(self.values[start:stop], w_values, out=output.values[start:stop])
+            output.values[:start] = 0
+            output.values[stop:] = 0
+            return output
+
+        if isinstance(window, np.ndarray):
+            raise ValueError("Array windows can only be applied to uniformly sampled signals.")
         w_span = window.span()
         copy = self.clone()
 
@@ -550,6 +632,52 @@ class Signal1(Signal):
 
         return l_signal.concatenate(c_signal, r_signal)
 
+    def apply_windows(self, window, centers, out=None):
+        """Applies the same window at several centers at once, keeping
+        only the samples covered by the window.
+
+        The signal must be uniformly sampled.
+
+        Parameters
+        ----------
+        window : Signal1 or np.ndarray
+            Window signal centered at zero, or window values sampled on
+            the grid of the signal (see `apply_window`).
+        centers : array_like
+            Center points where the window is applied.
+        out : np.ndarray, optional
+            Array with shape `(len(centers), len(window))` where the
+            frames are stored, by default None, which creates a new one.
+
+        Returns
+        -------
+        np.ndarray, np.ndarray
+            Windowed frames, one per row (padded with zeros past the
+            edges of the signal), and the index of the signal where each
+            frame starts.
+
+        Raises
+        ------
+        ValueError
+            If the signal is not uniformly sampled.
+        """
+        step = math_lib.uniform_step(self.axis)
+        if step is None:
+            raise ValueError("Windows can only be applied at once to uniformly sampled signals.")
+        w_values = self._window_values(window, step)
+        starts = self._window_start(np.asarray(centers), step, len(w_values))
+        return math_lib.window_frames(self.values, w_values, starts, out), starts
+
+    def _window_values(self, window, step) -> np.ndarray:
+        if isinstance(window, np.ndarray):
+            return window
+        return math_lib.sample_window(window, step)
+
+    def _window_start(self, center, step, length):
+        # Index of the first sample covered by a window of the given
+        # length, whose middle sample is the closest one to `center`
+        return np.rint((center - self.axis[0]) / step).astype(int) - length // 2
+
     def get(self, start=None, stop=None) -> Signal1:
         """Gets a portion of the signal.
 
@@ -2,14 +2,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 import numpy as np
 import bisect
-import operator
-from numbers import Number, Real
-from multipledispatch import dispatch
 
 from chirper.exceptions import DimensionError
 from chirper.config import INTERP2_METHOD, KERNEL_OOB
-from chirper.utils import math_lib
-from chirper.sgn.handlers import handler_img
+from chirper.utils import dtypes, math_lib
+from chirper.sgn.handlers import handler_archive, handler_bin, handler_img, handler_numpy
 from chirper.sgn.signal import Signal
 
 
@@ -19,10 +16,14 @@ class Signal2(Signal):
         "jpeg": handler_img,
         "jpg": handler_img,
         "png": handler_img,
+        "npy": handler_numpy,
+        "npz": handler_numpy,
+        "bin": handler_bin,
+        "chirp": handler_archive,
     }
 
     def __init__(self, ax0: np.ndarray, ax1: np.ndarray,
-                 values: np.ndarray):
+                 values: np.ndarray, copy=True):
         """Creates a two dimensional signal by giving two axes and a
         matrix.
 
@@ -39,6 +40,11 @@ class Signal2(Signal):
         values : two-dimensional array_like
             Matrix that indicates the values of the signal for every
             point.
+        copy : bool, optional
+            Whether to copy the axes and `values`, by default True. If
+            False, arrays are used as they are (e.g to keep memory
+            mapped files without reading them). In both cases the
+            values are cast to the type of `config.DTYPE_POLICY`.
 
         Raises
         ------
@@ -72,65 +78,51 @@ class Signal2(Signal):
         if np.shape(values) != (len(ax0), len(ax1)):
             raise DimensionError("The dimensions of the values do not match.", np.shape(
                 values), (len(ax0), len(ax1)))
-        self.ax0 = np.array(ax0)
-        self.ax1 = np.array(ax1)
-        self.values = np.array(values)
+        self.ax0 = np.array(ax0) if copy else np.asarray(ax0)
+        self.ax1 = np.array(ax1) if copy else np.asarray(ax1)
+        self.values = dtypes.cast(np.array(values) if copy else np.asarray(values))
 
     def __getitem__(self, key):
         return self.values[key]
 
-    @dispatch(Real, Real)
-    def __call__(self, key_x, key_y):
-        return self.interpolate(key_x, key_y)[2]
-
-    @dispatch(Real, Real, str)
     def __call__(self, key_x, key_y, interp_method=INTERP2_METHOD):
-        return self.interpolate(key_x, key_y, method=interp_method)[2]
+        return self.interpolate(key_x, key_y, interp_method)[2]
 
-    def __radd__(self, num):
-        return self.__add__(num)
+    def __add__(self, other):
+        return self._operate(other, np.add)
 
-    # TODO: Fix the REALLY slow speed when operating signals
-    @dispatch(Number)
-    def __add__(self, value):
-        return Signal2(self.ax0, self.ax1, self.values + value)
+    def __radd__(self, other):
+        return self._operate(other, np.add, reflected=True)
 
-    @dispatch(object)
-    def __add__(self, signal):
-        return Signal2(*self._do_bin_operation(signal, operator.add))
+    def __sub__(self, other):
+        return self._operate(other, np.subtract)
 
-    def __rsub__(self, num):
-        return num + self * -1
+    def __rsub__(self, other):
+        return self._operate(other, np.subtract, reflected=True)
 
-    @dispatch(Number)
-    def __sub__(self, value):
-        return Signal2(self.ax0, self.ax1, self.values - value)
+    def __mul__(self, other):
+        return self._operate(other, np.multiply)
 
-    @dispatch(object)
-    def __sub__(self, signal):
-        return Signal2(*self._do_bin_operation(signal, operator.sub))
+    def __rmul__(self, other):
+        return self._operate(other, np.multiply, reflected=True)
 
-    def __rmul__(self, num):
-        return self.__mul__(num)
+    def __truediv__(self, other):
+        return self._operate(other, np.true_divide)
 
-    @dispatch(Number)
-    def __mul__(self, value):
-        return Signal2(self.ax0, self.ax1, self.values * value)
+    def __rtruediv__(self, other):
+        return self._operate(other, np.true_divide, reflected=True)
 
-    @dispatch(object)
-    def __mul__(self, signal):
-        return Signal2(*self._do_bin_operation(signal, operator.mul))
+    def __iadd__(self, other):
+        return self._do_inplace_operation(other, np.add)
 
-    def __rtruediv__(self, num):
-        return Signal2(self.ax0, self.ax1, num / self.values)
+    def __isub__(self, other):
+        return self._do_inplace_operation(other, np.subtract)
 
-    @dispatch(Number)
-    def __truediv__(self, value):
-        return Signal2(self.ax0, self.ax1, self.values / value)
+    def __imul__(self, other):
+        return self._do_inplace_operation(other, np.multiply)
 
-    @dispatch(object)
-    def __truediv__(self, signal):
-        return Signal2(*self._do_bin_operation(signal, operator.truediv))
+    def __itruediv__(self, other):
+        return self._do_inplace_operation(other, np.true_divide)
 
     def __eq__(self, signal):
         return (
@@ -143,37 +135,50 @@ class Signal2(Signal):
         return f"{self.ax0}\n{self.ax1}\n{self.values}"
 
     def __abs__(self):
-        copy = self.clone()
-        copy.values = abs(copy.values)
-        return copy
+        return self._like(np.abs(self.values))
 
     def _do_bin_operation(self, signal, operation):
-        # Joins the axes of both signals
+        # Signals on the same grid are operated element-wise
+        if np.array_equal(self.ax0, signal.ax0) and np.array_equal(self.ax1, signal.ax1):
+            return self.ax0, self.ax1, operation(self.values, signal.values)
+
+        # Otherwise both are resampled on the union of their axes
         new_ax0 = np.union1d(self.ax0, signal.ax0)
         new_ax1 = np.union1d(self.ax1, signal.ax1)
-        new_ax0.sort()
-        new_ax1.sort()
-
-        new_values = new_ax1.copy()
-        for x in new_ax0:
-            row = np.array([])
-            for y in new_ax1:
-                # Interpolates the values
-                val1 = self(x, y)
-                val2 = signal(x, y)
-                # Operates using the interpolated values
-                row = np.append(row, operation(val1, val2))
-            new_values = np.vstack((new_values, row))
-        return new_ax0, new_ax1, new_values
+        values1 = self._values_on(new_ax0, new_ax1)
+        values2 = signal._values_on(new_ax0, new_ax1)
+        return new_ax0, new_ax1, operation(values1, values2)
+
+    def _same_axes(self, signal) -> bool:
+        return isinstance(signal, Signal2) and (
+            (self.ax0 is signal.ax0 or np.array_equal(self.ax0, signal.ax0))
+            and (self.ax1 is signal.ax1 or np.array_equal(self.ax1, signal.ax1)))
+
+    def _interp_operation(self, signal, operation) -> Signal2:
+        return Signal2(*self._do_bin_operation(signal, operation), copy=False)
+
+    def _like(self, values: np.ndarray) -> Signal2:
+        return Signal2(self.ax0.copy(), self.ax1.copy(), values, copy=False)
+
+    def _values_on(self, ax0, ax1):
+        # Gets the values on a grid, interpolating only if needed
+        if np.array_equal(self.ax0, ax0) and np.array_equal(self.ax1, ax1):
+            return self.values
+        return math_lib.bilinear_resample(self.ax0, self.ax1, self.values, ax0, ax1)
 
     @classmethod
-    def from_function(cls, ax0, ax1, func, *args, **kwargs):
+    def from_function(cls, ax0, ax1, func, *args, vectorize=False, chunksize=None, **kwargs):
         """Creates a signal from two axes and a function.
 
         The function is applied to each element in the axis, so
         if the function `f(x, y) = x**2 + y**2` is given as a parameter to
         the axes `[1, 2, 3]` and `[-1, -2, -3]`, the values would be the
-        matrix `[[2, 5, 10], [5, 8, 13], [10, 13, 18]]`.
+        matrix `[[2, 5, 10], [5, 8, 13], [10, 13, 18]]`, where `x` runs
+        along the rows (`ax0`) and `y` along the columns (`ax1`).
+
+        The function is called once with `x` as a column and `y` as a
+        row, so NumPy broadcasting evaluates it on the whole grid
+        without building it.
 
         Parameters
         ----------
@@ -183,10 +188,18 @@ class Signal2(Signal):
             Second on which the function is mapped.
         func : function
             Function to map to the axes.
+        vectorize : bool, optional
+            Whether to call the function once per point, for functions
+            that only accept scalars, by default False.
+        chunksize : int, optional
+            If given, the function is evaluated in blocks of this many
+            rows, by default None.
         """
-        values = np.array([[func(x, y, *args, **kwargs)
-                          for x in ax0] for y in ax1])
-        return cls(ax0, ax1, values)
+        ax0 = np.asarray(ax0)
+        ax1 = np.asarray(ax1)
+        values = math_lib.map_function(func, ax0[:, None], ax1[None, :], args=args, kwargs=kwargs,
+                                       vectorize=vectorize, chunksize=chunksize)
+        return cls(ax0, ax1, values, copy=False)
 
     @classmethod
     def from_file(cls, filename: str, *args, **kwargs):
@@ -202,7 +215,29 @@ class Signal2(Signal):
         extension = filename.split(".")[-1]
         if extension == filename:
             raise ValueError()
-        return cls(*Signal2.handlers[extension].import_signal2(filename, *args, **kwargs))
+        return cls(*Signal2.handlers[extension].import_signal2(filename, *args, **kwargs),
+                   copy=False)
+
+    @classmethod
+    def from_dir(cls, dirname: str, *args, **kwargs) -> list:
+        """Creates a batch of signals from every image in a directory.
+
+        The images are read in parallel into a single stacked array,
+        and each signal is a view of its slice of it. The parameters
+        are the ones of `handler_img.import_signal2_batch`.
+
+        Parameters
+        ----------
+        dirname : str
+            Directory to read the images from.
+
+        Returns
+        -------
+        list[Signal2]
+            Signals read, sorted by file name.
+        """
+        ax0, ax1, stack, _ = handler_img.import_signal2_batch(dirname, *args, **kwargs)
+        return [cls(ax0, ax1, values, copy=False) for values in stack]
 
     @classmethod
     def from_freq(cls, values: np.ndarray, sf_ax0=1, sf_ax1=1, sp_ax0=0, sp_ax1=0):
@@ -236,12 +271,6 @@ class Signal2(Signal):
         ax1 = np.arange(val_shape[1]) * ax1_samp_period - sp_ax1
         return cls(ax0, ax1, vals)
 
-    @dispatch(Real, Real)
-    def interpolate(self, val0, val1):
-        """Interpolates the current values to obtain a new value."""
-        return self._interpolate(val0, val1)
-
-    @dispatch(Real, Real, str)
     def interpolate(self, val0, val1, method=INTERP2_METHOD):
         """Interpolates the current values to obtain a new value."""
         return self._interpolate(val0, val1, method)
@@ -390,23 +419,57 @@ class Signal2(Signal):
             # Linearly interpolates
             return f0 + (f1 - f0) * (val1 - y0) / (y1 - y0)
 
+    def resample(self, ax0: np.ndarray, ax1: np.ndarray) -> Signal2:
+        """Bilinearly interpolates the signal onto a new grid.
+
+        All the points are evaluated in a single vectorized pass. Points
+        out of the range of the signal take the value of its nearest
+        edge.
+
+        Parameters
+        ----------
+        ax0 : array_like
+            First axis of the new grid.
+        ax1 : array_like
+            Second axis of the new grid.
+
+        Returns
+        -------
+        Signal2
+            Signal evaluated on the new grid.
+        """
+        ax0 = np.array(ax0)
+        ax1 = np.array(ax1)
+        values = self._values_on(ax0, ax1)
+        if values is self.values:
+            # The grid is the same, but the result must not share memory
+            values = values.copy()
+        return Signal2(ax0, ax1, values, copy=False)
+
     def unpack(self):
         """Unpacks the signal into three arrays. If used for its
         intended purpose, should be unpacked with *.
         """
         return self.ax0, self.ax1, self.values
 
-    def apply_function(self, func, *args, **kwargs):
+    def apply_function(self, func, *args, vectorize=False, chunksize=None, **kwargs):
         """Applies a function to the values of the signal.
 
         Parameters
         ----------
         func : function
-            Function to apply to the signal.
+            Function to apply to the signal. It is called once with all
+            the values, unless `vectorize` is True.
+        vectorize : bool, optional
+            Whether to call the function once per value, for functions
+            that only accept scalars, by default False.
+        chunksize : int, optional
+            If given, the function is evaluated in blocks of this many
+            rows, by default None.
         """
-        copy = self.clone()
-        copy.values = np.array([func(x, *args, **kwargs) for x in copy.values])
-        return copy
+        values = math_lib.map_function(func, self.values, args=args, kwargs=kwargs,
+                                       vectorize=vectorize, chunksize=chunksize)
+        return Signal2(self.ax0, self.ax1, values, copy=False)
 
     def export_to_file(self, filename: str, *args, **kwargs):
         """Exports the one dimensional signal to the given file.
@@ -449,7 +512,7 @@ class Signal2(Signal):
         """Gets the span of the second axis."""
         return self.ax1[-1] - self.ax1[0]
 
-    def apply_kernel(self, kernel: np.ndarray, flip=False, oob=KERNEL_OOB) -> Signal2:
+    def apply_kernel(self, kernel: np.ndarray, flip=False, oob=KERNEL_OOB, out=None) -> Signal2:
         """Applies a kernel over the signal. This process is also known
         as image convolution.
 
@@ -462,13 +525,16 @@ class Signal2(Signal):
         oob : str, optional
             Specifier for how to handle values outside of the bounds of
             the signal, by default KERNEL_OOB.
+        out : Signal2, optional
+            Signal with the same shape where the result is stored, by
+            default None, which creates a new one.
 
         Returns
         -------
         Signal2
             Signal after applying the kernel.
         """
-        return math_lib.apply_kernel(self, kernel, flip, oob)
+        return math_lib.apply_kernel(self, kernel, flip, oob, out)
 
     def transpose(self) -> Signal2:
         """Transposes the signal by interchanging `ax0` and `ax1`, and
@@ -2,4 +2,4 @@ __all__ = ["manual_am_modulation", "manual_conv1", "manual_conv2",
            "manual_hilbert", "manual_fourier1", "manual_fourier2",
            "manual_cos1", "manual_cos2", "manual_sin1", "manual_interp1",
            "manual_io1", "manual_io2", "manual_modulation",
-           "manual_spectr"]
+           "manual_spectr", "manual_dispatch"]
@@ -0,0 +1,48 @@
+import timeit
+import numpy as np
+import matplotlib.pyplot as plt
+
+from chirper.sgn import Signal1
+
+
+def main(show_fig=False, repeat=2000):
+    sizes = [16, 256, 4096]
+    labels = ["number", "array", "signal", "numpy"]
+    overheads = {label: [] for label in labels}
+
+    for size in sizes:
+        axis = np.arange(size) / size
+        signal = Signal1(axis, np.sin(2 * np.pi * axis))
+        other = Signal1(axis, np.cos(2 * np.pi * axis))
+        array = other.values
+        operations = {
+            "number": lambda: signal * 2.0,
+            "array": lambda: signal * array,
+            "signal": lambda: signal * other,
+            "numpy": lambda: signal.values * array,
+        }
+        for label, operation in operations.items():
+            # Time per operation in microseconds
+            elapsed = min(timeit.repeat(operation, number=repeat, repeat=3)) / repeat * 1e6
+            overheads[label].append(elapsed)
+        print(f"{size:>6} samples: " + ", ".join(
+            f"{label} {overheads[label][-1]:.2f} us" for label in labels))
+
+    fig, ax = plt.subplots()
+    fig.suptitle("Cost of a multiplication")
+    width = 0.2
+    for i, label in enumerate(labels):
+        ax.bar(np.arange(len(sizes)) + i * width, overheads[label], width, label=label)
+    ax.set_xticks(np.arange(len(sizes)) + 1.5 * width, [str(size) for size in sizes])
+    ax.set_xlabel("Samples")
+    ax.set_ylabel("Time per operation (us)")
+    ax.legend()
+
+    if show_fig:
+        plt.show()
+    else:
+        plt.close("all")
+
+
+if __name__ == "__main__":
+    main(True)
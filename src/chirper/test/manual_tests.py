@@ -18,6 +18,7 @@ AVAILABLE_TESTS = {
     "spectr": manual_spectr,
     "modulation": manual_modulation,
     "am_modulation": manual_am_modulation,
+    "dispatch": manual_dispatch,
 }
 
 SHOW_TESTS = {
@@ -35,6 +36,7 @@ SHOW_TESTS = {
     "spectr": False,
     "modulation": False,
     "am_modulation": False,
+    "dispatch": False,
 }
 
 
@@ -1,6 +1,6 @@
 from unittest import TestSuite
 
-from chirper.test.unit import sgn
+from chirper.test.unit import filters, modulation, sgn, transforms, utils
 
 
 TEST_CASES = (
@@ -8,7 +8,11 @@ TEST_CASES = (
 )
 
 TEST_DIRS = (
+    filters,
+    modulation,
     sgn,
+    transforms,
+    utils,
 )
 
 
@@ -0,0 +1,29 @@
+from unittest import TestSuite
+
+from chirper.test.unit.filters.test_moving import TestMoving
+from chirper.test.unit.filters.test_fir import TestFIRFilter
+from chirper.test.unit.filters.test_iir import TestSOSFilter
+from chirper.test.unit.filters.test_resample import TestResample
+
+
+TEST_CASES = (
+    TestMoving,
+    TestFIRFilter,
+    TestSOSFilter,
+    TestResample,
+)
+
+TEST_DIRS = (
+
+)
+
+
+def load_tests(loader, tests, pattern):
+    suite = TestSuite()
+    for test_class in TEST_CASES:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+    for test_dir in TEST_DIRS:
+        tests = loader.loadTestsFromModule(test_dir)
+        suite.addTests(tests)
+    return suite
@@ -0,0 +1,37 @@
+import unittest
+import numpy as np
+from scipy import signal
+
+from chirper.filters import FIRFilter
+from chirper.sgn import Signal1
+
+
+class TestFIRFilter(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.values = rng.standard_normal((2000, 2))
+
+    def test_streaming(self):
+        # Both the direct and the overlap-add paths
+        for numtaps in (15, 129):
+            fir = FIRFilter.from_design(numtaps, 50, 1000)
+            expected = signal.lfilter(fir.taps, [1], self.values, axis=0)
+            # Empty blocks give empty results, even before the first block
+            self.assertEqual((0, 2), fir.process(self.values[:0]).shape, "FIR streaming test failed")
+            blocks = [fir.process(self.values[start:start + 100]) for start in range(0, 2000, 100)]
+            self.assertEqual((0, 2), fir.process(self.values[:0]).shape, "FIR streaming test failed")
+            blocks.append(fir.process(self.values[2000:]))
+            self.assertTrue(np.allclose(np.concatenate(blocks), expected), "FIR streaming test failed")
+            self.assertTrue(np.allclose(fir.apply(self.values), expected), "FIR streaming test failed")
+
+            fir.reset()
+            self.assertTrue(np.allclose(fir(self.values[:100, 0]), expected[:100, 0]),
+                            "FIR streaming test failed")
+
+    def test_filtfilt(self):
+        fir = FIRFilter(np.ones(5) / 5)
+        signal1 = Signal1(np.arange(2000) / 1000, self.values[:, 0])
+        result = fir.filtfilt(signal1)
+        expected = signal.filtfilt(fir.taps, [1], self.values[:, 0])
+        self.assertTrue(np.allclose(result.values, expected), "FIR zero-phase test failed")
+        self.assertTrue(np.array_equal(result.axis, signal1.axis), "FIR zero-phase test failed")
@@ -0,0 +1,27 @@
+import unittest
+import numpy as np
+from scipy import signal
+
+from chirper.filters import SOSFilter
+
+
+class TestSOSFilter(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.values = rng.standard_normal((2000, 3))
+
+    def test_streaming(self):
+        iir = SOSFilter.from_design(6, (50, 150), 1000, btype="bandpass")
+        expected = signal.sosfilt(iir.sos, self.values, axis=0)
+        self.assertEqual((0, 3), iir.process(self.values[:0]).shape, "IIR streaming test failed")
+        blocks = [iir.process(self.values[start:start + 333]) for start in range(0, 2000, 333)]
+        self.assertEqual((0, 3), iir.process(self.values[:0]).shape, "IIR streaming test failed")
+        self.assertTrue(np.allclose(np.concatenate(blocks), expected), "IIR streaming test failed")
+        self.assertEqual(iir.state.shape, (len(iir.sos), 2, 3), "IIR streaming test failed")
+
+    def test_filtfilt(self):
+        b, a = signal.butter(3, 0.2)
+        iir = SOSFilter.from_tf(b, a)
+        expected = signal.filtfilt(b, a, self.values, axis=0)
+        self.assertTrue(np.allclose(iir.filtfilt(self.values), expected, atol=1e-8),
+                        "IIR zero-phase test failed")
@@ -0,0 +1,74 @@
+import unittest
+import numpy as np
+
+from chirper.filters import moving
+from chirper.sgn import Signal1
+
+
+def windows(values, factor):
+    # Windows centered on each sample, shrunk near the edges
+    shift = (factor - 1) // 2
+    for n in range(len(values)):
+        half_width = min(n, shift, len(values) - 1 - n)
+        yield values[n - half_width:n + half_width + 1]
+
+
+class TestMoving(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.axis = np.arange(200) / 100
+        self.values = rng.standard_normal(200)
+        self.signal = Signal1(self.axis, self.values)
+
+    def test_rect_smooth(self):
+        for factor in (3, 5, 21):
+            expected = [window.mean() for window in windows(self.values, factor)]
+            result = self.signal.rect_smooth(factor)
+            self.assertTrue(np.allclose(result.values, expected), "Rect smoothing test failed")
+            self.assertTrue(np.array_equal(result.axis, self.axis), "Rect smoothing test failed")
+        with self.assertRaises(ValueError):
+            self.signal.rect_smooth(4)
+
+    def test_rank_filters(self):
+        for factor in (3, 7):
+            filters = (
+                (moving.median_filter, np.median),
+                (moving.min_filter, np.min),
+                (moving.max_filter, np.max),
+            )
+            for filter_function, reduction in filters:
+                expected = [reduction(window) for window in windows(self.values, factor)]
+                result = filter_function(self.signal, factor)
+                self.assertTrue(np.allclose(result.values, expected), "Rank filter test failed")
+
+    def test_exponential_smooth(self):
+        alpha = 0.2
+        expected = np.empty_like(self.values)
+        previous = self.values[0]
+        for n, value in enumerate(self.values):
+            previous = expected[n] = alpha * value + (1 - alpha) * previous
+        result = moving.exponential_smooth(self.signal, alpha)
+        self.assertTrue(np.allclose(result.values, expected), "Exponential smoothing test failed")
+
+    def test_streaming(self):
+        factor = 5
+        # The history starts filled with the first sample
+        padded = np.concatenate((np.full(factor - 1, self.values[0]), self.values))
+        trailing = np.lib.stride_tricks.sliding_window_view(padded, factor)
+        streams = (
+            (moving.RunningMean(factor), trailing.mean(axis=1)),
+            (moving.RunningMedian(factor), np.median(trailing, axis=1)),
+            (moving.RunningMin(factor), trailing.min(axis=1)),
+            (moving.RunningMax(factor), trailing.max(axis=1)),
+            (moving.RunningExponential(0.3),
+             moving.exponential_smooth(self.signal, 0.3).values),
+        )
+        for stream, expected in streams:
+            blocks = [stream.process(self.values[start:start + 37]) for start in range(0, 200, 37)]
+            self.assertTrue(np.allclose(np.concatenate(blocks), expected), "Streaming filter test failed")
+
+        stream = moving.RunningMean(factor)
+        block = stream(self.signal)
+        self.assertTrue(np.allclose(block.values, trailing.mean(axis=1)), "Streaming filter test failed")
+        stream.reset()
+        self.assertIsNone(stream.history, "Streaming filter test failed")
@@ -0,0 +1,52 @@
+import unittest
+import numpy as np
+from scipy import signal
+
+from chirper.filters import StreamResampler
+from chirper.sgn import Signal1
+
+
+class TestResample(unittest.TestCase):
+    def setUp(self):
+        self.samp_freq = 44100
+        axis = np.arange(4410) / self.samp_freq
+        self.signal = Signal1(axis, np.sin(2 * np.pi * 1000 * axis))
+
+    def test_resample(self):
+        resampled = self.signal.resample_rate(48000)
+        self.assertEqual(len(resampled), 4800, "Resampling test failed")
+        self.assertAlmostEqual(resampled.sampling_freq(), 48000, msg="Resampling test failed")
+        self.assertEqual(resampled.axis[0], self.signal.axis[0], "Resampling test failed")
+        error = resampled.values - np.sin(2 * np.pi * 1000 * resampled.axis)
+        self.assertLess(np.max(np.abs(error[100:-100])), 1e-3, "Resampling test failed")
+
+        upsampled = self.signal.resample_poly(3, 2)
+        self.assertEqual(len(upsampled), 6615, "Resampling test failed")
+        self.assertAlmostEqual(upsampled.sampling_freq(), 66150, msg="Resampling test failed")
+
+    def test_decimate(self):
+        decimated = self.signal.decimate(4)
+        self.assertEqual(len(decimated), 1103, "Decimation test failed")
+        self.assertTrue(np.allclose(decimated.axis, self.signal.axis[::4]), "Decimation test failed")
+        error = decimated.values - np.sin(2 * np.pi * 1000 * decimated.axis)
+        self.assertLess(np.max(np.abs(error[50:-50])), 1e-2, "Decimation test failed")
+        with self.assertRaises(ValueError):
+            Signal1([0, 1, 3, 4], [1, 2, 3, 4]).decimate(2)
+
+    def test_streaming(self):
+        values = np.random.default_rng(0).standard_normal(3000)
+        for up, down in ((160, 147), (1, 3), (5, 2)):
+            resampler = StreamResampler(up, down)
+            blocks = [resampler.process(values[start:start + 441]) for start in range(0, 3000, 441)]
+            result = np.concatenate(blocks)
+            max_rate = max(up, down)
+            taps = signal.firwin(20 * max_rate + 1, 1 / max_rate, window=("kaiser", 5.0)) * up
+            expected = signal.upfirdn(taps, values, up, down)
+            self.assertEqual(len(result), -(-3000 * up // down), "Streaming resampling test failed")
+            self.assertTrue(np.allclose(result, expected[:len(result)]), "Streaming resampling test failed")
+
+        resampler = StreamResampler.from_rates(self.samp_freq, 48000)
+        first = resampler(self.signal.get(stop=0.05))
+        second = resampler(self.signal.get(start=0.05))
+        axis = np.concatenate((first.axis, second.axis))
+        self.assertTrue(np.allclose(np.diff(axis), 1 / 48000), "Streaming resampling test failed")
@@ -0,0 +1,25 @@
+from unittest import TestSuite
+
+from chirper.test.unit.modulation.test_demodulation import TestDemodulation
+from chirper.test.unit.modulation.test_kernels import TestKernels
+
+
+TEST_CASES = (
+    TestDemodulation,
+    TestKernels,
+)
+
+TEST_DIRS = (
+
+)
+
+
+def load_tests(loader, tests, pattern):
+    suite = TestSuite()
+    for test_class in TEST_CASES:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+    for test_dir in TEST_DIRS:
+        tests = loader.loadTestsFromModule(test_dir)
+        suite.addTests(tests)
+    return suite
@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+
+from chirper.modulation import (AMDemodulator, FMDemodulator, FMModulator, PMDemodulator, am_demodulation,
+                                am_modulation, fm_demodulation, fm_modulation, pm_demodulation, pm_modulation)
+from chirper.sgn import Signal1
+
+
+class TestDemodulation(unittest.TestCase):
+    def setUp(self):
+        self.samp_freq = 8000
+        self.axis = np.arange(8000) / self.samp_freq
+        self.values = 0.5 * np.sin(2 * np.pi * 50 * self.axis)
+        self.signal = Signal1(self.axis, self.values)
+        # Edges of the offline analytic signal are not accurate
+        self.inner = slice(500, -500)
+
+    def _stream(self, demodulator, signal, size=333):
+        blocks = [demodulator(Signal1(signal.axis[i:i + size], signal.values[i:i + size]))
+                  for i in range(0, len(signal.values), size)]
+        delay = demodulator.delay
+        return np.concatenate([block.values for block in blocks])[delay:], self.values[:-delay]
+
+    def test_am(self):
+        for method, args in (("dsbfc", (1000, 2)), ("dsbsc", (1000, 2)), ("usb", (1000,)), ("lsb", (1000,))):
+            modulated = am_modulation(self.signal, *args, method=method)
+            demodulated = am_demodulation(modulated, *args, method=method)
+            self.assertTrue(np.allclose(demodulated.values[self.inner], self.values[self.inner]),
+                            "AM demodulation test failed")
+
+            demodulator = AMDemodulator(self.samp_freq, *args, method=method)
+            result, expected = self._stream(demodulator, modulated)
+            self.assertTrue(np.allclose(result[self.inner], expected[self.inner], atol=1e-4),
+                            "AM streaming demodulation test failed")
+
+    def test_pm(self):
+        modulated = pm_modulation(self.signal, 1000, 1)
+        demodulated = pm_demodulation(modulated, 1000)
+        self.assertTrue(np.allclose(demodulated.values[self.inner], self.values[self.inner]),
+                        "PM demodulation test failed")
+
+        result, expected = self._stream(PMDemodulator(self.samp_freq, 1000), modulated, size=100)
+        self.assertTrue(np.allclose(result[self.inner], expected[self.inner], atol=1e-4),
+                        "PM streaming demodulation test failed")
+
+    def test_fm(self):
+        const = 2 * np.pi * 200
+        phase = 2 * np.pi * 1000 * self.axis + const * np.cumsum(self.values) / self.samp_freq
+        modulated = fm_modulation(self.signal, 1000, 1, const)
+        self.assertTrue(np.allclose(modulated.values, np.cos(phase)), "FM modulation test failed")
+
+        modulator = FMModulator(self.samp_freq, 1000, 1, const)
+        blocks = [modulator(self.values[i:i + 333]) for i in range(0, len(self.values), 333)]
+        self.assertTrue(np.allclose(np.concatenate(blocks), modulated.values), "FM streaming modulation test failed")
+
+        demodulated = fm_demodulation(modulated, 1000, const)
+        self.assertTrue(np.allclose(demodulated.values[self.inner], self.values[self.inner]),
+                        "FM demodulation test failed")
+
+        result, expected = self._stream(FMDemodulator(self.samp_freq, 1000, const), modulated)
+        self.assertTrue(np.allclose(result[self.inner], expected[self.inner], atol=1e-4),
+                        "FM streaming demodulation test failed")
@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+
+from chirper.modulation import am_modulation, kernels
+from chirper.sgn import Signal1
+from chirper.transforms import hilbert
+
+
+class TestKernels(unittest.TestCase):
+    def setUp(self):
+        self.axis = np.linspace(0, 1, 2000)
+        self.signal = Signal1(self.axis, np.sin(2 * np.pi * 5 * self.axis))
+        self.cos = np.cos(2 * np.pi * 200 * self.axis)
+        self.sin = np.sin(2 * np.pi * 200 * self.axis)
+
+    def test_carrier_cache(self):
+        kernels.clear_cache()
+        carrier = kernels.phasor(self.signal.axis, 200)
+        self.assertIs(kernels.phasor(self.signal.axis, 200), carrier, "Carrier cache test failed")
+        self.assertIsNot(kernels.phasor(self.signal.axis, 100), carrier, "Carrier cache test failed")
+        self.assertIsNot(kernels.phasor(self.axis.copy(), 200), carrier, "Carrier cache test failed")
+        self.assertTrue(np.allclose(kernels.cos_carrier(self.signal.axis, 200), self.cos),
+                        "Carrier cache test failed")
+        self.assertFalse(carrier.flags.writeable, "Carrier cache test failed")
+
+        # Changing the axis in place invalidates its carriers
+        signal = self.signal.clone()
+        first = kernels.phasor(signal.axis, 200)
+        signal.shift(1, out=signal)
+        self.assertIsNot(kernels.phasor(signal.axis, 200), first, "Carrier cache test failed")
+
+        # Dropping the axis drops its carriers
+        axis = self.axis.copy()
+        kernels.phasor(axis, 200)
+        cached = len(kernels._CARRIERS)
+        del axis
+        self.assertEqual(len(kernels._CARRIERS), cached - 1, "Carrier cache test failed")
+
+    def test_am(self):
+        values = self.signal.values
+        x_h = hilbert.h1(self.signal).values
+        self.assertTrue(np.allclose(am_modulation(self.signal, 200, 2, method="dsbfc").values,
+                                    (2 + values) * self.cos), "AM kernel test failed")
+        self.assertTrue(np.allclose(am_modulation(self.signal, 200, 2, method="dsbsc", chunksize=300).values,
+                                    2 * values * self.cos), "AM kernel test failed")
+        self.assertTrue(np.allclose(am_modulation(self.signal, 200, method="usb").values,
+                                    values * self.cos - x_h * self.sin), "AM kernel test failed")
+        self.assertTrue(np.allclose(am_modulation(self.signal, 200, method="lsb", chunksize=300).values,
+                                    values * self.cos + x_h * self.sin), "AM kernel test failed")
+
+    def test_out(self):
+        signal = self.signal.clone()
+        buffer = signal.values
+        result = am_modulation(signal, 200, 1, method="dsbfc", out=signal)
+        self.assertIs(result.values, buffer, "AM kernel output buffer test failed")
+        self.assertTrue(np.allclose(buffer, (1 + self.signal.values) * self.cos),
+                        "AM kernel output buffer test failed")
@@ -1,10 +1,26 @@
 from unittest import TestSuite
 
 from chirper.test.unit.sgn.test_signal import TestSignal
+from chirper.test.unit.sgn.test_signal2 import TestSignal2
+from chirper.test.unit.sgn.test_lazy import TestLazySignal
+from chirper.test.unit.sgn.test_handlers import (
+    TestHandlerWav,
+    TestHandlerCsv,
+    TestHandlerBinary,
+    TestHandlerArchive,
+    TestHandlerImage,
+)
 
 
 TEST_CASES = (
     TestSignal,
+    TestSignal2,
+    TestLazySignal,
+    TestHandlerWav,
+    TestHandlerCsv,
+    TestHandlerBinary,
+    TestHandlerArchive,
+    TestHandlerImage,
 )
 
 TEST_DIRS = (
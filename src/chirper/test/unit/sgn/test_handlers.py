@@ -0,0 +1,205 @@
+import os
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+import numpy as np
+from scipy.io import wavfile
+
+from chirper.sgn import Signal1, Signal2
+from chirper.sgn.handlers import handler_csv
+from chirper.sgn.handlers.handler_archive import SignalArchive
+from chirper.sgn.handlers.handler_wav import WavWriter
+
+
+class TestHandlerWav(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "test.wav")
+        self.values = 0.5 * np.sin(np.linspace(0, 100, 10001))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_writer_blocks(self):
+        for dtype, max_int in (("int16", 2 ** 15 - 1), ("int24", 2 ** 23 - 1)):
+            with WavWriter(self.filename, 8000, dtype=dtype) as writer:
+                for i in range(0, len(self.values), 777):
+                    writer.write(self.values[i:i + 777])
+            samp_rate, values = wavfile.read(self.filename)
+            if dtype == "int24":
+                # scipy returns 24 bit samples left aligned in 32 bits
+                values = values // 256
+            self.assertEqual(8000, samp_rate, "WAV writer rate test failed")
+            np.testing.assert_allclose(values / max_int, self.values, atol=1e-4,
+                                       err_msg="WAV writer values test failed")
+
+    def test_writer_complex(self):
+        # Every format keeps only the real part, without warnings
+        for dtype in WavWriter.FORMATS:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                with WavWriter(self.filename, 8000, dtype=dtype) as writer:
+                    writer.write(self.values + 1j)
+            _, values = wavfile.read(self.filename)
+            self.assertEqual(len(self.values), len(values), "WAV writer complex test failed")
+
+    def test_export_import(self):
+        signal = Signal1.from_freq(self.values, 8000)
+        signal.export_to_file(self.filename)
+        read = Signal1.from_file(self.filename, amplification=1)
+        np.testing.assert_allclose(signal.values, read.values, atol=1e-7,
+                                   err_msg="WAV export test failed")
+
+
+class TestHandlerCsv(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "test.csv")
+        self.signal = Signal1.from_freq(np.random.randn(1000), 100)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        self.signal.export_to_file(self.filename)
+        self.assertEqual(self.signal, Signal1.from_file(self.filename),
+                         "CSV round trip test failed")
+
+        complex_signal = self.signal * (1 + 2j)
+        complex_signal.export_to_file(self.filename)
+        self.assertEqual(complex_signal, Signal1.from_file(self.filename),
+                         "CSV complex round trip test failed")
+
+    def test_chunks(self):
+        self.signal.export_to_file(self.filename)
+        chunks = list(handler_csv.iter_signal1(self.filename, chunksize=300))
+        axis = np.concatenate([chunk[0] for chunk in chunks])
+        values = np.concatenate([chunk[1] for chunk in chunks])
+        self.assertEqual(self.signal, Signal1(axis, values),
+                         "CSV chunked import test failed")
+
+
+class TestHandlerBinary(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.signal1 = Signal1.from_freq(np.random.randn(1000) * (1 + 1j), 100)
+        self.signal2 = Signal2.from_freq(np.random.randn(30, 20).astype(np.float32))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        for extension in ("npy", "npz", "bin"):
+            filename = os.path.join(self.tmp_dir.name, f"test.{extension}")
+            self.signal1.export_to_file(filename)
+            self.assertEqual(self.signal1, Signal1.from_file(filename),
+                             f"{extension} Signal1 round trip test failed")
+            self.signal2.export_to_file(filename)
+            read = Signal2.from_file(filename)
+            self.assertEqual(self.signal2, read,
+                             f"{extension} Signal2 round trip test failed")
+            self.assertEqual(np.float32, read.values.dtype,
+                             f"{extension} Signal2 dtype test failed")
+
+    def test_mmap(self):
+        for extension in ("npy", "bin"):
+            filename = os.path.join(self.tmp_dir.name, f"test.{extension}")
+            self.signal1.export_to_file(filename)
+            read = Signal1.from_file(filename, mmap_mode="r")
+            self.assertFalse(read.values.flags.owndata,
+                             f"{extension} memory map test failed")
+            self.assertEqual(self.signal1, read,
+                             f"{extension} memory map test failed")
+
+
+class TestHandlerArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "test.chirp")
+        self.signal = Signal1.from_freq(np.random.randn(3000), 1000)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_time_range(self):
+        self.signal.export_to_file(self.filename, chunk_size=128)
+        self.assertEqual(self.signal, Signal1.from_file(self.filename),
+                         "Archive round trip test failed")
+        window = Signal1.from_file(self.filename, start=1.2345, stop=2)
+        mask = (self.signal.axis >= 1.2345) & (self.signal.axis <= 2)
+        self.assertEqual(Signal1(self.signal.axis[mask], self.signal.values[mask]),
+                         window, "Archive time range test failed")
+
+    def test_append(self):
+        first = Signal1(self.signal.axis[:505], self.signal.values[:505])
+        first.export_to_file(self.filename, chunk_size=100)
+        for i in range(505, 3000, 333):
+            block = Signal1(self.signal.axis[i:i + 333], self.signal.values[i:i + 333])
+            block.export_to_file(self.filename, append=True)
+        self.assertEqual(self.signal, Signal1.from_file(self.filename),
+                         "Archive append test failed")
+        with self.assertRaises(ValueError):
+            first.export_to_file(self.filename, append=True)
+        with self.assertRaises(ValueError):
+            # Starts at the last sample stored
+            Signal1(self.signal.axis[-1:], self.signal.values[-1:]).export_to_file(self.filename, append=True)
+
+    def test_append_size(self):
+        self.signal.export_to_file(self.filename, chunk_size=1000)
+        size = os.path.getsize(self.filename)
+        Signal1(self.signal.axis[:10], self.signal.values[:10]).export_to_file(self.filename, chunk_size=1000)
+        with SignalArchive(self.filename) as archive:
+            for i in range(10, 3000, 10):
+                archive.append(self.signal.axis[i:i + 10], self.signal.values[i:i + 10])
+        # The unused bytes are bounded by the used ones
+        self.assertLess(os.path.getsize(self.filename), 2.5 * size, "Archive append size test failed")
+        self.assertEqual(self.signal, Signal1.from_file(self.filename), "Archive append size test failed")
+        self.assertEqual([], [name for name in os.listdir(self.tmp_dir.name) if name.endswith(".tmp")],
+                         "Archive append size test failed")
+
+    def test_failed_append(self):
+        first = Signal1(self.signal.axis[:505], self.signal.values[:505])
+        first.export_to_file(self.filename, chunk_size=100)
+        size = os.path.getsize(self.filename)
+        with SignalArchive(self.filename) as archive:
+            # Fails after writing the first of the new chunks
+            with mock.patch.object(archive, "_encode", side_effect=[b"axis", b"values", OSError]):
+                self.assertRaises(OSError, archive.append, self.signal.axis[505:], self.signal.values[505:])
+        self.assertEqual(size, os.path.getsize(self.filename), "Archive failed append test failed")
+        self.assertEqual(first, Signal1.from_file(self.filename), "Archive failed append test failed")
+
+
+class TestHandlerImage(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.signal = Signal2.from_freq(np.random.rand(40, 30))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_export(self):
+        filename = os.path.join(self.tmp_dir.name, "test.png")
+        self.signal.export_to_file(filename, norm=True, dtype="uint16")
+        read = Signal2.from_file(filename, norm=True)
+        np.testing.assert_allclose(self.signal.values, read.values, atol=1e-4,
+                                   err_msg="Image export test failed")
+        read = Signal2.from_file(filename, norm=True, dtype="uint8")
+        self.assertEqual(np.uint8, read.values.dtype, "Image export test failed")
+        np.testing.assert_allclose(self.signal.values * 255, read.values, atol=0.51,
+                                   err_msg="Image export test failed")
+
+    def test_batch(self):
+        for i in range(5):
+            filename = os.path.join(self.tmp_dir.name, f"test_{i}.png")
+            (self.signal * (i / 4)).export_to_file(filename, norm=True)
+        batch = Signal2.from_dir(self.tmp_dir.name, norm=True, workers=2)
+        self.assertEqual(5, len(batch), "Image batch test failed")
+        for i, signal in enumerate(batch):
+            self.assertEqual(np.float32, signal.values.dtype, "Image batch dtype test failed")
+            np.testing.assert_allclose(self.signal.values * (i / 4), signal.values, atol=1e-2,
+                                       err_msg="Image batch test failed")
+
+
+if __name__ == '__main__':
+    unittest.main()
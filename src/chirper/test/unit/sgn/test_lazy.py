@@ -0,0 +1,44 @@
+import unittest
+import numpy as np
+
+from chirper.exceptions import DimensionError
+from chirper.sgn import Signal1, Signal2, lazy
+
+
+class TestLazySignal(unittest.TestCase):
+    def setUp(self):
+        self.numexpr = lazy.numexpr
+        axis = np.arange(1000) / 1000
+        self.signal1 = Signal1(axis, np.sin(2 * np.pi * 5 * axis))
+        self.signal2 = Signal1(axis, np.cos(2 * np.pi * 50 * axis))
+        self.expected = (2 + self.signal1.values) * self.signal2.values - self.signal1.values / 4
+
+    def tearDown(self):
+        lazy.numexpr = self.numexpr
+
+    def _expression(self):
+        return (2 + self.signal1.lazy()) * self.signal2 - self.signal1.lazy() / 4
+
+    def test_compute(self):
+        result = self._expression().compute()
+        self.assertTrue(np.array_equal(result.axis, self.signal1.axis), "Lazy signal test failed")
+        self.assertTrue(np.allclose(result.values, self.expected), "Lazy signal test failed")
+
+    def test_chunks(self):
+        lazy.numexpr = None
+        result = self._expression().compute(chunksize=64)
+        self.assertTrue(np.allclose(result.values, self.expected), "Lazy signal chunks test failed")
+        out = self.signal1.clone()
+        self._expression().compute(chunksize=64, out=out)
+        self.assertTrue(np.allclose(out.values, self.expected), "Lazy signal chunks test failed")
+
+    def test_signal2(self):
+        values = np.outer(self.signal1.values[:50], self.signal2.values[:40])
+        signal = Signal2(np.arange(50), np.arange(40), values)
+        result = abs(-signal.lazy() * 3).compute()
+        self.assertTrue(np.allclose(result.values, np.abs(values) * 3), "Lazy signal test failed")
+
+    def test_axes(self):
+        other = Signal1(self.signal1.axis * 2, self.signal1.values)
+        with self.assertRaises(DimensionError):
+            (self.signal1.lazy() + other).compute()
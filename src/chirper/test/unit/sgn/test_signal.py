@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 
 from chirper.sgn import Signal1
 
@@ -119,6 +120,75 @@ class TestSignal(unittest.TestCase):
         self.assertEqual(exp_signal, abs(self.signal7),
                          "Time signal absolute value test failed")
 
+    def test_inplace(self):
+        signal = self.signal1.clone()
+        buffer = signal.values
+        signal += self.signal3
+        signal *= 2
+        signal -= 200
+        self.assertIs(buffer, signal.values, "Time signal in place operation test failed")
+        self.assertEqual(self.signal1 * 2, signal, "Time signal in place operation test failed")
+
+        # Results that don't fit the current type replace the values
+        signal /= 4
+        self.assertEqual(self.signal1 / 2, signal, "Time signal in place operation test failed")
+
+    def test_out(self):
+        out = self.signal3.clone()
+        buffer = out.values
+        self.signal7.shift(5, out=out)
+        self.assertIs(buffer, out.values, "Time signal output buffer test failed")
+        self.assertEqual(self.signal7.shift(5), out, "Time signal output buffer test failed")
+        self.signal7.psd(out=out)
+        self.assertEqual(self.signal7.psd(), out, "Time signal output buffer test failed")
+        out = Signal1(self.signal3.axis, np.zeros(len(self.signal3)))
+        self.signal7.convolute(self.signal3, out=out)
+        self.assertTrue(np.allclose(self.signal7.convolute(self.signal3).values, out.values),
+                        "Time signal output buffer test failed")
+        self.assertRaises(TypeError, (self.signal7 * 1j).cross_correlate, self.signal3, out=out)
+
+    def test_operands(self):
+        self.assertEqual(self.signal1 * 2, self.signal1.mul(2), "Time signal operand test failed")
+        self.assertEqual(self.signal1 + self.signal3, self.signal1 + self.signal3.values,
+                         "Time signal operand test failed")
+        self.assertEqual(2 - self.signal1, Signal1(self.signal1.axis, 2 - self.signal1.values),
+                         "Time signal operand test failed")
+        with self.assertRaises(TypeError):
+            self.signal1 + "signal"
+
+    def test_slice_call(self):
+        self.assertEqual(list(self.signal1(slice(10, 12))), [100, 121, 144],
+                         "Time signal slicing test failed")
+        self.assertEqual(len(self.signal1(slice(None, 4))), 5, "Time signal slicing test failed")
+
+    def test_apply_window(self):
+        window = np.array([1, 2, 3, 2, 1])
+        windowed = self.signal1.apply_window(window, 10)
+        expected = np.zeros(100)
+        expected[8:13] = self.signal1.values[8:13] * window
+        self.assertTrue(np.array_equal(windowed.values, expected), "Time signal window test failed")
+
+        # Windows past the edges are clipped
+        windowed = self.signal1.apply_window(window, 98.4)
+        expected = np.zeros(100)
+        expected[96:] = self.signal1.values[96:] * window[:4]
+        self.assertTrue(np.array_equal(windowed.values, expected), "Time signal window test failed")
+
+        window_signal = Signal1([-2, 0, 2], [0, 1, 0])
+        windowed = self.signal3.apply_window(window_signal, 50)
+        self.assertEqual(list(windowed.values[47:54]), [0, 0, 50, 100, 50, 0, 0],
+                         "Time signal window test failed")
+        with self.assertRaises(ValueError):
+            Signal1([0, 1, 3], [1, 1, 1]).apply_window(window, 1)
+
+    def test_apply_windows(self):
+        window = np.array([1, 2, 1])
+        frames, starts = self.signal1.apply_windows(window, [0, 10, 99])
+        self.assertEqual(list(starts), [-1, 9, 98], "Time signal windows test failed")
+        self.assertEqual(list(frames[0]), [0, 0, 1], "Time signal windows test failed")
+        self.assertEqual(list(frames[1]), [81, 200, 121], "Time signal windows test failed")
+        self.assertEqual(list(frames[2]), [98 ** 2, 2 * 99 ** 2, 0], "Time signal windows test failed")
+
 
 if __name__ == '__main__':
     unittest.main()
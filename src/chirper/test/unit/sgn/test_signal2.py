@@ -0,0 +1,78 @@
+import unittest
+import numpy as np
+
+from chirper.sgn import Signal2
+from chirper.utils import math_lib
+
+
+class TestSignal2(unittest.TestCase):
+    def setUp(self):
+        self.ax0 = np.arange(20, dtype=float)
+        self.ax1 = np.arange(30, dtype=float) / 2
+        self.values = self.ax0[:, None] * 2 + self.ax1[None, :] * 3
+        self.signal = Signal2(self.ax0, self.ax1, self.values)
+
+    def test_bilinear_resample(self):
+        new_ax0 = np.linspace(0, 19, 57)
+        new_ax1 = np.linspace(0, 14.5, 41)
+        expected = new_ax0[:, None] * 2 + new_ax1[None, :] * 3
+        real = math_lib.bilinear_resample(self.ax0, self.ax1, self.values, new_ax0, new_ax1)
+        self.assertTrue(np.allclose(expected, real), "Bilinear resampling test failed")
+
+        # Points out of the grid take the value of the nearest edge
+        real = math_lib.bilinear_resample(self.ax0, self.ax1, self.values,
+                                          np.array([-5, 50]), np.array([-1, 20]))
+        expected = np.array([[0, 14.5 * 3], [38, 38 + 14.5 * 3]])
+        self.assertTrue(np.allclose(expected, real), "Bilinear resampling test failed")
+
+    def test_resample(self):
+        signal = self.signal.resample(self.ax0 + 0.5, self.ax1[:-1] + 0.25)
+        expected = (self.ax0[:, None] + 0.5) * 2 + (self.ax1[None, :-1] + 0.25) * 3
+        expected[-1] = expected[-2] + 1
+        self.assertTrue(np.allclose(expected, signal.values), "Signal2 resampling test failed")
+
+        # Resampling on the same grid gives an independent copy
+        same = self.signal.resample(self.signal.ax0, self.signal.ax1)
+        self.assertEqual(self.signal, same, "Signal2 resampling test failed")
+        self.assertFalse(np.shares_memory(self.signal.values, same.values), "Signal2 resampling test failed")
+        self.assertFalse(np.shares_memory(self.signal.ax0, same.ax0), "Signal2 resampling test failed")
+
+    def test_operations_same_grid(self):
+        other = Signal2(self.ax0, self.ax1, np.ones_like(self.values))
+        self.assertTrue(np.allclose((self.signal + other).values, self.values + 1),
+                        "Signal2 addition test failed")
+        self.assertTrue(np.allclose((self.signal - other).values, self.values - 1),
+                        "Signal2 subtraction test failed")
+        self.assertTrue(np.allclose((self.signal * self.signal).values, self.values ** 2),
+                        "Signal2 multiplication test failed")
+        self.assertTrue(np.allclose((self.signal / (other * 2)).values, self.values / 2),
+                        "Signal2 division test failed")
+
+    def test_operations_different_grid(self):
+        other = Signal2(self.ax0[::2], self.ax1[::3], self.values[::2, ::3])
+        result = self.signal + other
+        self.assertTrue(np.array_equal(result.ax0, self.ax0), "Signal2 addition test failed")
+        self.assertTrue(np.array_equal(result.ax1, self.ax1), "Signal2 addition test failed")
+        # The signals are linear, so the interpolation is exact inside the grid
+        inside0 = self.ax0 <= self.ax0[::2][-1]
+        inside1 = self.ax1 <= self.ax1[::3][-1]
+        self.assertTrue(np.allclose(result.values[np.ix_(inside0, inside1)],
+                                    2 * self.values[np.ix_(inside0, inside1)]),
+                        "Signal2 addition test failed")
+
+    def test_from_function(self):
+        signal = Signal2.from_function(self.ax0, self.ax1, lambda x, y: 2 * x + 3 * y)
+        self.assertTrue(np.allclose(signal.values, self.values), "Signal2 from function test failed")
+        signal = Signal2.from_function(self.ax0, self.ax1, lambda x, y: 2 * x + 3 * y,
+                                       vectorize=True, chunksize=7)
+        self.assertTrue(np.allclose(signal.values, self.values), "Signal2 from function test failed")
+        signal = Signal2.from_function(self.ax0, self.ax1, lambda x, y: 5)
+        self.assertEqual(signal.values.shape, self.values.shape, "Signal2 from function test failed")
+
+    def test_apply_function(self):
+        signal = self.signal.apply_function(np.sqrt)
+        self.assertTrue(np.allclose(signal.values, np.sqrt(self.values)),
+                        "Signal2 apply function test failed")
+        signal = self.signal.apply_function(lambda x, k: x if x < k else k, 10, vectorize=True)
+        self.assertTrue(np.allclose(signal.values, np.minimum(self.values, 10)),
+                        "Signal2 apply function test failed")
@@ -0,0 +1,33 @@
+from unittest import TestSuite
+
+from chirper.test.unit.transforms.test_cwt import TestCWT
+from chirper.test.unit.transforms.test_goertzel import TestGoertzel
+from chirper.test.unit.transforms.test_hilbert import TestHilbert
+from chirper.test.unit.transforms.test_psd import TestPSD
+from chirper.test.unit.transforms.test_wavelet import TestWavelet
+from chirper.test.unit.transforms.test_z import TestZ
+
+
+TEST_CASES = (
+    TestCWT,
+    TestGoertzel,
+    TestHilbert,
+    TestPSD,
+    TestWavelet,
+    TestZ,
+)
+
+TEST_DIRS = (
+
+)
+
+
+def load_tests(loader, tests, pattern):
+    suite = TestSuite()
+    for test_class in TEST_CASES:
+        tests = loader.loadTestsFromTestCase(test_class)
+        suite.addTests(tests)
+    for test_dir in TEST_DIRS:
+        tests = loader.loadTestsFromModule(test_dir)
+        suite.addTests(tests)
+    return suite
@@ -0,0 +1,37 @@
+import unittest
+import numpy as np
+
+from chirper.sgn import Signal1
+from chirper.transforms import cwt
+
+
+class TestCWT(unittest.TestCase):
+    def setUp(self):
+        self.axis = np.arange(2000) / 1000
+        # A 50 Hz tone, with a 200 Hz one added halfway
+        values = np.cos(2 * np.pi * 50 * self.axis) + (self.axis > 1) * np.cos(2 * np.pi * 200 * self.axis)
+        self.signal = Signal1(self.axis, values)
+        self.freqs = np.arange(10, 300, 2.)
+
+    def test_scalogram(self):
+        for name in cwt.WAVELETS:
+            power = cwt.scalogram(self.signal, self.freqs, name)
+            self.assertEqual(power.values.shape, (2000, len(self.freqs)), "Scalogram test failed")
+            first = power.values[200:800].mean(axis=0)
+            second = power.values[1200:1800].mean(axis=0) * (self.freqs > 120)
+            self.assertAlmostEqual(self.freqs[np.argmax(first)], 50, delta=4, msg=f"Scalogram test failed for {name}")
+            self.assertAlmostEqual(self.freqs[np.argmax(second)], 200, delta=6, msg=f"Scalogram test failed for {name}")
+
+    def test_cwt(self):
+        # Direct correlation with the Morlet wavelet at 50 Hz
+        scale = 1 / (50 * cwt.WAVELETS["morlet"][1])
+        offsets = np.arange(-600, 601) / 1000
+        wavelet = np.pi ** -0.25 * np.exp(6j * offsets / scale - (offsets / scale) ** 2 / 2) / np.sqrt(1000 * scale)
+        expected = np.convolve(self.signal.values, np.conj(wavelet[::-1]), mode="same")
+        coefficients = cwt.cwt1(self.signal, [50]).values[:, 0]
+        self.assertTrue(np.allclose(coefficients[700:1300], expected[700:1300]), "CWT test failed")
+
+        batched = cwt.cwt1(self.signal, batch_size=5)
+        threaded = cwt.cwt1(self.signal, batch_size=7, workers=4)
+        self.assertTrue(np.allclose(batched.values, threaded.values), "Batched CWT test failed")
+        self.assertRaises(ValueError, cwt.cwt1, Signal1([0, 1, 3], [1, 2, 3]))
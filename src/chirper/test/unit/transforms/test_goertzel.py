@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+
+from chirper.sgn import Signal1
+from chirper.transforms import goertzel
+
+
+class TestGoertzel(unittest.TestCase):
+    def setUp(self):
+        self.samp_freq = 8000
+        self.axis = np.arange(4000) / self.samp_freq
+        noise = 0.1 * np.random.default_rng(0).standard_normal(4000)
+        # DTMF digit 1
+        self.values = np.sin(2 * np.pi * 697 * self.axis) + np.sin(2 * np.pi * 1209 * self.axis) + noise
+        self.signal = Signal1(self.axis, self.values)
+        self.freqs = [697, 770, 852, 941, 1209, 1336, 1477]
+
+    def _dft(self, values, freqs):
+        return np.exp(-2j * np.pi * np.outer(freqs, np.arange(len(values))) / self.samp_freq) @ values
+
+    def test_goertzel(self):
+        result = goertzel.goertzel1(self.signal, self.freqs)
+        self.assertTrue(np.allclose(result.values, self._dft(self.values, self.freqs)), "Goertzel test failed")
+        self.assertTrue(np.array_equal(result.axis, self.freqs), "Goertzel test failed")
+
+    def test_detector(self):
+        detector = goertzel.GoertzelDetector(self.freqs, self.samp_freq)
+        blocks = [detector(Signal1(self.axis[i:i + 300], self.values[i:i + 300])) for i in range(0, 4000, 300)]
+        frames = np.concatenate([block.values for block in blocks if block.values.size])
+        self.assertEqual(frames.shape, (4000 // 205, len(self.freqs)), "Goertzel detector test failed")
+        self.assertTrue(np.allclose(frames[1], self._dft(self.values[205:410], self.freqs)),
+                        "Goertzel detector test failed")
+        self.assertEqual(blocks[0].ax0[0], self.axis[204], "Goertzel detector test failed")
+
+        power = np.abs(frames) ** 2
+        self.assertTrue(np.all(np.argsort(power, axis=1)[:, -2:] % 4 == 0), "Goertzel detector test failed")
+
+    def test_sliding_dft(self):
+        sliding = goertzel.SlidingDFT(self.freqs, self.samp_freq, 256)
+        self.assertTrue(np.allclose(sliding.freqs, sliding.bins * self.samp_freq / 256), "Sliding DFT test failed")
+        result = np.concatenate([sliding(self.values[i:i + 333]) for i in range(0, 4000, 333)])
+        for sample in (100, 255, 1000, 3999):
+            window = np.zeros(256)
+            recent = self.values[max(0, sample - 255):sample + 1]
+            window[256 - len(recent):] = recent
+            self.assertTrue(np.allclose(result[sample], np.fft.fft(window)[sliding.bins]), "Sliding DFT test failed")
@@ -0,0 +1,50 @@
+import unittest
+import numpy as np
+from scipy import signal
+
+from chirper.sgn import Signal1, Signal2
+from chirper.transforms import hilbert
+
+
+class TestHilbert(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.values = rng.standard_normal(1001)
+        self.signal = Signal1(np.arange(1001) / 1000, self.values)
+
+    def test_analytic(self):
+        self.assertTrue(np.allclose(hilbert.analytic(self.values, fast=False), signal.hilbert(self.values)),
+                        "Analytic signal test failed")
+        self.assertTrue(np.allclose(hilbert.h1(self.signal, "fft").values, hilbert.analytic(self.values).imag),
+                        "Hilbert transform test failed")
+        self.assertTrue(np.allclose(hilbert.h1(self.signal, "scipy").values, signal.hilbert(self.values).imag),
+                        "Hilbert transform test failed")
+
+        # Padding only changes the edges of a smooth signal
+        tone = Signal1(self.signal.axis, np.cos(2 * np.pi * 50 * self.signal.axis))
+        padded = hilbert.analytic_signal(tone, fast=True)
+        self.assertTrue(np.allclose(padded.values[100:-100], np.exp(2j * np.pi * 50 * tone.axis[100:-100]),
+                                    atol=1e-2), "Analytic signal test failed")
+
+    def test_batch(self):
+        values = np.stack([self.values, self.values[::-1], 2 * self.values])
+        signal2 = Signal2(np.arange(3), self.signal.axis, values)
+        batch = hilbert.analytic_batch(signal2)
+        self.assertTrue(np.allclose(batch.values[1], hilbert.analytic(values[1])), "Batched analytic test failed")
+        columns = hilbert.analytic_batch(Signal2(self.signal.axis, np.arange(3), values.T), axis=0)
+        self.assertTrue(np.allclose(columns.values, batch.values.T), "Batched analytic test failed")
+
+        signals = hilbert.analytic_batch([self.signal, self.signal * 2])
+        self.assertTrue(np.allclose(signals[1].values, 2 * hilbert.analytic(self.values)),
+                        "Batched analytic test failed")
+
+    def test_stream(self):
+        taps = 1j * hilbert.hilbert_taps(127)
+        taps[63] += 1
+        expected = signal.lfilter(taps, 1, self.values)
+        for fft_size in (None, 127, 300):
+            stream = hilbert.StreamHilbert(127, fft_size)
+            blocks = [stream(self.values[i:i + 77]) for i in range(0, len(self.values), 77)]
+            self.assertTrue(np.allclose(np.concatenate(blocks), expected), "Streaming Hilbert test failed")
+        self.assertEqual(len(stream(np.zeros(0))), 0, "Streaming Hilbert test failed")
+        self.assertRaises(ValueError, hilbert.StreamHilbert, 128)
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from scipy import signal
+
+from chirper.sgn import Signal1
+from chirper.transforms import PSDAccumulator, bartlett, periodogram, welch
+
+
+class TestPSD(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.samp_freq = 1000
+        self.values = rng.standard_normal(5000)
+        self.signal = Signal1(np.arange(5000) / self.samp_freq, self.values)
+
+    def test_estimators(self):
+        freqs, expected = signal.welch(self.values, self.samp_freq, nperseg=256, detrend=False)
+        result = welch(self.signal)
+        self.assertTrue(np.allclose(result.axis, freqs), "Welch PSD test failed")
+        self.assertTrue(np.allclose(result.values, expected), "Welch PSD test failed")
+        self.assertEqual(self.signal.welch(), result, "Welch PSD test failed")
+
+        _, expected = signal.welch(self.values, self.samp_freq, "boxcar", nperseg=128,
+                                   noverlap=0, detrend=False, scaling="spectrum")
+        result = bartlett(self.signal, 128, scaling="spectrum")
+        self.assertTrue(np.allclose(result.values, expected), "Bartlett PSD test failed")
+
+        _, expected = signal.periodogram(self.values, self.samp_freq, detrend=False)
+        self.assertTrue(np.allclose(periodogram(self.signal).values, expected), "Periodogram test failed")
+
+    def test_power(self):
+        # The density integrates to the power of white noise
+        result = welch(self.signal, 512)
+        power = np.sum(result.values) * (result.axis[1] - result.axis[0])
+        self.assertAlmostEqual(power, np.var(self.values), delta=0.1, msg="PSD power test failed")
+
+    def test_accumulator(self):
+        accumulator = PSDAccumulator(self.samp_freq, 256)
+        with self.assertRaises(ValueError):
+            accumulator.psd()
+        for start in range(0, len(self.values), 777):
+            accumulator.update(self.values[start:start + 777])
+        self.assertTrue(np.allclose(accumulator.psd().values, welch(self.signal).values),
+                        "PSD accumulator test failed")
+
+        accumulator.reset()
+        accumulator.update(self.signal)
+        self.assertEqual(accumulator.psd(), welch(self.signal), "PSD accumulator test failed")
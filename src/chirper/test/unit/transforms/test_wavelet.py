@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+
+from chirper.sgn import Signal1, Signal2
+from chirper.transforms import wavelet
+
+
+class TestWavelet(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.values = rng.standard_normal(1000)
+        self.signal = Signal1(np.arange(1000) / 100, self.values)
+        self.image = Signal2(np.arange(50), np.arange(70), rng.standard_normal((50, 70)))
+
+    def test_lift(self):
+        for name in wavelet.WAVELETS:
+            approx, detail = wavelet.lift(np.ones(16), name)
+            self.assertTrue(np.allclose(approx, np.sqrt(2)), f"Lifting test failed for {name}")
+            self.assertTrue(np.allclose(detail, 0), f"Lifting test failed for {name}")
+            if name != "haar":
+                # Every other wavelet has at least two vanishing moments
+                _, detail = wavelet.lift(np.arange(32.), name)
+                self.assertTrue(np.allclose(detail[2:-2], 0), f"Lifting test failed for {name}")
+
+        # Orthogonal wavelets keep the energy
+        approx, detail = wavelet.lift(self.values, "db2")
+        self.assertAlmostEqual(np.sum(approx ** 2) + np.sum(detail ** 2), np.sum(self.values ** 2),
+                               msg="Lifting test failed")
+
+    def test_dwt1(self):
+        for name in wavelet.WAVELETS:
+            coefficients = wavelet.dwt1(self.signal, name)
+            self.assertEqual(coefficients.values.shape, (1024,), "DWT test failed")
+            self.assertEqual(len(coefficients.approx()), 1024 >> coefficients.level, "DWT test failed")
+            self.assertEqual(len(coefficients.detail(1)), 512, "DWT test failed")
+            reconstructed = wavelet.idwt1(coefficients)
+            self.assertTrue(np.array_equal(reconstructed.axis, self.signal.axis), f"IDWT test failed for {name}")
+            self.assertTrue(np.allclose(reconstructed.values, self.values), f"IDWT test failed for {name}")
+
+    def test_dwt2(self):
+        for name in wavelet.WAVELETS:
+            coefficients = wavelet.dwt2(self.image, name, 3)
+            self.assertEqual(coefficients.approx().shape, (7, 9), "DWT test failed")
+            self.assertEqual([detail.shape for detail in coefficients.detail(1)], [(28, 36)] * 3, "DWT test failed")
+            reconstructed = wavelet.idwt2(coefficients)
+            self.assertTrue(np.allclose(reconstructed.values, self.image.values), f"IDWT test failed for {name}")
+
+    def test_stream(self):
+        stream = wavelet.StreamDWT("cdf97", frame_length=64)
+        frames = []
+        for start in range(0, 1000, 77):
+            frames += stream(Signal1(self.signal.axis[start:start + 77], self.values[start:start + 77]))
+        self.assertEqual(len(frames), 1000 // 64, "Streaming DWT test failed")
+        self.assertTrue(np.allclose(frames[1].signal.axis, self.signal.axis[64:128]), "Streaming DWT test failed")
+        reconstructed = np.concatenate([wavelet.idwt1(frame).values for frame in frames])
+        self.assertTrue(np.allclose(reconstructed, self.values[:len(reconstructed)]), "Streaming DWT test failed")
+        self.assertRaises(ValueError, wavelet.StreamDWT, "haar", 4, 100)
@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+from scipy import signal
+
+from chirper.sgn import Signal1
+from chirper.transforms import z
+
+
+class TestZ(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.values = rng.standard_normal(100)
+        self.signal = Signal1(np.arange(100) / 1000 + 0.5, self.values)
+
+    def test_czt(self):
+        self.assertTrue(np.allclose(z.czt(self.values), np.fft.fft(self.values)), "CZT test failed")
+        w, a = 0.999 * np.exp(-0.05j), 1.1 * np.exp(0.3j)
+        self.assertTrue(np.allclose(z.czt(self.values, 37, w, a), signal.czt(self.values, 37, w, a)),
+                        "CZT test failed")
+
+        batch = np.stack([self.values, 2 * self.values])
+        self.assertTrue(np.allclose(z.czt(batch.T, 40, axis=0), signal.czt(batch, 40).T), "Batched CZT test failed")
+
+        z.clear_cache()
+        z.czt(self.values, 37, w, a)
+        self.assertEqual(z._chirps.cache_info().hits, 0, "CZT cache test failed")
+        z.czt(2 * self.values, 37, w, a)
+        self.assertEqual(z._chirps.cache_info().hits, 1, "CZT cache test failed")
+
+    def test_z1(self):
+        self.assertTrue(np.allclose(z.z1(self.signal).values, np.fft.fft(self.values)), "Z transform test failed")
+        fast = z.z1(self.signal, 30, radius=1.05, start=0.2, step=0.01, ratio=0.999)
+        direct = z.z1(self.signal, 30, radius=1.05, start=0.2, step=0.01, ratio=0.999, method="dzt")
+        self.assertTrue(np.allclose(fast.values, direct.values), "Z transform test failed")
+        self.assertTrue(np.allclose(fast.axis, 0.2 + 0.01 * np.arange(30)), "Z transform test failed")
+
+    def test_zoom_fft(self):
+        zoomed = z.zoom_fft(self.signal, 100, 200, 50)
+        self.assertTrue(np.allclose(zoomed.values, signal.zoom_fft(self.values, [100, 200], 50, fs=1000)),
+                        "Zoom FFT test failed")
+        self.assertTrue(np.allclose(zoomed.axis, np.arange(100, 200, 2)), "Zoom FFT test failed")
+        self.assertRaises(ValueError, z.zoom_fft, Signal1([0, 1, 3], [1, 2, 3]), 0, 1)
@@ -0,0 +1,49 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from scipy.io import wavfile
+
+from chirper import config
+from chirper.sgn import Signal1, Signal2
+from chirper.transforms import f1, f2
+from chirper.utils import dtypes
+
+
+class TestDtypes(unittest.TestCase):
+    def setUp(self):
+        self.policy = config.DTYPE_POLICY
+        self.axis = np.arange(64) / 64
+        self.values = np.sin(2 * np.pi * 4 * self.axis)
+
+    def tearDown(self):
+        config.DTYPE_POLICY = self.policy
+
+    def test_preserve(self):
+        config.DTYPE_POLICY = None
+        self.assertEqual(dtypes.real_dtype(np.int16), np.float64, "Dtype policy test failed")
+        self.assertEqual(dtypes.complex_dtype(np.float32), np.complex64, "Dtype policy test failed")
+        signal = Signal1(self.axis, self.values.astype(np.float32))
+        self.assertEqual(signal.values.dtype, np.float32, "Dtype policy test failed")
+        self.assertEqual(f1(signal).values.dtype, np.complex64, "Dtype policy test failed")
+
+    def test_single(self):
+        config.DTYPE_POLICY = "single"
+        signal = Signal1(self.axis, self.values)
+        self.assertEqual(signal.axis.dtype, np.float64, "Dtype policy test failed")
+        self.assertEqual(signal.values.dtype, np.float32, "Dtype policy test failed")
+        self.assertEqual(f1(signal).values.dtype, np.complex64, "Dtype policy test failed")
+
+        signal2 = Signal2(self.axis, self.axis, np.outer(self.values, self.values))
+        self.assertEqual(f2(signal2).values.dtype, np.complex64, "Dtype policy test failed")
+
+        with tempfile.TemporaryDirectory() as dirname:
+            filename = os.path.join(dirname, "test.wav")
+            wavfile.write(filename, 64, (self.values * 1000).astype(np.int16))
+            self.assertEqual(Signal1.from_file(filename).values.dtype, np.float32,
+                             "Dtype policy test failed")
+
+    def test_invalid(self):
+        config.DTYPE_POLICY = "half"
+        with self.assertRaises(ValueError):
+            dtypes.real_dtype()
@@ -0,0 +1,38 @@
+import unittest
+import numpy as np
+from scipy.signal import windows
+
+from chirper.utils import window
+
+
+class TestWindow(unittest.TestCase):
+    def test_windows(self):
+        self.assertTrue(np.allclose(window.hann(16), windows.hann(16, sym=False)), "Window test failed")
+        self.assertTrue(np.allclose(window.hann(16, sym=True), windows.hann(16)), "Window test failed")
+        self.assertTrue(np.allclose(window.kaiser(16, 6), windows.kaiser(16, 6, sym=False)),
+                        "Window test failed")
+        self.assertTrue(np.allclose(window.tukey(16, 0.25), windows.tukey(16, 0.25, sym=False)),
+                        "Window test failed")
+        for name in window.WINDOWS:
+            self.assertEqual(len(window.get_window(name, 33)), 33, "Window test failed")
+        with self.assertRaises(ValueError):
+            window.get_window("triangle", 16)
+
+    def test_cache(self):
+        hann = window.get_window("hann", 128)
+        self.assertIs(window.hann(128), hann, "Window cache test failed")
+        self.assertIsNot(window.hann(128, sym=True), hann, "Window cache test failed")
+        self.assertFalse(hann.flags.writeable, "Window cache test failed")
+        with self.assertRaises(ValueError):
+            hann[0] = 1
+
+    def test_gains(self):
+        rectangular = window.get_window("rectangular", 64)
+        self.assertAlmostEqual(window.coherent_gain(rectangular), 1, msg="Window gain test failed")
+        self.assertAlmostEqual(window.enbw(rectangular), 1, msg="Window gain test failed")
+
+        hann = window.hann(64)
+        self.assertAlmostEqual(window.coherent_gain(hann), 0.5, msg="Window gain test failed")
+        self.assertAlmostEqual(window.noise_gain(hann), 0.375, msg="Window gain test failed")
+        self.assertAlmostEqual(window.enbw(hann), 1.5, msg="Window gain test failed")
+        self.assertAlmostEqual(window.enbw(hann, 6400), 150, msg="Window gain test failed")
@@ -7,15 +7,25 @@ This subpackage gives access to different integral transforms used for
 signal processing purposes. The ones currently available are:
 - Fourier
 - Inverse Fourier
-- Hilbert
+- Hilbert (and the analytic signal, also for batches and streams)
 - Cosine
 - Sine
 - Short-time Fourier
+- Z (chirp-z transform and zoom FFT)
+- Discrete wavelet (lifting scheme)
+- Continuous wavelet (scalogram)
+- Goertzel and sliding DFT, for tracking a few frequencies
+- Power spectral density estimates (periodogram, Welch, Bartlett)
 """
 
 from chirper.transforms.cosine import c1, c2
+from chirper.transforms.cwt import cwt1, scalogram
 from chirper.transforms.fourier import f1, f2
-from chirper.transforms.hilbert import h1
+from chirper.transforms.goertzel import goertzel1, GoertzelDetector, SlidingDFT
+from chirper.transforms.hilbert import h1, analytic_signal, analytic_batch, StreamHilbert
 from chirper.transforms.ifourier import if1, if2
+from chirper.transforms.psd import periodogram, welch, bartlett, PSDAccumulator
 from chirper.transforms.sine import s1, s2
 from chirper.transforms.stft import stft1
+from chirper.transforms.wavelet import dwt1, idwt1, dwt2, idwt2, StreamDWT
+from chirper.transforms.z import z1, czt, zoom_fft
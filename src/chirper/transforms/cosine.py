@@ -4,6 +4,7 @@ import numpy as np
 from tqdm import tqdm
 
 from chirper.config import C1_METHOD, C2_METHOD
+from chirper.utils import dtypes
 if TYPE_CHECKING:
     from chirper.sgn import Signal1, Signal2
 
@@ -39,7 +40,7 @@ def c1(signal1: Signal1, method=C1_METHOD) -> Signal1:
 def _calculate_i_1(signal1: Signal1) -> Signal1:
     output = signal1.clone()
     signal_len = len(output)
-    new_values = np.zeros(signal_len)
+    new_values = np.zeros(signal_len, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(signal_len), "Calculating DCT-I"):
         temp = 0
         for n, x in enumerate(output.values[1:-1]):
@@ -53,7 +54,7 @@ def _calculate_i_1(signal1: Signal1) -> Signal1:
 def _calculate_ii_1(signal1: Signal1) -> Signal1:
     output = signal1.clone()
     signal_len = len(output)
-    new_values = np.zeros(signal_len)
+    new_values = np.zeros(signal_len, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(signal_len), "Calculating DCT-II"):
         temp = 0
         for n, x in enumerate(output.values):
@@ -66,7 +67,7 @@ def _calculate_ii_1(signal1: Signal1) -> Signal1:
 def _calculate_iii_1(signal1: Signal1) -> Signal1:
     output = signal1.clone()
     signal_len = len(output)
-    new_values = np.zeros(signal_len)
+    new_values = np.zeros(signal_len, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(signal_len), "Calculating DCT-III"):
         temp = 0
         for n, x in enumerate(output.values[1:]):
@@ -79,7 +80,7 @@ def _calculate_iii_1(signal1: Signal1) -> Signal1:
 def _calculate_iv_1(signal1: Signal1) -> Signal1:
     output = signal1.clone()
     signal_len = len(output)
-    new_values = np.zeros(signal_len)
+    new_values = np.zeros(signal_len, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(signal_len), "Calculating DCT-IV"):
         temp = 0
         for n, x in enumerate(output.values):
@@ -139,7 +140,7 @@ def _calculate_ii_2(signal2: Signal2) -> Signal2:
     output = signal2.clone()
     signal_shape = output.shape()
     N, M = signal_shape
-    new_values = np.zeros(signal_shape)
+    new_values = np.zeros(signal_shape, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(N), "Calculating 2D DCT-II"):
         for l in range(M):
             temp = 0
@@ -156,7 +157,7 @@ def _calculate_iv_2(signal2: Signal2) -> Signal2:
     output = signal2.clone()
     signal_shape = output.shape()
     N, M = signal_shape
-    new_values = np.zeros(signal_shape)
+    new_values = np.zeros(signal_shape, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(N), "Calculating 2D DCT-IV"):
         for l in range(M):
             temp = 0
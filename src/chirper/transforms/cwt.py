@@ -0,0 +1,140 @@
+"""Module for the continuous wavelet transform (CWT).
+
+The CWT correlates the signal with scaled versions of a wavelet, which
+gives a time-frequency representation whose resolution adapts to the
+frequency: short wavelets at high frequencies and long ones at low
+frequencies. Each scale is a product in the frequency domain, so the
+signal is transformed once, multiplied by the spectrum of the wavelet
+at every scale, and transformed back. The scales are processed in
+batches of `CWT_BATCH_SIZE`, whose wavelet spectra are built on the fly,
+so at most a batch of spectra and inverse transforms is kept in memory
+at once.
+
+The wavelets (normalized as in Torrence and Compo, 1998) are in
+`WAVELETS`:
+- morlet : Complex Morlet, with :math:`\\omega_0 = 6`.
+- mexican_hat : Mexican hat (second derivative of a Gaussian), which
+  is real.
+- paul : Complex Paul of order 4.
+"""
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from math import factorial, gamma
+import numpy as np
+from scipy import fft
+
+from chirper.config import CWT_BATCH_SIZE, CWT_FREQUENCIES, CWT_WAVELET
+from chirper.sgn import Signal1, Signal2
+from chirper.utils import dtypes, math_lib
+
+_MORLET_W0 = 6
+_PAUL_ORDER = 4
+
+
+def _morlet(scaled_freqs: np.ndarray) -> np.ndarray:
+    return np.pi ** -0.25 * (scaled_freqs > 0) * np.exp(-(scaled_freqs - _MORLET_W0) ** 2 / 2)
+
+
+def _mexican_hat(scaled_freqs: np.ndarray) -> np.ndarray:
+    return scaled_freqs ** 2 * np.exp(-scaled_freqs ** 2 / 2) / np.sqrt(gamma(2.5))
+
+
+def _paul(scaled_freqs: np.ndarray) -> np.ndarray:
+    positive = np.maximum(scaled_freqs, 0)
+    norm = 2 ** _PAUL_ORDER / np.sqrt(_PAUL_ORDER * factorial(2 * _PAUL_ORDER - 1))
+    return norm * positive ** _PAUL_ORDER * np.exp(-positive)
+
+
+# name: (spectrum as a function of the scaled angular frequency,
+#        period of the scale 1 in the same units as the scale)
+WAVELETS = {
+    "morlet": (_morlet, 4 * np.pi / (_MORLET_W0 + np.sqrt(2 + _MORLET_W0 ** 2))),
+    "mexican_hat": (_mexican_hat, 2 * np.pi / np.sqrt(2.5)),
+    "paul": (_paul, 4 * np.pi / (2 * _PAUL_ORDER + 1)),
+}
+
+
+def cwt1(signal1: Signal1, freqs=None, wavelet=CWT_WAVELET, batch_size=CWT_BATCH_SIZE,
+         workers: int = None) -> Signal2:
+    """Calculates the continuous wavelet transform of a given signal.
+
+    The signal is padded with zeros to a fast FFT size and treated as
+    periodic, so the coefficients near the edges (within the support of
+    the wavelet) are not accurate.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Uniformly sampled signal.
+    freqs : array_like, optional
+        Frequencies in hertz where the transform is calculated, by
+        default `CWT_FREQUENCIES` frequencies spaced geometrically from
+        the lowest one that fits twice in the signal to the Nyquist
+        frequency.
+    wavelet : {"morlet", "mexican_hat", "paul"}, optional
+        Wavelet used, by default CWT_WAVELET.
+    batch_size : int, optional
+        Number of scales transformed at a time, by default
+        CWT_BATCH_SIZE.
+    workers : int, optional
+        Number of threads that transform the batches, by default None,
+        which transforms them one after the other.
+
+    Returns
+    -------
+    Signal2
+        Complex coefficients, with the time (the axis of the signal) as
+        `ax0` and the frequency as `ax1`.
+
+    Raises
+    ------
+    ValueError
+        If the signal is not uniformly sampled.
+    """
+    step = math_lib.uniform_step(signal1.axis)
+    if step is None:
+        raise ValueError("The CWT needs a uniformly sampled signal.")
+    length = len(signal1.values)
+    if freqs is None:
+        freqs = np.geomspace(2 / (length * step), 1 / (2 * step), CWT_FREQUENCIES)
+    freqs = np.asarray(freqs, dtype=float)
+    scales = 1 / (freqs * WAVELETS[wavelet][1])
+
+    size = fft.next_fast_len(length)
+    spectrum = fft.fft(signal1.values, size)
+    ang_freqs = 2 * np.pi * fft.fftfreq(size, step)
+    new_values = np.empty((length, len(freqs)), dtype=dtypes.complex_dtype(signal1.values.dtype))
+
+    def transform(start):
+        batch = slice(start, start + batch_size)
+        batch_scales = scales[batch, None]
+        # Spectra of the wavelets at each scale, normalized to unit energy
+        wavelets = np.sqrt(2 * np.pi * batch_scales / step) * WAVELETS[wavelet][0](batch_scales * ang_freqs)
+        # Each row is the signal correlated with the wavelet at a scale
+        rows = fft.ifft(wavelets * spectrum, axis=1, overwrite_x=True)
+        new_values[:, batch] = rows[:, :length].T
+
+    starts = range(0, len(scales), batch_size)
+    if workers is None or workers <= 1:
+        for start in starts:
+            transform(start)
+    else:
+        with ThreadPoolExecutor(workers) as executor:
+            list(executor.map(transform, starts))
+    return Signal2(signal1.axis.copy(), freqs, new_values, copy=False)
+
+
+def scalogram(signal1: Signal1, freqs=None, wavelet=CWT_WAVELET, batch_size=CWT_BATCH_SIZE,
+              workers: int = None) -> Signal2:
+    """Calculates the scalogram of a given signal, which is the squared
+    magnitude of its CWT (see `cwt1` for the parameters).
+
+    Returns
+    -------
+    Signal2
+        Scalogram, with the time as `ax0` and the frequency as `ax1`.
+    """
+    coefficients = cwt1(signal1, freqs, wavelet, batch_size, workers)
+    power = coefficients.values.real ** 2 + coefficients.values.imag ** 2
+    return Signal2(coefficients.ax0, coefficients.ax1, power, copy=False)
+
@@ -4,6 +4,7 @@ import numpy as np
 from tqdm import tqdm
 
 from chirper.config import F1_METHOD, F2_METHOD
+from chirper.utils import dtypes
 if TYPE_CHECKING:
     from chirper.sgn import Signal1, Signal2
 
@@ -12,7 +13,7 @@ if TYPE_CHECKING:
 ########################################################################################################################
 
 
-def f1(signal1: Signal1, method=F1_METHOD, shift=True, scale=True) -> Signal1:
+def f1(signal1: Signal1, method=F1_METHOD, shift=True, scale=True, out=None) -> Signal1:
     """Calculates the one dimensional Fourier transform of a given
     signal.
 
@@ -31,21 +32,25 @@ def f1(signal1: Signal1, method=F1_METHOD, shift=True, scale=True) -> Signal1:
     scale : bool, optional
         Whether to scale the frequencies or not after applying the
         transform, by default True.
+    out : Signal1, optional
+        Signal with the same shape where the transform is stored, by
+        default None, which creates a new one. Its values should be
+        complex, and it can be `signal1` itself.
 
     Returns
     -------
     Signal1
         Signal representing the Fourier Transform.
     """
-    output = F1_METHODS[method](signal1)
+    output = F1_METHODS[method](signal1, out)
     if scale:
         output.axis *= output.sampling_freq() / output.span()
     if shift:
-        output = freq_shift1(output)
+        output = freq_shift1(output, out=output)
     return output
 
 
-def _calculate_dft1(signal1: Signal1) -> Signal1:
+def _calculate_dft1(signal1: Signal1, out=None) -> Signal1:
     """Calculates the Discrete Fourier Transform (DFT) of a signal :math:`\\mathcal{F}\\{x[n]\\} = X[k]`, such that
 
     .. math::
@@ -55,61 +60,78 @@ def _calculate_dft1(signal1: Signal1) -> Signal1:
     ----------
     signal1 : Signal1
         One dimensional signal to calculate the Fourier transform.
+    out : Signal1, optional
+        Signal where the transform is stored, by default None.
 
     Returns
     -------
     Signal1
         Signal representing the Fourier Transform.
     """
-    output = signal1.clone()
-    signal_len = len(output)
-    new_values = np.zeros(signal_len, dtype=complex)
+    values = signal1.values
+    signal_len = len(signal1)
+    new_values = np.zeros(signal_len, dtype=dtypes.complex_dtype(values.dtype))
     for k in tqdm(range(signal_len), "Calculating DFT"):
         temp = 0 + 0j
         for n in range(signal_len):
-            temp += output.values[n] * \
+            temp += values[n] * \
                 np.exp(-1j * (2 * n * k * np.pi / signal_len))
         new_values[k] = temp
-    output.values = new_values
+    output = signal1._out(out, new_values.dtype)
+    output.values[:] = new_values
     return output
 
 
-def _calculate_fft1(signal1: Signal1) -> Signal1:
+def _calculate_fft1(signal1: Signal1, out=None) -> Signal1:
     """Calculates the FFT of a given signal.
 
     Parameters
     ----------
     signal1 : Signal1
         One dimensional signal to calculate the Fourier transform.
+    out : Signal1, optional
+        Signal where the transform is stored, by default None.
 
     Returns
     -------
     Signal1
         Signal representing the Fourier Transform.
     """
-    output = signal1.clone()
-    output.values = np.fft.fft(output.values)
+    output = signal1._out(out, dtypes.complex_dtype(signal1.values.dtype))
+    output.values[:] = np.fft.fft(signal1.values)
     return output
 
 
-def freq_shift1(signal1: Signal1) -> Signal1:
+def freq_shift1(signal1: Signal1, out=None) -> Signal1:
     """Shift the frequencies of the signal.
 
     Parameters
     ----------
     signal1 : Signal1
         Signal to shift.
+    out : Signal1, optional
+        Signal with the same shape where the result is stored, by
+        default None, which creates a new one. It can be `signal1`
+        itself.
 
     Returns
     -------
     Signal1
         Shifted signal
     """
-    output = signal1.clone()
-    signal_len = len(output)
-    output.axis = output.axis - output.span() / 2
-    output.values = np.array(
-        [*output.values[signal_len // 2:], *output.values[:signal_len // 2]])
+    return _rotate(signal1, -signal1.span() / 2, out)
+
+
+def _rotate(signal1: Signal1, axis_shift: float, out=None) -> Signal1:
+    # Moves the second half of the values to the front and shifts the
+    # axis, writing into `out` when given
+    values = signal1.values
+    signal_len = len(signal1)
+    output = signal1._out(out, values.dtype)
+    if np.shares_memory(output.values, values):
+        values = values.copy()
+    np.add(output.axis, axis_shift, out=output.axis)
+    np.concatenate((values[signal_len // 2:], values[:signal_len // 2]), out=output.values)
     return output
 
 
@@ -123,59 +145,90 @@ F1_METHODS = {
 ########################################################################################################################
 
 
-def f2(signal2: Signal2, method=F2_METHOD, shift=True, scale=True) -> Signal2:
-    output = F2_METHODS[method](signal2)
+def f2(signal2: Signal2, method=F2_METHOD, shift=True, scale=True, out=None) -> Signal2:
+    """Calculates the two dimensional Fourier transform of a given
+    signal.
+
+    Parameters
+    ----------
+    signal2 : Signal2
+        Two dimensional signal to calculate the Fourier transform.
+    method : {"dft", "fft"}, optional
+        Method used to calculate the transform, by default F2_METHOD
+    shift : bool, optional
+        Whether to shift the frequencies or not after applying the
+        transform, by default True.
+    scale : bool, optional
+        Whether to scale the frequencies or not after applying the
+        transform, by default True.
+    out : Signal2, optional
+        Signal with the same shape where the transform is stored, by
+        default None, which creates a new one. Its values should be
+        complex, and it can be `signal2` itself.
+
+    Returns
+    -------
+    Signal2
+        Signal representing the Fourier Transform.
+    """
+    output = F2_METHODS[method](signal2, out)
     if scale:
         output.ax0 *= output.ax0_sampling_freq() / output.ax0_span()
         output.ax1 *= output.ax1_sampling_freq() / output.ax1_span()
         # output.ax0 = output.ax0 * output.ax0_sampling_freq() / output.ax0_span()
         # output.ax1 = output.ax1 * output.ax1_sampling_freq() / output.ax1_span()
     if shift:
-        output = freq_shift2(output)
+        output = freq_shift2(output, out=output)
     return output
 
 
-def _calculate_dft2(signal2: Signal2) -> Signal2:
-    output = signal2.clone()
-    ax0_len, ax1_len = output.shape()
-    new_values = np.zeros((ax0_len, ax1_len), dtype=complex)
+def _calculate_dft2(signal2: Signal2, out=None) -> Signal2:
+    values = signal2.values
+    ax0_len, ax1_len = signal2.shape()
+    new_values = np.zeros((ax0_len, ax1_len), dtype=dtypes.complex_dtype(values.dtype))
     for u in tqdm(range(ax0_len), "Calculating DFT"):
         for v in range(ax1_len):
             temp = 0 + 0j
             for n in range(ax0_len):
                 for m in range(ax1_len):
-                    temp += output.values[n, m] * \
+                    temp += values[n, m] * \
                         np.exp(-1j * 2 * np.pi *
                                (u * n / ax0_len + v * m / ax1_len))
             new_values[u, v] = temp
-    output.values = new_values
+    output = signal2._out(out, new_values.dtype)
+    output.values[:] = new_values
     return output
 
 
-def _calculate_fft2(signal2: Signal2) -> Signal2:
-    output = signal2.clone()
-    output.values = np.fft.fft2(output.values)
+def _calculate_fft2(signal2: Signal2, out=None) -> Signal2:
+    output = signal2._out(out, dtypes.complex_dtype(signal2.values.dtype))
+    output.values[:] = np.fft.fft2(signal2.values)
     return output
 
 
-def freq_shift2(signal2: Signal2) -> Signal2:
+def freq_shift2(signal2: Signal2, out=None) -> Signal2:
     """Shift the frequencies of the signal.
 
     Parameters
     ----------
     signal2 : Signal2
         Signal to shift.
+    out : Signal2, optional
+        Signal with the same shape where the result is stored, by
+        default None, which creates a new one. It can be `signal2`
+        itself.
 
     Returns
     -------
     Signal2
         Shifted signal
     """
-    output = signal2.clone()
-    ax0_len, ax1_len = output.shape()
-    output.ax0 = output.ax0 - output.ax0_span() / 2
-    output.ax1 = output.ax1 - output.ax1_span() / 2
-    output.values = np.fft.fftshift(output.values)
+    values = signal2.values
+    ax0_span, ax1_span = signal2.ax0_span(), signal2.ax1_span()
+    output = signal2._out(out, values.dtype)
+    np.subtract(output.ax0, ax0_span / 2, out=output.ax0)
+    np.subtract(output.ax1, ax1_span / 2, out=output.ax1)
+    output.values[:] = np.fft.fftshift(values)
     return output
 
 
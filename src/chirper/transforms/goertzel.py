@@ -0,0 +1,237 @@
+"""Module for tracking a few frequencies of a signal.
+
+When only a handful of tones matter (e.g DTMF, or the pilot of a
+carrier), calculating the whole spectrum wastes most of the work. These
+tools calculate the DFT only at the given frequencies, vectorized
+across them:
+
+- The Goertzel algorithm gets each frequency of a frame of :math:`N`
+  samples with a second order recursion (run as an IIR filter over
+  every frame at once), in :math:`O(N)` per frequency with a single
+  real multiplication per sample.
+- The sliding DFT updates some bins of the DFT of the last :math:`N`
+  samples at every new sample, in :math:`O(1)` per bin.
+
+Both keep their state between blocks, so they work on live streams.
+"""
+import numpy as np
+from scipy import signal
+
+from chirper.config import GOERTZEL_FRAME_LENGTH, HERTZ, SDFT_WINDOW_LENGTH
+from chirper.sgn import Signal1, Signal2
+from chirper.utils import dispatching, dtypes, math_lib
+
+########################################################################################################################
+# ||||||||||||||||||||||||||||||||||||||||||||||||| Goertzel ||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def goertzel1(signal1: Signal1, freqs, hertz=HERTZ) -> Signal1:
+    """Calculates the DFT of a signal at the given frequencies with the
+    Goertzel algorithm.
+
+    The frequencies don't need to be bins of the DFT of the signal.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Uniformly sampled real signal.
+    freqs : array_like
+        Frequencies to calculate.
+    hertz : bool, optional
+        Whether the frequencies are given in hertz, by default HERTZ.
+
+    Returns
+    -------
+    Signal1
+        Complex DFT :math:`\\sum_n x[n] e^{-j \\omega n T}`, taking the
+        first sample as the origin like `f1`, with the frequencies as
+        its axis.
+
+    Raises
+    ------
+    ValueError
+        If the signal is not uniformly sampled.
+    """
+    step = math_lib.uniform_step(signal1.axis)
+    if step is None:
+        raise ValueError("The Goertzel algorithm needs a uniformly sampled signal.")
+    freqs = np.atleast_1d(np.asarray(freqs, dtype=float))
+    ang_freqs = freqs * step * (2 * np.pi if hertz else 1)
+    new_values = _goertzel(signal1.values[None, :], ang_freqs)[0]
+    return type(signal1)(freqs, new_values, copy=False)
+
+
+def _goertzel(frames: np.ndarray, ang_freqs: np.ndarray) -> np.ndarray:
+    # Runs the recursion over every frame at once (in C, frequency by
+    # frequency), and corrects the phase of the last output
+    length = frames.shape[1]
+    last = np.zeros((len(frames), len(ang_freqs)), dtype=dtypes.real_dtype(frames.dtype))
+    before = np.zeros_like(last)
+    if length:
+        for index, ang_freq in enumerate(ang_freqs):
+            states = signal.lfilter([1], [1, -2 * np.cos(ang_freq), 1], frames, axis=-1)
+            last[:, index] = states[:, -1]
+            if length > 1:
+                before[:, index] = states[:, -2]
+    return (last - np.exp(-1j * ang_freqs) * before) * np.exp(-1j * ang_freqs * (length - 1))
+
+
+class GoertzelDetector:
+    """Goertzel algorithm over consecutive frames of a signal given
+    block by block.
+
+    The samples are gathered into frames of `frame_length` samples, and
+    the DFT of every completed frame is calculated at the given
+    frequencies, keeping only the samples of the unfinished frame
+    between blocks.
+    """
+
+    def __init__(self, freqs, samp_freq: float, frame_length=GOERTZEL_FRAME_LENGTH, hertz=HERTZ):
+        """Creates a Goertzel detector.
+
+        Parameters
+        ----------
+        freqs : array_like
+            Frequencies to detect.
+        samp_freq : float
+            Sampling frequency of the signal.
+        frame_length : int, optional
+            Number of samples of each frame, by default
+            GOERTZEL_FRAME_LENGTH. Longer frames separate closer
+            frequencies, but react slower.
+        hertz : bool, optional
+            Whether the frequencies are given in hertz, by default
+            HERTZ.
+        """
+        self.freqs = np.atleast_1d(np.asarray(freqs, dtype=float))
+        self.samp_freq = samp_freq
+        self.frame_length = frame_length
+        self.ang_freqs = self.freqs / samp_freq * (2 * np.pi if hertz else 1)
+        self.reset()
+
+    def __call__(self, block):
+        return self.process(block)
+
+    def reset(self):
+        """Forgets the unfinished frame."""
+        self.pending = None
+
+    def process(self, block):
+        """Calculates the DFT of the frames completed by the next block.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the signal.
+
+        Returns
+        -------
+        np.ndarray or Signal2
+            Complex DFT with shape `(frames, len(freqs))`, whose power
+            `abs(X) ** 2` is what is usually compared against a
+            threshold. Signals give a Signal2 with the time of the last
+            sample of each frame as `ax0` and the frequency as `ax1`.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        axis = block.axis if is_signal else None
+        if self.pending is not None:
+            values = np.concatenate((self.pending[1], values))
+            axis = np.concatenate((self.pending[0], axis)) if is_signal else None
+
+        used = len(values) - len(values) % self.frame_length
+        frames = values[:used].reshape(-1, self.frame_length)
+        new_values = _goertzel(frames, self.ang_freqs)
+        self.pending = (axis[used:] if is_signal else None, values[used:])
+        if not is_signal:
+            return new_values
+        return Signal2(axis[self.frame_length - 1:used:self.frame_length], self.freqs.copy(), new_values,
+                       copy=False)
+
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||| Sliding DFT ||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+class SlidingDFT:
+    """DFT of the last `window_length` samples of a signal, updated at
+    every sample for the given bins only.
+
+    Each new sample :math:`x[n]` updates a bin with
+    :math:`X_k[n] = (X_k[n - 1] + x[n] - x[n - N]) e^{j 2 \\pi k / N}`,
+    which is evaluated for whole blocks at once with a cumulative sum.
+    Before the first `window_length` samples, the missing ones are
+    zeros. The recursion is only marginally stable, so very long streams
+    accumulate rounding errors; `reset` starts over.
+    """
+
+    def __init__(self, freqs, samp_freq: float, window_length=SDFT_WINDOW_LENGTH, hertz=HERTZ):
+        """Creates a sliding DFT.
+
+        Parameters
+        ----------
+        freqs : array_like
+            Frequencies to track, which are rounded to the nearest bin
+            of a DFT of `window_length` samples (see `freqs`).
+        samp_freq : float
+            Sampling frequency of the signal.
+        window_length : int, optional
+            Number of samples of the window, by default
+            SDFT_WINDOW_LENGTH.
+        hertz : bool, optional
+            Whether the frequencies are given in hertz, by default
+            HERTZ.
+        """
+        resolution = samp_freq / window_length * (1 if hertz else 2 * np.pi)
+        self.bins = np.rint(np.atleast_1d(np.asarray(freqs, dtype=float)) / resolution).astype(int)
+        self.freqs = self.bins * resolution
+        self.window_length = window_length
+        self.ang_freqs = 2 * np.pi * self.bins / window_length
+        self.reset()
+
+    def __call__(self, block):
+        return self.process(block)
+
+    def reset(self):
+        """Forgets the previous samples."""
+        self.history = None
+        self.spectrum = None
+
+    def process(self, block):
+        """Updates the bins with every sample of the next block.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the signal.
+
+        Returns
+        -------
+        np.ndarray or Signal2
+            Complex bins after each sample, with shape
+            `(len(block), len(freqs))`, where the most recent sample is
+            the last one of the window. Signals give a Signal2 with the
+            time as `ax0` and the frequency as `ax1`.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        if self.history is None:
+            self.history = np.zeros(self.window_length, dtype=dtypes.real_dtype(values.dtype))
+            self.spectrum = np.zeros(len(self.bins), dtype=dtypes.complex_dtype(values.dtype))
+        extended = np.concatenate((self.history, values))
+
+        # With the phase relative to the start of the block, the bins
+        # after sample i are e^{jw(i + 1)} (X[-1] + sum_m d[m] e^{-jwm})
+        changes = values - extended[:len(values)]
+        phases = np.outer(np.arange(len(values)), self.ang_freqs)
+        new_values = np.cumsum(changes[:, None] * np.exp(-1j * phases), axis=0)
+        new_values += self.spectrum
+        new_values *= np.exp(1j * (phases + self.ang_freqs))
+
+        if len(values):
+            self.spectrum = new_values[-1].copy()
+        self.history = extended[len(extended) - self.window_length:]
+        if not is_signal:
+            return new_values
+        return Signal2(block.axis.copy(), self.freqs.copy(), new_values, copy=False)
@@ -1,19 +1,250 @@
-from scipy import signal
+"""Module for the Hilbert transform and the analytic signal.
 
-from chirper.sgn import Signal1
-from chirper.config import H1_METHOD
+The analytic signal :math:`x + j\\mathcal{H}\\{x\\}` keeps the positive
+frequencies of a real signal, doubled. It is calculated here with real
+FFTs (optionally padding the signals to sizes the FFT handles fast),
+so whole batches of signals share a single call. Signals given block by
+block are filtered with an FIR Hilbert transformer by overlap-save
+instead.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import numpy as np
+from scipy import fft, signal
+
+from chirper.config import H1_METHOD, HILBERT_TAPS
+from chirper.utils import dispatching, dtypes
+if TYPE_CHECKING:
+    from chirper.sgn import Signal1, Signal2
+
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||| Signal1 ||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
 
 
 def h1(signal1: Signal1, method=H1_METHOD) -> Signal1:
+    """Calculates the Hilbert transform of a given signal.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        One dimensional real signal.
+    method : {"scipy", "fft"}, optional
+        Method used to calculate the transform, by default H1_METHOD.
+
+    Returns
+    -------
+    Signal1
+        Signal representing the Hilbert transform.
+    """
     return H1_METHODS[method](signal1)
 
 
 def calculate_scipy(signal1: Signal1) -> Signal1:
-    output = signal1.clone()
-    output.values = signal.hilbert(output.values)
-    return output.imag_part()
+    new_values = signal.hilbert(signal1.values).imag
+    return signal1._like(new_values.astype(dtypes.real_dtype(signal1.values.dtype), copy=False))
+
+
+def calculate_fft(signal1: Signal1) -> Signal1:
+    return signal1._like(np.ascontiguousarray(analytic(signal1.values).imag))
 
 
 H1_METHODS = {
     "scipy": calculate_scipy,
+    "fft": calculate_fft,
 }
+
+
+def analytic(values: np.ndarray, axis=-1, fast=False, workers=None) -> np.ndarray:
+    """Calculates the analytic signal of real values along an axis.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Real values, with any number of dimensions. Every other axis is
+        transformed in the same call.
+    axis : int, optional
+        Axis along which the analytic signal is calculated, by default
+        -1.
+    fast : bool, optional
+        Whether to pad the values with zeros to the next size the FFT
+        handles fast, by default False. Without padding, the result is
+        the same as `scipy.signal.hilbert`, which treats the values as
+        periodic, while padding changes the result (mostly near the
+        edges) in exchange for speed on lengths with large prime
+        factors.
+    workers : int, optional
+        Number of threads used by the FFT, by default None.
+
+    Returns
+    -------
+    np.ndarray
+        Complex analytic signal, with the same shape as `values`.
+    """
+    values = np.moveaxis(np.asarray(values), axis, -1)
+    dtype = dtypes.complex_dtype(values.dtype)
+    length = values.shape[-1]
+    if length == 0:
+        return np.moveaxis(values.astype(dtype), -1, axis)
+    size = fft.next_fast_len(length, real=True) if fast else length
+
+    # Only the positive half is calculated, and the rest of the spectrum
+    # stays zero
+    half = fft.rfft(values, size, workers=workers)
+    spectrum = np.zeros((*values.shape[:-1], size), dtype=half.dtype)
+    spectrum[..., :half.shape[-1]] = half
+    spectrum[..., 1:(size + 1) // 2] *= 2
+    new_values = fft.ifft(spectrum, overwrite_x=True, workers=workers)[..., :length]
+    return np.moveaxis(new_values.astype(dtype, copy=False), -1, axis)
+
+
+def analytic_signal(signal1: Signal1, fast=False) -> Signal1:
+    """Calculates the analytic signal of a given signal (see
+    `analytic`).
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        One dimensional real signal.
+    fast : bool, optional
+        Whether to pad the values to a fast FFT size, by default False.
+
+    Returns
+    -------
+    Signal1
+        Complex signal, with the same axis.
+    """
+    return signal1._like(analytic(signal1.values, fast=fast))
+
+
+def analytic_batch(signals, axis=1, fast=False, workers=None):
+    """Calculates the analytic signals of several signals at once.
+
+    Parameters
+    ----------
+    signals : Signal2 or list of Signal1
+        Two dimensional signal, or one dimensional signals with the
+        same length.
+    axis : {0, 1}, optional
+        For a Signal2, axis along which the analytic signals are
+        calculated, by default 1, which transforms each row along
+        `ax1`.
+    fast : bool, optional
+        Whether to pad the values to a fast FFT size, by default False.
+    workers : int, optional
+        Number of threads used by the FFT, by default None.
+
+    Returns
+    -------
+    Signal2 or list of Signal1
+        Complex analytic signals, with the same axes.
+    """
+    if dispatching.operand_kind(signals) is dispatching.SIGNAL:
+        return signals._like(analytic(signals.values, axis, fast, workers))
+    new_values = analytic(np.stack([signal1.values for signal1 in signals]), 1, fast, workers)
+    return [signal1._like(row) for signal1, row in zip(signals, new_values)]
+
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||| Streaming ||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def hilbert_taps(numtaps: int) -> np.ndarray:
+    """Designs an FIR Hilbert transformer, which is the ideal one with a
+    Blackman window, delayed by `(numtaps - 1) // 2` samples.
+
+    Parameters
+    ----------
+    numtaps : int (odd)
+        Number of taps of the filter.
+
+    Returns
+    -------
+    np.ndarray
+        Taps of the filter.
+    """
+    if numtaps % 2 != 1:
+        raise ValueError("The number of taps must be odd.")
+    offsets = np.arange(numtaps) - (numtaps - 1) // 2
+    odd = offsets % 2 == 1
+    taps = np.zeros(numtaps)
+    taps[odd] = 2 / (np.pi * offsets[odd])
+    return taps * np.blackman(numtaps)
+
+
+class StreamHilbert:
+    """Analytic signal of a signal given block by block.
+
+    The imaginary part is the output of an FIR Hilbert transformer (see
+    `hilbert_taps`), applied by overlap-save: the input is cut in frames
+    of `fft_size` samples that overlap by `numtaps - 1`, which are all
+    filtered with a single batched FFT, and the last input samples are
+    kept between blocks. The real part is the input delayed by the same
+    `delay` samples as the filter, so the output is the same as that of
+    a causal filter over the whole signal.
+    """
+
+    def __init__(self, numtaps=HILBERT_TAPS, fft_size: int = None):
+        """Creates a streaming Hilbert transformer.
+
+        Parameters
+        ----------
+        numtaps : int (odd), optional
+            Number of taps of the filter, by default HILBERT_TAPS.
+            Longer filters are more accurate at low frequencies, but
+            have more delay.
+        fft_size : int, optional
+            Length of each frame, by default the next fast FFT size
+            after four times the number of taps.
+        """
+        self.taps = hilbert_taps(numtaps)
+        self.delay = (numtaps - 1) // 2
+        self.fft_size = fft.next_fast_len(4 * numtaps, real=True) if fft_size is None else fft_size
+        if self.fft_size < numtaps:
+            raise ValueError("The frames must be at least as long as the filter.")
+        self.hop = self.fft_size - numtaps + 1
+        self.spectrum = fft.rfft(self.taps, self.fft_size)
+        self.reset()
+
+    def __call__(self, block):
+        return self.process(block)
+
+    def reset(self):
+        """Forgets the previous blocks."""
+        self.history = None
+
+    def process(self, block):
+        """Calculates the analytic signal of the next block.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the real signal.
+
+        Returns
+        -------
+        np.ndarray or Signal1
+            Analytic signal, delayed by `delay` samples. Signals keep
+            the axis of the block.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        overlap = len(self.taps) - 1
+        if self.history is None:
+            self.history = np.zeros(overlap, dtype=dtypes.real_dtype(values.dtype))
+        if len(values) == 0:
+            new_values = np.empty(0, dtype=dtypes.complex_dtype(self.history.dtype))
+            return block._like(new_values) if is_signal else new_values
+        extended = np.concatenate((self.history, values))
+
+        frames = -(-len(values) // self.hop)
+        padded = np.zeros(frames * self.hop + overlap, dtype=extended.dtype)
+        padded[:len(extended)] = extended
+        windows = np.lib.stride_tricks.sliding_window_view(padded, self.fft_size)[::self.hop]
+        filtered = fft.irfft(fft.rfft(windows, axis=1) * self.spectrum, self.fft_size, axis=1)
+
+        new_values = np.empty(len(values), dtype=dtypes.complex_dtype(extended.dtype))
+        new_values.real = extended[overlap - self.delay:overlap - self.delay + len(values)]
+        new_values.imag = filtered[:, overlap:].reshape(-1)[:len(values)]
+        self.history = extended[len(extended) - overlap:]
+        return block._like(new_values) if is_signal else new_values
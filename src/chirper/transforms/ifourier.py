@@ -4,6 +4,7 @@ import numpy as np
 from tqdm import tqdm
 
 from chirper.config import F1_METHOD, F2_METHOD
+from chirper.utils import dtypes
 if TYPE_CHECKING:
     from chirper.sgn import Signal1, Signal2
 
@@ -12,7 +13,7 @@ if TYPE_CHECKING:
 ########################################################################################################################
 
 
-def if1(signal1: Signal1, method=F1_METHOD, shift=True) -> Signal1:
+def if1(signal1: Signal1, method=F1_METHOD, shift=True, out=None) -> Signal1:
     """Calculates the one dimensional Inverse Fourier transform of a
     given signal.
 
@@ -29,6 +30,10 @@ def if1(signal1: Signal1, method=F1_METHOD, shift=True) -> Signal1:
     shift : bool
         Whether to shift the frequencies or not before applying the
         inverse, by default True.
+    out : Signal1, optional
+        Signal with the same shape where the inverse is stored, by
+        default None, which creates a new one. Its values should be
+        complex, and it can be `signal1` itself.
 
     Returns
     -------
@@ -36,13 +41,17 @@ def if1(signal1: Signal1, method=F1_METHOD, shift=True) -> Signal1:
         Signal representing the Inverse Fourier Transform.
     """
     if shift:
-        output = freq_shift1(signal1)
+        output = freq_shift1(signal1, out=out)
+    else:
+        output = signal1._out(out, dtypes.complex_dtype(signal1.values.dtype))
+        if output is not signal1:
+            np.copyto(output.values, signal1.values)
     output.axis *= output.sampling_freq() / output.span()
-    output = F1_METHODS[method](output)
+    output = F1_METHODS[method](output, output)
     return output
 
 
-def _calculate_dft1(signal1: Signal1) -> Signal1:
+def _calculate_dft1(signal1: Signal1, out=None) -> Signal1:
     """Calculates the Inverse Fourier Transform :math:`\\mathcal{F}^{-1}\\{X[k]\\} = x[n]` such that
 
         .. math::
@@ -52,20 +61,21 @@ def _calculate_dft1(signal1: Signal1) -> Signal1:
     -------
     Signal representing the Inverse Fourier Transform.
     """
-    output = signal1.clone()
-    signal_len = len(output)
-    new_values = np.zeros(signal_len, dtype=complex)
+    values = signal1.values
+    signal_len = len(signal1)
+    new_values = np.zeros(signal_len, dtype=dtypes.complex_dtype(values.dtype))
     for n in tqdm(range(signal_len), "Calculating Inverse DFT"):
         temp = 0 + 0j
         for k in range(signal_len):
-            temp += output.values[k] * \
+            temp += values[k] * \
                 np.exp(1j * (2 * n * k * np.pi / signal_len))
         new_values[n] = temp / signal_len
-    output.values = new_values
-    return output * signal_len
+    output = signal1._out(out, new_values.dtype)
+    output.values[:] = new_values
+    return output._operate_inplace(signal_len, np.multiply)
 
 
-def _calculate_fft1(signal1: Signal1) -> Signal1:
+def _calculate_fft1(signal1: Signal1, out=None) -> Signal1:
     """Calculates the inverse FFT of a given signal.
 
     Parameters
@@ -73,23 +83,45 @@ def _calculate_fft1(signal1: Signal1) -> Signal1:
     signal1 : Signal1
         One dimensional signal to calculate the Inverse Fourier
         transform.
+    out : Signal1, optional
+        Signal where the inverse is stored, by default None.
 
     Returns
     -------
     Signal1
         Signal representing the Inverse Fourier Transform.
     """
-    output = signal1.clone()
-    output.values = np.fft.ifft(output.values)
+    output = signal1._out(out, dtypes.complex_dtype(signal1.values.dtype))
+    output.values[:] = np.fft.ifft(signal1.values)
     return output
 
 
-def freq_shift1(signal1: Signal1) -> Signal1:
-    output = signal1.clone()
-    signal_len = len(output)
-    output.axis = output.axis + output.span() / 2
-    output.values = np.array(
-        [*output.values[signal_len // 2:], *output.values[:signal_len // 2]])
+def freq_shift1(signal1: Signal1, out=None) -> Signal1:
+    """Undoes the shift of the frequencies of the signal.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Signal to shift.
+    out : Signal1, optional
+        Signal with the same shape where the result is stored, by
+        default None, which creates a new one. Its values should be
+        complex, and it can be `signal1` itself.
+
+    Returns
+    -------
+    Signal1
+        Shifted signal
+    """
+    values = signal1.values
+    signal_len = len(signal1)
+    span = signal1.span()
+    output = signal1._out(out, dtypes.complex_dtype(values.dtype))
+    if np.shares_memory(output.values, values):
+        values = values.copy()
+    np.add(output.axis, span / 2, out=output.axis)
+    np.concatenate((values[signal_len // 2:], values[:signal_len // 2]), out=output.values,
+                   casting="same_kind")
     return output
 
 
@@ -103,10 +135,37 @@ F1_METHODS = {
 ########################################################################################################################
 
 
-def if2(signal2: Signal2, method=F2_METHOD, shift=True) -> Signal2:
+def if2(signal2: Signal2, method=F2_METHOD, shift=True, out=None) -> Signal2:
+    """Calculates the two dimensional Inverse Fourier transform of a
+    given signal.
+
+    Parameters
+    ----------
+    signal2 : Signal2
+        Two dimensional signal to calculate the Inverse Fourier
+        transform.
+    method : {"dft", "fft"}, optional
+        Method used to calculate the transform, by default F2_METHOD
+    shift : bool
+        Whether to shift the frequencies or not before applying the
+        inverse, by default True.
+    out : Signal2, optional
+        Signal with the same shape where the inverse is stored, by
+        default None, which creates a new one. Its values should be
+        complex, and it can be `signal2` itself.
+
+    Returns
+    -------
+    Signal2
+        Signal representing the Inverse Fourier Transform.
+    """
     if shift:
-        output = freq_shift2(signal2)
-    output = F2_METHODS[method](output)
+        output = freq_shift2(signal2, out=out)
+    else:
+        output = signal2._out(out, dtypes.complex_dtype(signal2.values.dtype))
+        if output is not signal2:
+            np.copyto(output.values, signal2.values)
+    output = F2_METHODS[method](output, output)
     # output.ax0 *= output.ax0_sampling_freq() / output.ax0_span()
     # output.ax1 *= output.ax1_sampling_freq() / output.ax1_span()
     output.ax0 = output.ax0 * output.ax0_sampling_freq() / output.ax0_span()
@@ -114,47 +173,53 @@ def if2(signal2: Signal2, method=F2_METHOD, shift=True) -> Signal2:
     return output
 
 
-def _calculate_dft2(signal2: Signal2) -> Signal2:
-    output = signal2.clone()
-    ax0_len, ax1_len = output.shape()
-    new_values = np.zeros((ax0_len, ax1_len), dtype=complex)
+def _calculate_dft2(signal2: Signal2, out=None) -> Signal2:
+    values = signal2.values
+    ax0_len, ax1_len = signal2.shape()
+    new_values = np.zeros((ax0_len, ax1_len), dtype=dtypes.complex_dtype(values.dtype))
     for u in tqdm(range(ax0_len), "Calculating DFT"):
         for v in range(ax1_len):
             temp = 0 + 0j
             for n in range(ax0_len):
                 for m in range(ax1_len):
-                    temp += output.values[n, m] * \
+                    temp += values[n, m] * \
                         np.exp(1j * 2 * np.pi *
                                (u * n / ax0_len + v * m / ax1_len))
             new_values[u, v] = temp
-    output.values = new_values
+    output = signal2._out(out, new_values.dtype)
+    output.values[:] = new_values
     return output
 
 
-def _calculate_fft2(signal2: Signal2) -> Signal2:
-    output = signal2.clone()
-    output.values = np.fft.ifft2(output.values)
+def _calculate_fft2(signal2: Signal2, out=None) -> Signal2:
+    output = signal2._out(out, dtypes.complex_dtype(signal2.values.dtype))
+    output.values[:] = np.fft.ifft2(signal2.values)
     return output
 
 
-def freq_shift2(signal2: Signal2) -> Signal2:
+def freq_shift2(signal2: Signal2, out=None) -> Signal2:
     """Shift the frequencies of the signal.
 
     Parameters
     ----------
     signal2 : Signal2
         Signal to shift.
+    out : Signal2, optional
+        Signal with the same shape where the result is stored, by
+        default None, which creates a new one. Its values should be
+        complex, and it can be `signal2` itself.
 
     Returns
     -------
     Signal2
         Shifted signal
     """
-    output = signal2.clone()
-    ax0_len, ax1_len = output.shape()
-    output.ax0 = output.ax0 + output.ax0_span() / 2
-    output.ax1 = output.ax1 + output.ax1_span() / 2
-    output.values = np.fft.ifftshift(output.values)
+    values = signal2.values
+    ax0_span, ax1_span = signal2.ax0_span(), signal2.ax1_span()
+    output = signal2._out(out, dtypes.complex_dtype(values.dtype))
+    np.add(output.ax0, ax0_span / 2, out=output.ax0)
+    np.add(output.ax1, ax1_span / 2, out=output.ax1)
+    output.values[:] = np.fft.ifftshift(values)
     return output
 
 
@@ -0,0 +1,259 @@
+"""Module for estimating the Power Spectral Density (PSD) of signals.
+
+Every estimator splits the signal into frames, multiplies them by a
+window and averages the squared magnitude of their FFTs. The frames
+are windowed and transformed in batches, so a batch of `PSD_BATCH_SIZE`
+frames is all that is kept in memory at once.
+
+`PSDAccumulator` does the same with a signal given block by block,
+keeping the samples of the unfinished frame between blocks, so the PSD
+of an arbitrarily long stream can be estimated with constant memory.
+"""
+from __future__ import annotations
+import numpy as np
+
+from chirper.config import PSD_BATCH_SIZE, PSD_SEGMENT_LENGTH, PSD_WINDOW
+from chirper.sgn import Signal1
+from chirper.utils import dispatching, dtypes, math_lib, window
+
+
+def periodogram(signal1: Signal1, window_method="rectangular", nfft=None,
+                onesided=True, scaling="density") -> Signal1:
+    """Estimates the PSD of a signal with a single windowed frame.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Uniformly sampled signal.
+    window_method : str or np.ndarray, optional
+        Window applied to the signal, by default "rectangular". It can
+        be any window of `chirper.utils.window.WINDOWS`, or its values.
+    nfft : int, optional
+        Length of the FFT, by default the length of the signal.
+    onesided : bool, optional
+        Whether to return only the non-negative frequencies of real
+        signals, by default True.
+    scaling : {"density", "spectrum"}, optional
+        Whether to get the power spectral density (in units squared per
+        hertz) or the power spectrum (in units squared), by default
+        "density".
+
+    Returns
+    -------
+    Signal1
+        Estimated PSD, with the frequency in hertz as its axis.
+    """
+    return welch(signal1, len(signal1), 0, window_method, nfft, onesided, scaling)
+
+
+def welch(signal1: Signal1, segment_length=PSD_SEGMENT_LENGTH, overlap=None,
+          window_method=PSD_WINDOW, nfft=None, onesided=True,
+          scaling="density") -> Signal1:
+    """Estimates the PSD of a signal with Welch's method, which averages
+    the periodograms of overlapping windowed frames.
+
+    Samples after the last whole frame are not used.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Uniformly sampled signal.
+    segment_length : int, optional
+        Number of samples of each frame, by default PSD_SEGMENT_LENGTH.
+    overlap : int, optional
+        Number of samples shared by consecutive frames, by default half
+        of `segment_length`.
+    window_method : str or np.ndarray, optional
+        Window applied to each frame, by default PSD_WINDOW. It can be
+        any window of `chirper.utils.window.WINDOWS`, or its values.
+    nfft : int, optional
+        Length of the FFT of each frame, by default `segment_length`.
+    onesided : bool, optional
+        Whether to return only the non-negative frequencies of real
+        signals, by default True.
+    scaling : {"density", "spectrum"}, optional
+        Whether to get the power spectral density or the power
+        spectrum, by default "density".
+
+    Returns
+    -------
+    Signal1
+        Estimated PSD, with the frequency in hertz as its axis.
+
+    Raises
+    ------
+    ValueError
+        If the signal is not uniformly sampled, or it is shorter than a
+        frame.
+    """
+    step = math_lib.uniform_step(signal1.axis)
+    if step is None:
+        raise ValueError("The PSD can only be estimated for uniformly sampled signals.")
+    if len(signal1) < segment_length:
+        raise ValueError(f"The signal is shorter than a frame ({len(signal1)} < {segment_length}).")
+    accumulator = PSDAccumulator(1 / step, segment_length, overlap, window_method,
+                                 nfft, onesided and not np.iscomplexobj(signal1.values), scaling)
+    accumulator.update(signal1.values)
+    return accumulator.psd()
+
+
+def bartlett(signal1: Signal1, segment_length=PSD_SEGMENT_LENGTH, nfft=None,
+             onesided=True, scaling="density") -> Signal1:
+    """Estimates the PSD of a signal with Bartlett's method, which
+    averages the periodograms of contiguous frames without windowing
+    them.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Uniformly sampled signal.
+    segment_length : int, optional
+        Number of samples of each frame, by default PSD_SEGMENT_LENGTH.
+    nfft : int, optional
+        Length of the FFT of each frame, by default `segment_length`.
+    onesided : bool, optional
+        Whether to return only the non-negative frequencies of real
+        signals, by default True.
+    scaling : {"density", "spectrum"}, optional
+        Whether to get the power spectral density or the power
+        spectrum, by default "density".
+
+    Returns
+    -------
+    Signal1
+        Estimated PSD, with the frequency in hertz as its axis.
+    """
+    return welch(signal1, segment_length, 0, "rectangular", nfft, onesided, scaling)
+
+
+class PSDAccumulator:
+    """Running Welch estimate of the PSD of a signal given block by
+    block.
+
+    Example
+    -------
+    >>> accumulator = PSDAccumulator(44100, 1024)
+    >>> for block in blocks:
+    ...     accumulator.update(block)
+    >>> spectrum = accumulator.psd()
+    """
+
+    def __init__(self, samp_freq: float, segment_length=PSD_SEGMENT_LENGTH,
+                 overlap=None, window_method=PSD_WINDOW, nfft=None,
+                 onesided=True, scaling="density", batch_size=PSD_BATCH_SIZE):
+        """Creates an empty accumulator.
+
+        Parameters
+        ----------
+        samp_freq : float
+            Sampling frequency of the signal.
+        segment_length, overlap, window_method, nfft, onesided, scaling
+            Parameters of the estimate (see `welch`). Complex blocks
+            always give a two sided estimate.
+        batch_size : int, optional
+            Maximum number of frames transformed at once, by default
+            PSD_BATCH_SIZE.
+
+        Raises
+        ------
+        ValueError
+            If the overlap is not smaller than the frames, or the
+            scaling is not valid.
+        """
+        if overlap is None:
+            overlap = segment_length // 2
+        if not 0 <= overlap < segment_length:
+            raise ValueError("The overlap must be smaller than the length of the frames.")
+        if scaling not in ("density", "spectrum"):
+            raise ValueError(f"Unknown scaling {scaling} (expected density or spectrum).")
+        if isinstance(window_method, str):
+            self.window = window.get_window(window_method, segment_length)
+        else:
+            self.window = np.asarray(window_method)
+        if len(self.window) != segment_length:
+            raise ValueError("The window must have the same length as the frames.")
+
+        self.samp_freq = samp_freq
+        self.segment_length = segment_length
+        self.hop = segment_length - overlap
+        self.nfft = segment_length if nfft is None else nfft
+        self.onesided = onesided
+        self.scaling = scaling
+        self.batch_size = batch_size
+        self.reset()
+
+    def reset(self):
+        """Forgets every block given so far."""
+        self.pending = None
+        self.total = None
+        self.frames = 0
+
+    def update(self, block):
+        """Adds the frames completed by the next block to the estimate.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the signal.
+
+        Returns
+        -------
+        PSDAccumulator
+            This same accumulator.
+        """
+        if dispatching.operand_kind(block) is dispatching.SIGNAL:
+            block = block.values
+        block = np.asarray(block)
+        values = block if self.pending is None else np.concatenate((self.pending, block))
+        if self.total is None:
+            is_complex = np.iscomplexobj(values)
+            self.onesided = self.onesided and not is_complex
+            bins = self.nfft // 2 + 1 if self.onesided else self.nfft
+            self.total = np.zeros(bins, dtype=dtypes.real_dtype(np.real(values).dtype))
+
+        frame_count = max((len(values) - self.segment_length) // self.hop + 1, 0)
+        for first in range(0, frame_count, self.batch_size):
+            starts = np.arange(first, min(first + self.batch_size, frame_count)) * self.hop
+            frames = math_lib.window_frames(values, self.window, starts)
+            self.total += np.sum(np.abs(self._fft(frames)) ** 2, axis=0)
+        self.frames += frame_count
+
+        # Keeps the samples of the frames that aren't complete yet
+        self.pending = values[frame_count * self.hop:].copy()
+        return self
+
+    def psd(self) -> Signal1:
+        """Gets the current estimate.
+
+        Returns
+        -------
+        Signal1
+            Estimated PSD, with the frequency in hertz as its axis.
+
+        Raises
+        ------
+        ValueError
+            If no frame has been completed yet.
+        """
+        if self.frames == 0:
+            raise ValueError("There are no complete frames to estimate the PSD.")
+        if self.scaling == "density":
+            scale = 1 / (self.samp_freq * np.sum(self.window ** 2))
+        else:
+            scale = 1 / np.sum(self.window) ** 2
+        values = self.total * (scale / self.frames)
+
+        if self.onesided:
+            # The negative frequencies are folded into the positive ones
+            last = None if self.nfft % 2 else -1
+            values[1:last] *= 2
+            freqs = np.fft.rfftfreq(self.nfft, 1 / self.samp_freq)
+        else:
+            values = np.fft.fftshift(values)
+            freqs = np.fft.fftshift(np.fft.fftfreq(self.nfft, 1 / self.samp_freq))
+        return Signal1(freqs, values, copy=False)
+
+    def _fft(self, frames):
+        if self.onesided:
+            return np.fft.rfft(frames, self.nfft, axis=1)
+        return np.fft.fft(frames, self.nfft, axis=1)
@@ -4,6 +4,7 @@ import numpy as np
 from tqdm import tqdm
 
 from chirper.config import S1_METHOD, S2_METHOD
+from chirper.utils import dtypes
 if TYPE_CHECKING:
     from chirper.sgn import Signal1, Signal2
 
@@ -39,7 +40,7 @@ def s1(signal1: Signal1, method=S1_METHOD) -> Signal1:
 def _calculate_i_1(signal1: Signal1) -> Signal1:
     output = signal1.clone()
     signal_len = len(output)
-    new_values = np.zeros(signal_len)
+    new_values = np.zeros(signal_len, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(signal_len), "Calculating DST-I"):
         temp = 0
         for n, x in enumerate(output.values[1:-1]):
@@ -52,7 +53,7 @@ def _calculate_i_1(signal1: Signal1) -> Signal1:
 def _calculate_ii_1(signal1: Signal1) -> Signal1:
     output = signal1.clone()
     signal_len = len(output)
-    new_values = np.zeros(signal_len)
+    new_values = np.zeros(signal_len, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(signal_len), "Calculating DST-II"):
         temp = 0
         for n, x in enumerate(output.values):
@@ -66,7 +67,7 @@ def _calculate_ii_1(signal1: Signal1) -> Signal1:
 def _calculate_iii_1(signal1: Signal1) -> Signal1:
     output = signal1.clone()
     signal_len = len(output)
-    new_values = np.zeros(signal_len)
+    new_values = np.zeros(signal_len, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(signal_len), "Calculating DST-III"):
         temp = 0
         for n, x in enumerate(output.values[:-1]):
@@ -80,7 +81,7 @@ def _calculate_iii_1(signal1: Signal1) -> Signal1:
 def _calculate_iv_1(signal1: Signal1) -> Signal1:
     output = signal1.clone()
     signal_len = len(output)
-    new_values = np.zeros(signal_len)
+    new_values = np.zeros(signal_len, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(signal_len), "Calculating DST-IV"):
         temp = 0
         for n, x in enumerate(output.values):
@@ -135,7 +136,7 @@ def _calculate_ii_2(signal2: Signal2) -> Signal2:
     output = signal2.clone()
     signal_shape = output.shape()
     N, M = signal_shape
-    new_values = np.zeros(signal_shape)
+    new_values = np.zeros(signal_shape, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(N), "Calculating 2D DST-II"):
         for l in range(M):
             temp = 0
@@ -152,7 +153,7 @@ def _calculate_iv_2(signal2: Signal2) -> Signal2:
     output = signal2.clone()
     signal_shape = output.shape()
     N, M = signal_shape
-    new_values = np.zeros(signal_shape)
+    new_values = np.zeros(signal_shape, dtype=dtypes.real_dtype(output.values.dtype))
     for k in tqdm(range(N), "Calculating 2D DST-IV"):
         for l in range(M):
             temp = 0
@@ -4,7 +4,7 @@ import numpy as np
 from tqdm import tqdm
 
 from chirper.transforms import f1
-from chirper.utils import window
+from chirper.utils import dtypes, math_lib, window
 from chirper.sgn import Signal1, Signal2
 
 
@@ -12,24 +12,92 @@ def stft1(signal1: Signal1, time_interval=None,
           window_method="rectangular", samp_time=0.01,
           interp_method="linear", shift=True, scale=True,
           *args, **kwargs) -> Signal2:
+    """Calculates the Short-time Fourier transform of a signal.
+
+    The signal is windowed every `samp_time`, and the Fourier transform
+    of each windowed signal (with the same length as the signal) is a
+    row of the result. For uniformly sampled signals every frame is
+    windowed at once and transformed with a single batched FFT.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Signal to transform.
+    time_interval : tuple, optional
+        Start and stop of the part of the signal to transform, by
+        default the whole signal.
+    window_method : str, optional
+        Window used, by default "rectangular". It can be "rectangular"
+        or "gaussian", which are window signals spanning `samp_time`,
+        or any other window of `chirper.utils.window.WINDOWS`, sampled
+        on `samp_time` worth of samples.
+    samp_time : float, optional
+        Time between the windows, by default 0.01.
+    interp_method : str, optional
+        Method used to interpolate the window signals onto signals that
+        aren't uniformly sampled, by default "linear".
+    shift : bool, optional
+        Whether to shift the frequencies or not, by default True.
+    scale : bool, optional
+        Whether to scale the frequencies or not, by default True.
+    *args, **kwargs
+        Parameters of the window.
+
+    Returns
+    -------
+    Signal2
+        Signal whose rows are the spectra of each window, with the time
+        in the first axis and the frequency in the second one.
+    """
     windows = {
         "rectangular": window.w_rectangular,
         "gaussian": window.w_gaussian,
     }
     copy = signal1.clone()
-    w_signal = windows[window_method](samp_time, *args, **kwargs)
 
     if time_interval is None:
         time_interval = (signal1.axis[0], signal1.axis[-1])
 
     copy = copy.get(*time_interval)
+    time_axis = np.arange(*time_interval, samp_time)
+    step = math_lib.uniform_step(copy.axis)
+
+    if window_method in windows:
+        w_signal = windows[window_method](samp_time, *args, **kwargs)
+    elif step is not None:
+        w_signal = window.get_window(window_method, round(samp_time / step), *args, **kwargs)
+    else:
+        raise ValueError(f"The window {window_method} needs a uniformly sampled signal.")
 
+    if step is None:
+        return _stft1_interp(copy, w_signal, time_axis, samp_time, interp_method, shift, scale)
+
+    # Places every windowed frame in its own row, and transforms them all
+    frames, starts = copy.apply_windows(w_signal, time_axis + 0.5 * samp_time)
+    signal_len = len(copy)
+    indices = starts[:, None] + np.arange(frames.shape[1])
+    is_inside = (indices >= 0) & (indices < signal_len)
+    values = np.zeros((len(time_axis), signal_len), dtype=dtypes.complex_dtype(frames.dtype))
+    values[np.nonzero(is_inside)[0], indices[is_inside]] = frames[is_inside]
+    values = np.fft.fft(values, axis=1)
+
+    freq_axis = copy.axis.copy()
+    if scale:
+        freq_axis *= copy.sampling_freq() / copy.span()
+    if shift:
+        freq_axis -= (freq_axis[-1] - freq_axis[0]) / 2
+        values = np.concatenate((values[:, signal_len // 2:], values[:, :signal_len // 2]), axis=1)
+    return Signal2(time_axis, freq_axis, values, copy=False)
+
+
+def _stft1_interp(copy, w_signal, time_axis, samp_time, interp_method, shift, scale):
+    # Windows signals that aren't uniformly sampled one at a time, as
+    # the interpolation may change the length of each windowed signal
     windowed = copy.apply_window(w_signal, 0.5 * samp_time, interp_method)
     w_fourier = f1(windowed)
 
-    time_axis = np.arange(*time_interval, samp_time)
     freq_axis = w_fourier.axis
-    values = np.zeros((1, len(freq_axis)))
+    values = np.zeros((1, len(freq_axis)), dtype=dtypes.complex_dtype(copy.values.dtype))
 
     for t in tqdm(time_axis + 0.5 * samp_time, "Calculating STFT"):
         windowed = copy.apply_window(w_signal, t, interp_method)
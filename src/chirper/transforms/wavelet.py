@@ -1 +1,390 @@
-# TODO: Implement wavelet transforms
+"""Module for the discrete wavelet transform (DWT).
+
+The transforms use the lifting scheme: the samples are split into even
+and odd ones, which then alternately predict and update each other with
+short filters, so each level costs :math:`O(N)` and is inverted exactly
+by undoing the steps in reverse order. The signal is treated as
+periodic, and it is padded (by reflection) to a multiple of
+:math:`2^{level}` samples.
+
+Every level is stored in a single buffer with the layout of Mallat:
+each level transforms the approximation left at the start of the buffer
+by the previous one, which in one dimension gives
+
+    [approximation | detail (level) | ... | detail (1)]
+
+and in two dimensions keeps the approximation at the top-left corner,
+with the horizontal, vertical and diagonal details around it.
+
+The available wavelets are in `WAVELETS`:
+- haar : Haar.
+- db2 : Daubechies with two vanishing moments (4 taps).
+- cdf53 : Cohen-Daubechies-Feauveau 5/3 (LeGall) biorthogonal.
+- cdf97 : Cohen-Daubechies-Feauveau 9/7 biorthogonal, used by JPEG
+  2000.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import numpy as np
+
+from chirper.config import DWT_FRAME_LENGTH, DWT_WAVELET
+from chirper.utils import dispatching, dtypes
+if TYPE_CHECKING:
+    from chirper.sgn import Signal1, Signal2
+
+_SQRT2 = np.sqrt(2)
+_SQRT3 = np.sqrt(3)
+
+# name: (lifting steps, (approximation scale, detail scale)), where each
+# step adds to the "d"etails (odd samples) or the "s"mooth part (even
+# samples) the other part shifted by each offset, times its coefficient
+WAVELETS = {
+    "haar": ((("d", {0: -1}), ("s", {0: 1 / 2})), (_SQRT2, 1 / _SQRT2)),
+    "db2": ((("s", {0: _SQRT3}),
+             ("d", {0: -_SQRT3 / 4, -1: -(_SQRT3 - 2) / 4}),
+             ("s", {1: -1})),
+            ((_SQRT3 - 1) / _SQRT2, (_SQRT3 + 1) / _SQRT2)),
+    "cdf53": ((("d", {0: -1 / 2, 1: -1 / 2}), ("s", {0: 1 / 4, -1: 1 / 4})), (_SQRT2, 1 / _SQRT2)),
+    "cdf97": ((("d", {0: -1.586134342059924, 1: -1.586134342059924}),
+               ("s", {0: -0.052980118572961, -1: -0.052980118572961}),
+               ("d", {0: 0.882911075530934, 1: 0.882911075530934}),
+               ("s", {0: 0.443506852043971, -1: 0.443506852043971})),
+              (1.149604398860241, 1 / 1.149604398860241)),
+}
+
+########################################################################################################################
+# ||||||||||||||||||||||||||||||||||||||||||||||||| Lifting |||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def lift(values: np.ndarray, wavelet=DWT_WAVELET, axis=-1):
+    """Calculates one level of the DWT along an axis.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values with an even length along `axis`.
+    wavelet : str, optional
+        Wavelet of `WAVELETS`, by default DWT_WAVELET.
+    axis : int, optional
+        Axis along which the transform is calculated, by default -1.
+
+    Returns
+    -------
+    np.ndarray, np.ndarray
+        Approximation and detail coefficients, each with half the
+        length of the values along `axis`.
+    """
+    steps, (smooth_scale, detail_scale) = WAVELETS[wavelet]
+    values = np.moveaxis(values, axis, -1)
+    if values.shape[-1] % 2:
+        raise ValueError("The values must have an even length.")
+    parts = {"s": values[..., 0::2].copy(), "d": values[..., 1::2].copy()}
+    for target, taps in steps:
+        _predict(parts[target], parts["d" if target == "s" else "s"], taps, np.add)
+    parts["s"] *= smooth_scale
+    parts["d"] *= detail_scale
+    return np.moveaxis(parts["s"], -1, axis), np.moveaxis(parts["d"], -1, axis)
+
+
+def unlift(approx: np.ndarray, detail: np.ndarray, wavelet=DWT_WAVELET, axis=-1, out=None) -> np.ndarray:
+    """Inverts one level of the DWT along an axis (see `lift`).
+
+    Parameters
+    ----------
+    approx, detail : np.ndarray
+        Approximation and detail coefficients.
+    wavelet : str, optional
+        Wavelet of `WAVELETS`, by default DWT_WAVELET.
+    axis : int, optional
+        Axis along which the transform is inverted, by default -1.
+    out : np.ndarray, optional
+        Array where the result is stored, by default None. It can
+        overlap the coefficients, as they are copied first.
+
+    Returns
+    -------
+    np.ndarray
+        Reconstructed values.
+    """
+    steps, (smooth_scale, detail_scale) = WAVELETS[wavelet]
+    parts = {"s": np.moveaxis(approx, axis, -1) / smooth_scale, "d": np.moveaxis(detail, axis, -1) / detail_scale}
+    for target, taps in reversed(steps):
+        _predict(parts[target], parts["d" if target == "s" else "s"], taps, np.subtract)
+    if out is None:
+        out = np.empty((*parts["s"].shape[:-1], 2 * parts["s"].shape[-1]), dtype=parts["s"].dtype)
+        out = np.moveaxis(out, -1, axis)
+    moved = np.moveaxis(out, axis, -1)
+    moved[..., 0::2] = parts["s"]
+    moved[..., 1::2] = parts["d"]
+    return out
+
+
+def _predict(target: np.ndarray, source: np.ndarray, taps: dict, operation):
+    # Adds (or subtracts) to the target the shifted source times each
+    # coefficient, wrapping around the ends
+    for offset, coef in taps.items():
+        shifted = np.roll(source, -offset, axis=-1) if offset else source
+        operation(target, coef * shifted, out=target)
+
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||| Transforms ||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+class WaveletCoefficients:
+    """Coefficients of a multilevel DWT, stored in a single buffer with
+    the layout of Mallat (see the module), together with what is needed
+    to invert the transform."""
+
+    def __init__(self, values: np.ndarray, level: int, wavelet: str, signal):
+        """Creates the coefficients of a transform.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Buffer with every coefficient.
+        level : int
+            Number of levels of the transform.
+        wavelet : str
+            Wavelet of `WAVELETS` used.
+        signal : Signal1 or Signal2
+            Transformed signal, whose axes are used by the inverse, or
+            None for the frames of arrays given to `StreamDWT`.
+        """
+        self.values = values
+        self.level = level
+        self.wavelet = wavelet
+        self.signal = signal
+
+    def approx(self) -> np.ndarray:
+        """Gets the approximation coefficients of the last level."""
+        return self.values[tuple(slice(0, size >> self.level) for size in self.values.shape)]
+
+    def detail(self, level: int):
+        """Gets the detail coefficients of a level.
+
+        Parameters
+        ----------
+        level : int
+            Level, from 1 (the finest) to `level` (the coarsest).
+
+        Returns
+        -------
+        np.ndarray or tuple of np.ndarray
+            Details of a one dimensional transform, or the horizontal
+            (high along `ax0`), vertical (high along `ax1`) and diagonal
+            details of a two dimensional one.
+        """
+        if not 1 <= level <= self.level:
+            raise ValueError(f"The level must be between 1 and {self.level}.")
+        low = [slice(0, size >> level) for size in self.values.shape]
+        high = [slice(size >> level, size >> (level - 1)) for size in self.values.shape]
+        if self.values.ndim == 1:
+            return self.values[high[0]]
+        return (self.values[high[0], low[1]], self.values[low[0], high[1]], self.values[high[0], high[1]])
+
+
+def max_level(length: int) -> int:
+    """Gets the deepest level of the DWT of a given length, which leaves
+    a single approximation coefficient."""
+    return max(int(length).bit_length() - 1, 0)
+
+
+def dwt1(signal1: Signal1, wavelet=DWT_WAVELET, level: int = None) -> WaveletCoefficients:
+    """Calculates the multilevel DWT of a given signal.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        One dimensional signal.
+    wavelet : {"haar", "db2", "cdf53", "cdf97"}, optional
+        Wavelet used, by default DWT_WAVELET.
+    level : int, optional
+        Number of levels, by default `max_level` of the length.
+
+    Returns
+    -------
+    WaveletCoefficients
+        Coefficients of the transform.
+    """
+    level = max_level(len(signal1.values)) if level is None else level
+    return WaveletCoefficients(_decompose(signal1.values, wavelet, level), level, wavelet, signal1)
+
+
+def idwt1(coefficients: WaveletCoefficients) -> Signal1:
+    """Inverts the DWT of a one dimensional signal (see `dwt1`).
+
+    Parameters
+    ----------
+    coefficients : WaveletCoefficients
+        Coefficients of the transform.
+
+    Returns
+    -------
+    Signal1 or np.ndarray
+        Reconstructed signal, or its values for the frames of arrays
+        given to `StreamDWT`.
+    """
+    buffer = coefficients.values.copy()
+    size = len(buffer)
+    for current in reversed(range(coefficients.level)):
+        length = size >> current
+        unlift(buffer[:length // 2], buffer[length // 2:length], coefficients.wavelet, out=buffer[:length])
+    signal1 = coefficients.signal
+    if signal1 is None:
+        return buffer
+    return signal1._like(buffer[:len(signal1.values)].copy())
+
+
+def dwt2(signal2: Signal2, wavelet=DWT_WAVELET, level: int = None) -> WaveletCoefficients:
+    """Calculates the separable multilevel DWT of a given signal, which
+    transforms the rows and then the columns at each level.
+
+    Parameters
+    ----------
+    signal2 : Signal2
+        Two dimensional signal.
+    wavelet : {"haar", "db2", "cdf53", "cdf97"}, optional
+        Wavelet used, by default DWT_WAVELET.
+    level : int, optional
+        Number of levels, by default `max_level` of the shortest side.
+
+    Returns
+    -------
+    WaveletCoefficients
+        Coefficients of the transform.
+    """
+    level = max_level(min(signal2.values.shape)) if level is None else level
+    buffer = _padded(signal2.values, level)
+    rows, columns = buffer.shape
+    for current in range(level):
+        block = buffer[:rows >> current, :columns >> current]
+        for axis in (1, 0):
+            half = block.shape[axis] // 2
+            approx, detail = lift(block, wavelet, axis)
+            np.moveaxis(block, axis, -1)[..., :half] = np.moveaxis(approx, axis, -1)
+            np.moveaxis(block, axis, -1)[..., half:] = np.moveaxis(detail, axis, -1)
+    return WaveletCoefficients(buffer, level, wavelet, signal2)
+
+
+def idwt2(coefficients: WaveletCoefficients) -> Signal2:
+    """Inverts the DWT of a two dimensional signal (see `dwt2`).
+
+    Parameters
+    ----------
+    coefficients : WaveletCoefficients
+        Coefficients of the transform.
+
+    Returns
+    -------
+    Signal2
+        Reconstructed signal.
+    """
+    buffer = coefficients.values.copy()
+    rows, columns = buffer.shape
+    for current in reversed(range(coefficients.level)):
+        block = buffer[:rows >> current, :columns >> current]
+        for axis in (0, 1):
+            moved = np.moveaxis(block, axis, -1)
+            half = moved.shape[-1] // 2
+            unlift(moved[..., :half], moved[..., half:], coefficients.wavelet, out=moved)
+    signal2 = coefficients.signal
+    return signal2._like(buffer[:signal2.values.shape[0], :signal2.values.shape[1]].copy())
+
+
+def _decompose(values: np.ndarray, wavelet: str, level: int) -> np.ndarray:
+    buffer = _padded(values, level)
+    size = len(buffer)
+    for current in range(level):
+        length = size >> current
+        approx, detail = lift(buffer[:length], wavelet)
+        buffer[:length // 2] = approx
+        buffer[length // 2:length] = detail
+    return buffer
+
+
+def _padded(values: np.ndarray, level: int) -> np.ndarray:
+    # Copies the values into a buffer whose sides are multiples of
+    # 2 ** level, reflecting them at the end
+    dtype = dtypes.complex_dtype(values.dtype) if np.iscomplexobj(values) else dtypes.real_dtype(values.dtype)
+    multiple = 1 << level
+    pads = [(0, -size % multiple) for size in values.shape]
+    if any(size < pad for size, (_, pad) in zip(values.shape, pads)):
+        raise ValueError(f"The signal is too short for {level} levels.")
+    return np.pad(values.astype(dtype), pads, mode="symmetric")
+
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||| Streaming ||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+class StreamDWT:
+    """Multilevel DWT of a signal given block by block.
+
+    The samples are gathered into frames of `frame_length` samples,
+    which are transformed as soon as they are complete, keeping only the
+    samples of the unfinished frame between blocks. Each frame is
+    transformed (and inverted) on its own, so the memory stays constant
+    for arbitrarily long streams.
+    """
+
+    def __init__(self, wavelet=DWT_WAVELET, level: int = None, frame_length=DWT_FRAME_LENGTH):
+        """Creates a streaming DWT.
+
+        Parameters
+        ----------
+        wavelet : {"haar", "db2", "cdf53", "cdf97"}, optional
+            Wavelet used, by default DWT_WAVELET.
+        level : int, optional
+            Number of levels, by default `max_level` of the frame
+            length.
+        frame_length : int, optional
+            Length of each frame, by default DWT_FRAME_LENGTH. It must
+            be a multiple of `2 ** level`.
+        """
+        self.wavelet = wavelet
+        self.level = max_level(frame_length) if level is None else level
+        if frame_length % (1 << self.level):
+            raise ValueError("The frame length must be a multiple of 2 ** level.")
+        self.frame_length = frame_length
+        self.reset()
+
+    def __call__(self, block):
+        return self.process(block)
+
+    def reset(self):
+        """Forgets the unfinished frame."""
+        self.pending = None
+
+    def process(self, block) -> list:
+        """Transforms the frames completed by the next block.
+
+        Parameters
+        ----------
+        block : np.ndarray or Signal1
+            Next samples of the signal.
+
+        Returns
+        -------
+        list of WaveletCoefficients
+            Coefficients of each completed frame, in order. Signals give
+            frames with their part of the axis.
+        """
+        is_signal = dispatching.operand_kind(block) is dispatching.SIGNAL
+        values = np.asarray(block.values if is_signal else block)
+        if self.pending is not None:
+            values = np.concatenate((self.pending[1], values))
+            axis = np.concatenate((self.pending[0], block.axis)) if is_signal else None
+        else:
+            axis = block.axis if is_signal else None
+
+        new_coefficients = []
+        used = len(values) - len(values) % self.frame_length
+        for start in range(0, used, self.frame_length):
+            frame = slice(start, start + self.frame_length)
+            signal1 = type(block)(axis[frame], values[frame]) if is_signal else None
+            buffer = _decompose(values[frame], self.wavelet, self.level)
+            new_coefficients.append(WaveletCoefficients(buffer, self.level, self.wavelet, signal1))
+        self.pending = (axis[used:] if is_signal else None, values[used:])
+        return new_coefficients
@@ -1,24 +1,218 @@
+"""Module for the z-transform.
 
-# import numpy as np
-# from tqdm import tqdm
-
-# class Z_transform(Transform):
-#     def __init__(self, target):
-#         super().__init__(target)
-#         self.methods = {
-#             "dzt": self.calculate_dzt,
-#         }
-
-#     def calculate(self, method=Z_METHOD, *args, **kwargs):
-#         return self.methods[method](*args, **kwargs)
-
-#     def calculate_dzt(self, R):
-#         N = len(self.signal)
-#         rho = np.empty((N, N))
-#         for k in tqdm(range(N), desc="Calculating Z transform"):
-#             for m in range(N):
-#                 r_vec = np.array([(R * m / N) ** (-i) for i in range(N)])
-#                 xi_vec = np.array([self.signal.values[i] * np.exp(-1j * 2 * np.pi * (k / N) * i) for i in range(N)])
-#                 rho[k, m] = np.dot(r_vec, xi_vec)
-#         self.values = rho
-#         return self.values
+The z-transform of a signal is evaluated on `m` points of a spiral
+:math:`z_k = a w^{-k}`, which contains the unit circle (the DFT) and its
+arcs as particular cases. The chirp-z transform (CZT) does it in
+:math:`O(N \\log N)` with Bluestein's algorithm, which writes
+:math:`nk = (n^2 + k^2 - (k - n)^2) / 2` to turn the sum into a
+convolution with a chirp, calculated with FFTs. The chirps only depend
+on the lengths and the spiral, so they are cached for repeated calls.
+
+Spirals that grow or decay fast (:math:`|w|` far from 1 over many
+points) make the chirps overflow, and need the direct method ("dzt").
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from functools import lru_cache
+import numpy as np
+from scipy import fft
+
+from chirper.config import CZT_CACHE_SIZE, HERTZ, Z_METHOD
+from chirper.utils import dtypes, math_lib
+if TYPE_CHECKING:
+    from chirper.sgn import Signal1
+
+########################################################################################################################
+# ||||||||||||||||||||||||||||||||||||||||||||||||| Arrays ||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def czt(values: np.ndarray, m: int = None, w: complex = None, a: complex = 1, axis=-1) -> np.ndarray:
+    """Calculates the chirp-z transform
+    :math:`X_k = \\sum_{n=0}^{N-1} x_n a^{-n} w^{nk}` for `k < m`.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values to transform, with any number of dimensions.
+    m : int, optional
+        Number of points, by default the length of the values.
+    w : complex, optional
+        Ratio between consecutive points, by default
+        :math:`e^{-j 2 \\pi / m}`, which gives the DFT when `a` is 1.
+    a : complex, optional
+        First point, by default 1.
+    axis : int, optional
+        Axis along which the transform is calculated, by default -1.
+
+    Returns
+    -------
+    np.ndarray
+        Complex transform, with `m` points along `axis`.
+    """
+    values = np.moveaxis(np.asarray(values), axis, -1)
+    length = values.shape[-1]
+    m = length if m is None else m
+    w = np.exp(-2j * np.pi / m) if w is None else w
+    if length == 0 or m < 1:
+        raise ValueError("The transform needs at least one sample and one point.")
+
+    weights, kernel, chirp = _chirps(length, m, complex(w), complex(a))
+    size = len(kernel)
+    spectrum = fft.fft(values * weights, size)
+    spectrum *= kernel
+    new_values = fft.ifft(spectrum, overwrite_x=True)[..., length - 1:length - 1 + m]
+    new_values *= chirp
+    return np.moveaxis(new_values.astype(dtypes.complex_dtype(values.dtype), copy=False), -1, axis)
+
+
+def spiral(m: int, w: complex, a: complex = 1) -> np.ndarray:
+    """Gets the points :math:`z_k = a w^{-k}` where the chirp-z
+    transform is evaluated.
+
+    Parameters
+    ----------
+    m : int
+        Number of points.
+    w : complex
+        Ratio between consecutive points.
+    a : complex, optional
+        First point, by default 1.
+
+    Returns
+    -------
+    np.ndarray
+        Points of the spiral.
+    """
+    return a * np.exp(-np.log(complex(w)) * np.arange(m))
+
+
+def clear_cache():
+    """Removes every cached chirp."""
+    _chirps.cache_clear()
+
+
+@lru_cache(maxsize=CZT_CACHE_SIZE)
+def _chirps(length: int, m: int, w: complex, a: complex):
+    # Gets the weights of the input, the spectrum of the chirp it is
+    # convolved with, and the chirp that multiplies the output
+    size = fft.next_fast_len(length + m - 1)
+    log_w = np.log(w)
+    indices = np.arange(max(length, m))
+    half_chirp = np.exp(log_w * indices ** 2 / 2)
+
+    weights = np.exp(-np.log(a) * indices[:length]) * half_chirp[:length]
+    # The convolution uses the chirp from -(length - 1) to m - 1, stored
+    # so the output k lands at index k + length - 1
+    kernel = np.zeros(size, dtype=complex)
+    kernel[:length + m - 1] = 1 / half_chirp[np.abs(np.arange(-(length - 1), m))]
+    kernel = fft.fft(kernel)
+    chirp = half_chirp[:m].copy()
+    for array in (weights, kernel, chirp):
+        array.flags.writeable = False
+    return weights, kernel, chirp
+
+########################################################################################################################
+# |||||||||||||||||||||||||||||||||||||||||||||||| Signal1 ||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def z1(signal1: Signal1, points: int = None, radius=1, start=0, step=None, ratio=1,
+       method=Z_METHOD) -> Signal1:
+    """Calculates the z-transform of a given signal on the spiral
+    :math:`z_k = radius \\cdot ratio^k e^{j(start + k \\cdot step)}`.
+
+    The spiral is an arc of a circle when `ratio` is 1, and the default
+    one is the unit circle, where the transform is the DFT.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        One dimensional signal, whose samples are the terms of the
+        sequence.
+    points : int, optional
+        Number of points, by default the length of the signal.
+    radius : float, optional
+        Radius of the first point, by default 1.
+    start : float, optional
+        Angle of the first point in radians, by default 0.
+    step : float, optional
+        Angle between consecutive points in radians, by default
+        `2 * pi / points`.
+    ratio : float, optional
+        Ratio between the radii of consecutive points, by default 1.
+    method : {"czt", "dzt"}, optional
+        Method used to calculate the transform, by default Z_METHOD.
+        "dzt" evaluates the sum directly, in :math:`O(N \\cdot M)`.
+
+    Returns
+    -------
+    Signal1
+        Transform, whose axis is the angle of each point.
+    """
+    points = len(signal1.values) if points is None else points
+    step = 2 * np.pi / points if step is None else step
+    w = np.exp(-1j * step) / ratio
+    a = radius * np.exp(1j * start)
+    new_values = Z_METHODS[method](signal1.values, points, w, a)
+    return type(signal1)(start + step * np.arange(points), new_values, copy=False)
+
+
+def _calculate_dzt(values: np.ndarray, m: int, w: complex, a: complex) -> np.ndarray:
+    powers = spiral(m, w, a)[:, None] ** -np.arange(len(values))
+    return (powers @ values).astype(dtypes.complex_dtype(values.dtype), copy=False)
+
+
+Z_METHODS = {
+    "czt": czt,
+    "dzt": _calculate_dzt,
+}
+
+
+def zoom_fft(signal1: Signal1, start_freq: float, stop_freq: float, points: int = None,
+             endpoint=False, hertz=HERTZ) -> Signal1:
+    """Calculates the spectrum of a signal over a band of frequencies,
+    with as many points as wanted.
+
+    Unlike padding the signal before the FFT, only the points in the
+    band are calculated, so a narrow band can be seen with a fine
+    resolution at the cost of a transform of about the same length as
+    the signal.
+
+    Parameters
+    ----------
+    signal1 : Signal1
+        Uniformly sampled signal.
+    start_freq : float
+        First frequency of the band.
+    stop_freq : float
+        Last frequency of the band.
+    points : int, optional
+        Number of frequencies, by default the length of the signal.
+    endpoint : bool, optional
+        Whether `stop_freq` is the last point, by default False.
+    hertz : bool, optional
+        Whether the frequencies are given in hertz, by default HERTZ.
+
+    Returns
+    -------
+    Signal1
+        Spectrum of the signal (not scaled, and taking the first
+        sample as the origin like `f1`), whose axis is the frequency.
+
+    Raises
+    ------
+    ValueError
+        If the signal is not uniformly sampled.
+    """
+    samp_period = math_lib.uniform_step(signal1.axis)
+    if samp_period is None:
+        raise ValueError("The zoom FFT needs a uniformly sampled signal.")
+    points = len(signal1.values) if points is None else points
+    freq_step = (stop_freq - start_freq) / (points - 1 if endpoint else points)
+    to_angle = 2 * np.pi * samp_period if hertz else samp_period
+
+    w = np.exp(-1j * freq_step * to_angle)
+    a = np.exp(1j * start_freq * to_angle)
+    new_values = czt(signal1.values, points, w, a)
+    return type(signal1)(start_freq + freq_step * np.arange(points), new_values, copy=False)
@@ -0,0 +1,48 @@
+"""Module for dispatching operations on the kind of their operands.
+
+Operators of signals are called very often with small blocks, so the
+type of the operand is resolved once per class and cached, leaving a
+single dictionary lookup in the hot path.
+"""
+from numbers import Number
+import numpy as np
+
+NUMBER = "number"
+ARRAY = "array"
+SIGNAL = "signal"
+
+# Kind of operand of every class seen so far
+_KINDS = {}
+
+
+def operand_kind(operand):
+    """Gets the kind of an operand of a signal.
+
+    Parameters
+    ----------
+    operand : object
+        Operand to classify.
+
+    Returns
+    -------
+    {NUMBER, ARRAY, SIGNAL, None}
+        Kind of the operand, or None if signals can't be operated with
+        it (e.g a `LazySignal`, which handles the operation itself).
+    """
+    cls = type(operand)
+    try:
+        return _KINDS[cls]
+    except KeyError:
+        kind = _KINDS[cls] = _resolve_kind(cls)
+        return kind
+
+
+def _resolve_kind(cls):
+    from chirper.sgn.signal import Signal
+    if issubclass(cls, (Number, np.generic)):
+        return NUMBER
+    if issubclass(cls, (np.ndarray, list, tuple)):
+        return ARRAY
+    if issubclass(cls, Signal):
+        return SIGNAL
+    return None
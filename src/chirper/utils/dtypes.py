@@ -0,0 +1,98 @@
+"""Module that applies the dtype policy of the package.
+
+The policy is given by `chirper.config.DTYPE_POLICY`, and is read every
+time one of these functions is called:
+
+- None keeps the precision of the input, promoting only when needed
+  (e.g integers to float64 or float32 to complex64).
+- "single" uses float32 for real values and complex64 for complex ones.
+- "double" uses float64 for real values and complex128 for complex ones.
+"""
+import numpy as np
+
+from chirper import config
+
+POLICIES = {
+    "single": (np.float32, np.complex64),
+    "double": (np.float64, np.complex128),
+}
+
+
+def real_dtype(dtype=None) -> np.dtype:
+    """Gets the type that real values derived from the given type should
+    have.
+
+    Parameters
+    ----------
+    dtype : data-type, optional
+        Type of the input, by default None, which is treated as
+        float64.
+
+    Returns
+    -------
+    np.dtype
+        Real floating point type.
+    """
+    policy = _policy()
+    if policy is not None:
+        return np.dtype(policy[0])
+    dtype = np.dtype(np.float64 if dtype is None else dtype)
+    if dtype.kind == "c":
+        return np.finfo(dtype).dtype
+    if dtype.kind == "f":
+        return dtype
+    return np.dtype(np.float64)
+
+
+def complex_dtype(dtype=None) -> np.dtype:
+    """Gets the type that complex values derived from the given type
+    should have.
+
+    Parameters
+    ----------
+    dtype : data-type, optional
+        Type of the input, by default None, which is treated as
+        float64.
+
+    Returns
+    -------
+    np.dtype
+        Complex floating point type.
+    """
+    policy = _policy()
+    if policy is not None:
+        return np.dtype(policy[1])
+    return np.result_type(real_dtype(dtype), np.complex64)
+
+
+def cast(values: np.ndarray) -> np.ndarray:
+    """Casts an array of values to the type given by the policy.
+
+    Numeric values are converted to the real or complex type of the
+    policy, while other types (like objects) are kept as they are. The
+    array is only copied if its type changes.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values to cast.
+
+    Returns
+    -------
+    np.ndarray
+        Values with the type of the policy.
+    """
+    if _policy() is None or values.dtype.kind not in "biufc":
+        return values
+    if values.dtype.kind == "c":
+        return values.astype(complex_dtype(values.dtype), copy=False)
+    return values.astype(real_dtype(values.dtype), copy=False)
+
+
+def _policy():
+    policy = config.DTYPE_POLICY
+    if policy is None:
+        return None
+    if policy not in POLICIES:
+        raise ValueError(f"Invalid dtype policy {policy} (expected None, 'single' or 'double').")
+    return POLICIES[policy]
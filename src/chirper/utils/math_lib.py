@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 
 
 def convolution(s1_x: Signal1, s1_y: Signal1,
-                method=CONVOLUTION_METHOD) -> Signal1:
+                method=CONVOLUTION_METHOD, out=None) -> Signal1:
     """Calculates the convolution of two one-dimensional signals.
 
     There are different methods to calculate the convolution of two
@@ -27,6 +27,9 @@ def convolution(s1_x: Signal1, s1_y: Signal1,
      - "direct" : Uses the formula of convolution to calculate it via
         brute-force. Very inneficient, as it is O(N*M).
 
+    Both compute the circular convolution, so the signals must have
+    the same length, and the result uses the axis of `s1_x`.
+
     Parameters
     ----------
     s1_x : Signal1
@@ -35,6 +38,9 @@ def convolution(s1_x: Signal1, s1_y: Signal1,
         Second one-dimensional signal to convolute.
     method : {"fft", "direct"}, optional
         Method used for the convolution, by default CONVOLUTION_METHOD.
+    out : Signal1, optional
+        Signal with the same shape where the result is stored, by
+        default None, which creates a new one.
 
     Returns
     -------
@@ -45,18 +51,18 @@ def convolution(s1_x: Signal1, s1_y: Signal1,
         "fft": conv_fft,
         "direct": conv_direct,
     }
-    return conv_methods[method](s1_x, s1_y)
+    return conv_methods[method](s1_x, s1_y, out)
 
 
-def conv_fft(s1_x: Signal1, s1_y: Signal1) -> Signal1:
+def conv_fft(s1_x: Signal1, s1_y: Signal1, out=None) -> Signal1:
     """Convolutes using the FFT."""
-    from chirper.transforms import f1, if1
-    x_fourier = f1(s1_x)
-    y_fourier = f1(s1_y)
-    return if1(x_fourier * y_fourier)
+    _check_lengths(s1_x, s1_y)
+    spectrum = np.fft.fft(s1_x.values)
+    spectrum *= np.fft.fft(s1_y.values)
+    return _inverse_into(spectrum, s1_x, s1_y, out)
 
 
-def conv_direct(s1_x: Signal1, s1_y: Signal1) -> Signal1:
+def conv_direct(s1_x: Signal1, s1_y: Signal1, out=None) -> Signal1:
     """Convolutes via brute-force."""
     x_copy = s1_x.clone()
     y_copy = s1_y.clone()
@@ -68,13 +74,14 @@ def conv_direct(s1_x: Signal1, s1_y: Signal1) -> Signal1:
         for m, _ in enumerate(y_copy.values):
             sum += x_copy.values[m] * y_copy.values[n - m]
         vals.append(sum)
-    output = s1_x.clone()
-    output.values = np.array(vals)
+    vals = np.array(vals)
+    output = s1_x._out(out, vals.dtype)
+    output.values[:] = vals
     return output
 
 
 def cross_correlation(s1_x: Signal1, s1_y: Signal1,
-                      method=CROSS_CORRELATION_METHOD) -> Signal1:
+                      method=CROSS_CORRELATION_METHOD, out=None) -> Signal1:
     """Calculates the cross correlation of two signals.
 
     Parameters
@@ -86,6 +93,9 @@ def cross_correlation(s1_x: Signal1, s1_y: Signal1,
     method : {"fft", "direct"}, optional
         Desired method to calculate the cross correlation, by default
         CROSS_CORRELATION_METHOD.
+    out : Signal1, optional
+        Signal with the same shape where the result is stored, by
+        default None, which creates a new one.
 
     Returns
     -------
@@ -96,10 +106,10 @@ def cross_correlation(s1_x: Signal1, s1_y: Signal1,
         "fft": cc_fft,
         "direct": cc_direct,
     }
-    return cc_methods[method](s1_x, s1_y)
+    return cc_methods[method](s1_x, s1_y, out)
 
 
-def cc_direct(s1_x: Signal1, s1_y: Signal1) -> Signal1:
+def cc_direct(s1_x: Signal1, s1_y: Signal1, out=None) -> Signal1:
     x_copy = s1_x.clone()
     y_copy = s1_y.clone()
     if not np.array_equal(x_copy.axis, y_copy.axis):
@@ -111,18 +121,126 @@ def cc_direct(s1_x: Signal1, s1_y: Signal1) -> Signal1:
             sum += np.conjugate(x_copy.values[m]) * \
                 y_copy.values[(m + n) % len(x_copy)]
         vals.append(sum)
-    output = s1_x.clone()
-    output.values = np.array(vals)
+    vals = np.array(vals)
+    output = s1_x._out(out, vals.dtype)
+    output.values[:] = vals
     return output
 
 
-def cc_fft(s1_x: Signal1, s1_y: Signal1) -> Signal1:
-    from chirper.transforms import f1, if1
-    x_copy = s1_x.clone()
-    y_copy = s1_y.clone()
-    x_fourier = f1(x_copy)
-    y_fourier = f1(y_copy)
-    return if1(x_fourier.conjugate() * y_fourier)
+def cc_fft(s1_x: Signal1, s1_y: Signal1, out=None) -> Signal1:
+    _check_lengths(s1_x, s1_y)
+    spectrum = np.fft.fft(s1_x.values)
+    np.conjugate(spectrum, out=spectrum)
+    spectrum *= np.fft.fft(s1_y.values)
+    return _inverse_into(spectrum, s1_x, s1_y, out)
+
+
+def _inverse_into(spectrum: np.ndarray, s1_x: Signal1, s1_y: Signal1, out=None) -> Signal1:
+    # Transforms the spectrum back into the output, which only keeps the
+    # real part when it is real (the result of two real signals)
+    output = s1_x._out(out, spectrum.dtype)
+    values = np.fft.ifft(spectrum)
+    if not np.iscomplexobj(output.values):
+        if np.iscomplexobj(s1_x.values) or np.iscomplexobj(s1_y.values):
+            raise TypeError("A real output can't store the result of complex signals.")
+        values = values.real
+    np.copyto(output.values, values, casting="same_kind")
+    return output
+
+
+def _check_lengths(s1_x: Signal1, s1_y: Signal1):
+    if len(s1_x) != len(s1_y):
+        raise DimensionError("Dimensions of signals do not match.", len(s1_y), len(s1_x))
+
+
+def uniform_step(axis: np.ndarray, rtol=1e-6):
+    """Gets the step of an axis if it is uniformly sampled.
+
+    Parameters
+    ----------
+    axis : np.ndarray
+        Axis to check.
+    rtol : float, optional
+        Relative tolerance of the differences between samples, by
+        default 1e-6.
+
+    Returns
+    -------
+    float or None
+        Step between the samples, or None if the axis has less than two
+        samples or they are not evenly spaced.
+    """
+    if len(axis) < 2:
+        return None
+    step = (axis[-1] - axis[0]) / (len(axis) - 1)
+    if step <= 0 or not np.allclose(np.diff(axis), step, rtol=rtol, atol=0):
+        return None
+    return float(step)
+
+
+def sample_window(window: Signal1, step: float) -> np.ndarray:
+    """Samples a window signal, centered at zero, every `step` units.
+
+    The window is linearly interpolated, and assumed to be zero outside
+    of its axis.
+
+    Parameters
+    ----------
+    window : Signal1
+        Window signal.
+    step : float
+        Distance between the samples.
+
+    Returns
+    -------
+    np.ndarray
+        Window values at `k * step`, for `k` between `-K` and `K`, where
+        `K` is the number of whole steps in half the span of the window.
+    """
+    half_length = int(np.floor(window.span() / (2 * step) + 1e-9))
+    offsets = np.arange(-half_length, half_length + 1) * step
+    return np.interp(offsets, window.axis, window.values, left=0, right=0)
+
+
+def window_frames(values: np.ndarray, window: np.ndarray, starts: np.ndarray, out=None) -> np.ndarray:
+    """Multiplies the same window by several frames of an array.
+
+    Frames that go past the edges of the array are padded with zeros.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Array the frames are taken from.
+    window : np.ndarray
+        Window values, which determine the length of every frame.
+    starts : np.ndarray
+        Index where each frame starts (it can be negative or past the
+        end of the array).
+    out : np.ndarray, optional
+        Array with shape `(len(starts), len(window))` where the frames
+        are stored, by default None, which creates a new one.
+
+    Returns
+    -------
+    np.ndarray
+        Windowed frames, one per row.
+    """
+    length = len(window)
+    starts = np.asarray(starts, dtype=int)
+    if out is None:
+        out = np.empty((len(starts), length), dtype=np.result_type(values, window))
+    if len(starts) == 0:
+        return out
+
+    # Frames are taken from a view of the span they cover, which is only
+    # copied (and padded with zeros) when some frame goes past an edge
+    first, last = starts.min(), starts.max() + length
+    span = values[max(first, 0):min(last, len(values))]
+    if first < 0 or last > len(values):
+        span = np.pad(span, (max(-first, 0), max(last - len(values), 0)))
+    frames = np.lib.stride_tricks.sliding_window_view(span, length)
+    np.multiply(frames[starts - first], window, out=out)
+    return out
 
 ########################################################################################################################
 # |||||||||||||||||||||||||||||||||||||||||||||||| Signal2 ||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
@@ -130,7 +248,7 @@ def cc_fft(s1_x: Signal1, s1_y: Signal1) -> Signal1:
 
 
 def apply_kernel(signal2: Signal2, kernel: np.ndarray, flip=False,
-                 oob=KERNEL_OOB) -> Signal2:
+                 oob=KERNEL_OOB, out=None) -> Signal2:
     """Applies a given kernel to the two dimensional signal.
 
     This operation can be often found in the literature as image
@@ -152,6 +270,9 @@ def apply_kernel(signal2: Signal2, kernel: np.ndarray, flip=False,
         example, when `oob` is `"zero"` then, when trying to get
         the 6th element of a 5x5 signal you will just get a 0. By
         default KERNEL_OOB.
+    out : Signal2, optional
+        Signal with the same shape where the result is stored, by
+        default None, which creates a new one.
 
     Returns
     -------
@@ -160,7 +281,8 @@ def apply_kernel(signal2: Signal2, kernel: np.ndarray, flip=False,
     """
     copy = signal2.clone()
     signal_shape = copy.shape()
-    result = np.empty((signal_shape))
+    output = signal2._out(out, np.result_type(copy.values, kernel))
+    result = output.values
     ker_copy = kernel.copy().T if flip else kernel.copy()
     ker_shape = np.shape(ker_copy)
     for i in range(signal_shape[0]):
@@ -169,8 +291,74 @@ def apply_kernel(signal2: Signal2, kernel: np.ndarray, flip=False,
             for row, col, ker_row, ker_col in _generate_indices(ker_shape, i, j):
                 sum += _get(copy, row, col, oob) * ker_copy[ker_row, ker_col]
             result[i, j] = sum
-    copy.values = result
-    return copy
+    return output
+
+
+def bilinear_resample(ax0: np.ndarray, ax1: np.ndarray, values: np.ndarray,
+                      new_ax0: np.ndarray, new_ax1: np.ndarray) -> np.ndarray:
+    """Bilinearly interpolates a grid of values onto another grid.
+
+    Every point of the new grid is evaluated in one vectorized pass,
+    interpolating first along `ax0` and then along `ax1`. Points out of
+    the range of an axis take the value of its nearest edge.
+
+    Parameters
+    ----------
+    ax0 : np.ndarray
+        Sorted first axis of the grid, which indexes the rows of
+        `values`.
+    ax1 : np.ndarray
+        Sorted second axis of the grid, which indexes the columns of
+        `values`.
+    values : np.ndarray
+        Matrix of values of the grid.
+    new_ax0 : np.ndarray
+        First axis of the new grid.
+    new_ax1 : np.ndarray
+        Second axis of the new grid.
+
+    Returns
+    -------
+    np.ndarray
+        Matrix of values interpolated on the new grid, with shape
+        `(len(new_ax0), len(new_ax1))`.
+    """
+    low0, high0, weight0 = linear_weights(ax0, new_ax0)
+    low1, high1, weight1 = linear_weights(ax1, new_ax1)
+    weight0 = weight0[:, None]
+    rows = values[low0] * (1 - weight0) + values[high0] * weight0
+    return rows[:, low1] * (1 - weight1) + rows[:, high1] * weight1
+
+
+def linear_weights(axis: np.ndarray, points: np.ndarray):
+    """Calculates the neighbours and weights used to linearly
+    interpolate some points over a sorted axis.
+
+    The value at each point is then `(1 - w) * x[low] + w * x[high]`.
+    Points out of the range of the axis are clamped to its edges.
+
+    Parameters
+    ----------
+    axis : np.ndarray
+        Sorted axis where the values are known.
+    points : np.ndarray
+        Points to interpolate.
+
+    Returns
+    -------
+    np.ndarray, np.ndarray, np.ndarray
+        Index of the lower and higher neighbours, and the weight of the
+        higher neighbour.
+    """
+    axis = np.asarray(axis)
+    points = np.asarray(points)
+    if len(axis) == 1:
+        zeros = np.zeros(len(points), dtype=int)
+        return zeros, zeros, np.zeros(len(points))
+    low = np.clip(np.searchsorted(axis, points, "right") - 1, 0, len(axis) - 2)
+    high = low + 1
+    weight = np.clip((points - axis[low]) / (axis[high] - axis[low]), 0, 1)
+    return low, high, weight
 
 
 def _get(signal2: Signal2, row, col, oob=KERNEL_OOB):
@@ -201,3 +389,69 @@ def _generate_indices(ker_shape, row, col):
 ########################################################################################################################
 # ||||||||||||||||||||||||||||||||||||||||||||||||| Others ||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
 ########################################################################################################################
+
+
+def map_function(func, *arrays, args=(), kwargs=None, vectorize=False,
+                 chunksize=None) -> np.ndarray:
+    """Evaluates a function on broadcast arrays.
+
+    By default the function is called once with the whole arrays, so it
+    must accept arrays and operate element-wise (like NumPy's ufuncs).
+    Functions that only accept scalars can be evaluated with
+    `vectorize=True`, which wraps them with `np.vectorize`.
+
+    Parameters
+    ----------
+    func : function
+        Function to evaluate. It receives one argument per array,
+        followed by `args` and `kwargs`.
+    *arrays : array_like
+        Arrays the function is evaluated on. They are broadcast against
+        each other, so `x[:, None]` and `y[None, :]` evaluate the
+        function on every point of a grid without building it.
+    args : tuple, optional
+        Extra positional arguments of the function, by default ().
+    kwargs : dict, optional
+        Extra keyword arguments of the function, by default None.
+    vectorize : bool, optional
+        Whether to call the function once per element, by default
+        False.
+    chunksize : int, optional
+        If given, the function is evaluated in blocks of at most this
+        many rows of the broadcast arrays, which bounds the size of the
+        intermediate arrays of the function, by default None.
+
+    Returns
+    -------
+    np.ndarray
+        Values of the function, with the broadcast shape of the arrays.
+    """
+    kwargs = {} if kwargs is None else kwargs
+    if vectorize:
+        mapped = np.vectorize(lambda *values: func(*values, *args, **kwargs))
+    else:
+        def mapped(*values):
+            return func(*values, *args, **kwargs)
+
+    arrays = np.broadcast_arrays(*(np.asarray(arr) for arr in arrays))
+    shape = arrays[0].shape
+    if chunksize is None or not shape or shape[0] <= chunksize:
+        return _broadcast_result(mapped(*arrays), shape)
+
+    first = _broadcast_result(mapped(*(arr[:chunksize] for arr in arrays)),
+                              (chunksize, *shape[1:]))
+    result = np.empty(shape, dtype=first.dtype)
+    result[:chunksize] = first
+    for start in range(chunksize, shape[0], chunksize):
+        stop = start + chunksize
+        result[start:stop] = mapped(*(arr[start:stop] for arr in arrays))
+    return result
+
+
+def _broadcast_result(values, shape) -> np.ndarray:
+    # Functions that ignore some of their arguments (like constants) may
+    # return fewer dimensions than the input
+    values = np.asarray(values)
+    if values.shape == shape:
+        return values
+    return np.array(np.broadcast_to(values, shape))
@@ -1,7 +1,35 @@
+"""Module for window functions.
+
+Besides the window signals (`w_rectangular` and `w_gaussian`), which
+are interpolated onto the signal they are applied to, this module
+gives windows as plain arrays sampled exactly on a frame of `length`
+samples. Those are calculated once and cached, so they are read-only:
+
+>>> frame *= window.get_window("hann", len(frame))
+
+By default the windows are periodic (the DFT-even windows used for
+spectral analysis). Use `sym=True` for the symmetric ones used for
+filter design.
+"""
+from functools import lru_cache
 import numpy as np
+from scipy.signal import windows
 
+from chirper.config import WINDOW_CACHE_SIZE
 from chirper.sgn import Signal1
 
+WINDOWS = {
+    # name: (function, default parameters)
+    "rectangular": (windows.boxcar, ()),
+    "hann": (windows.hann, ()),
+    "hamming": (windows.hamming, ()),
+    "blackman": (windows.blackman, ()),
+    "kaiser": (windows.kaiser, (14,)),
+    "tukey": (windows.tukey, (0.5,)),
+    "flattop": (windows.flattop, ()),
+    "dpss": (windows.dpss, (3,)),
+}
+
 
 def w_rectangular(samp_time):
     epsilon = 0.01
@@ -17,3 +45,148 @@ def w_gaussian(samp_time, resolution=100):
     values = np.exp(-(axis ** 2) / (2 * sigma ** 2)) / \
         np.sqrt(2 * np.pi * sigma ** 2)
     return Signal1(axis, values)
+
+########################################################################################################################
+# ||||||||||||||||||||||||||||||||||||||||||||||||| Arrays ||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def get_window(name: str, length: int, *params, sym=False) -> np.ndarray:
+    """Gets a window sampled on a frame of the given length.
+
+    Parameters
+    ----------
+    name : {"rectangular", "hann", "hamming", "blackman", "kaiser", "tukey", "flattop", "dpss"}
+        Type of the window.
+    length : int
+        Number of samples of the window.
+    *params
+        Parameters of the window, by default the ones in `WINDOWS`
+        (beta of the Kaiser window, ratio of the taper of the Tukey
+        window and time-halfbandwidth product of the DPSS window).
+    sym : bool, optional
+        Whether to get the symmetric window, by default False, which
+        gets the periodic one.
+
+    Returns
+    -------
+    np.ndarray
+        Read-only window, shared by every call with the same arguments.
+
+    Raises
+    ------
+    ValueError
+        If the type of window is not valid.
+    """
+    if name not in WINDOWS:
+        raise ValueError(f"Unknown window {name} (expected one of {', '.join(WINDOWS)}).")
+    return _cached_window(name, int(length), tuple(params) or WINDOWS[name][1], bool(sym))
+
+
+@lru_cache(maxsize=WINDOW_CACHE_SIZE)
+def _cached_window(name, length, params, sym):
+    function = WINDOWS[name][0]
+    values = function(length, *params, sym=sym)
+    values.flags.writeable = False
+    return values
+
+
+def hann(length: int, sym=False) -> np.ndarray:
+    """Gets a Hann window. See `get_window` for the parameters."""
+    return get_window("hann", length, sym=sym)
+
+
+def hamming(length: int, sym=False) -> np.ndarray:
+    """Gets a Hamming window. See `get_window` for the parameters."""
+    return get_window("hamming", length, sym=sym)
+
+
+def blackman(length: int, sym=False) -> np.ndarray:
+    """Gets a Blackman window. See `get_window` for the parameters."""
+    return get_window("blackman", length, sym=sym)
+
+
+def kaiser(length: int, beta=14, sym=False) -> np.ndarray:
+    """Gets a Kaiser window with the given shape parameter. See
+    `get_window` for the other parameters."""
+    return get_window("kaiser", length, beta, sym=sym)
+
+
+def tukey(length: int, alpha=0.5, sym=False) -> np.ndarray:
+    """Gets a Tukey window, where `alpha` is the ratio of the window
+    that is tapered. See `get_window` for the other parameters."""
+    return get_window("tukey", length, alpha, sym=sym)
+
+
+def flattop(length: int, sym=False) -> np.ndarray:
+    """Gets a flat-top window. See `get_window` for the parameters."""
+    return get_window("flattop", length, sym=sym)
+
+
+def dpss(length: int, nw=3, sym=False) -> np.ndarray:
+    """Gets the first Slepian (DPSS) window with the given
+    time-halfbandwidth product. See `get_window` for the other
+    parameters."""
+    return get_window("dpss", length, nw, sym=sym)
+
+########################################################################################################################
+# ||||||||||||||||||||||||||||||||||||||||||||||||| Gains |||||||||||||||||||||||||||||||||||||||||||||||||||||||||||| #
+########################################################################################################################
+
+
+def coherent_gain(window: np.ndarray) -> float:
+    """Gets the coherent gain of a window, which is the factor a
+    sinusoid's amplitude is scaled by when windowed.
+
+    Parameters
+    ----------
+    window : np.ndarray
+        Window values.
+
+    Returns
+    -------
+    float
+        Mean of the window.
+    """
+    return float(np.mean(window))
+
+
+def noise_gain(window: np.ndarray) -> float:
+    """Gets the noise (power) gain of a window, which is the factor the
+    power of white noise is scaled by when windowed.
+
+    Parameters
+    ----------
+    window : np.ndarray
+        Window values.
+
+    Returns
+    -------
+    float
+        Mean of the squared window.
+    """
+    return float(np.mean(np.square(window)))
+
+
+def enbw(window: np.ndarray, samp_freq=None) -> float:
+    """Gets the equivalent noise bandwidth of a window, which is the
+    width of the rectangular filter that lets the same noise power
+    through as each bin of the windowed spectrum.
+
+    Parameters
+    ----------
+    window : np.ndarray
+        Window values.
+    samp_freq : float, optional
+        Sampling frequency, by default None, which gives the bandwidth
+        in bins.
+
+    Returns
+    -------
+    float
+        Equivalent noise bandwidth.
+    """
+    bins = noise_gain(window) / coherent_gain(window) ** 2
+    if samp_freq is None:
+        return bins
+    return bins * samp_freq / len(window)